@@ -23,4 +23,5 @@ kubectl create secret docker-registry amuguna \
   --docker-password=$DOCKER_PASSWORD \
   --docker-email=$DOCKER_EMAIL
 kubectl apply -f django_deployment.yaml
-kubectl rollout restart deployment django-deployment
\ No newline at end of file
+kubectl rollout restart deployment django-deployment
+kubectl rollout restart deployment notification-outbox-deployment
\ No newline at end of file
@@ -9,6 +9,12 @@ export DJANGO_SETTINGS_MODULE=config.settings.settings
 # 프로젝트 디렉토리로 이동
 cd src
 
+# 알림 outbox 워커 컨테이너 (SERVICE_ROLE=notification_outbox) - 마이그레이션/정적 파일은 웹 컨테이너에서 처리
+if [ "$SERVICE_ROLE" = "notification_outbox" ]; then
+  echo "Starting notification outbox worker..."
+  exec python manage.py run_notification_outbox
+fi
+
 # 데이터베이스 마이그레이션
 echo "Applying database migrations..."
 python manage.py migrate --no-input
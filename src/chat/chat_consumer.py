@@ -1,8 +1,16 @@
+import time
+
 from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
+from django.core.files.storage import default_storage
 
-from chat.models import Message
+from chat.message_buffer import get_message_buffer
+from chat.models import ChatReadCursor, ChatRoom, Message
+from common.exceptions import BadRequestException
 from common.logging_config import logger
+from common.uploads import confirm_upload
 
 
 class ChatConsumer(AsyncJsonWebsocketConsumer):
@@ -23,11 +31,17 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
                 await self.close(code=4003)  # 클라이언트에 권한 없음 코드 전달
                 return
 
+            # 참여자 확인 - 없는 채팅방이나 참여하지 않은 채팅방에는 연결할 수 없음
+            if not await self.check_participant():
+                logger.info(f"WebSocket connection to room {self.room_id} rejected: not a participant.")
+                await self.close(code=4003)
+                return
+
             # 그룹에 WebSocket 연결 추가
             await self.channel_layer.group_add(self.room_group_name, self.channel_name)
 
-            # WebSocket 연결 수락
-            await self.accept()
+            # WebSocket 연결 수락 (토큰을 subprotocol 로 보낸 경우 해당 subprotocol 선택)
+            await self.accept(self.scope.get("auth_subprotocol"))
 
             # 디버깅 로그
             logger.info(f"WebSocket connected to room: {self.room_group_name} (channel: {self.channel_name})")
@@ -38,34 +52,106 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
 
     async def receive_json(self, content, **kwargs):
         try:
+            # 읽음 처리 이벤트 {"type": "read", "message_id": ...}
+            if content.get("type") == "read":
+                await self.mark_read(content.get("message_id"))
+                return
+
             if not await self.validate_content(content):
                 return
 
+            # 연결 후 채팅방이 삭제되었거나 참여자가 아니게 된 경우 버퍼에 넣기 전에 거부
+            if not await self.check_participant():
+                await self.error(detail="not a participant of this room.")
+                await self.close(code=4003)
+                return
+
             content["sender_id"] = self.scope["user"].id
-            # message save to db
-            await sync_to_async(Message.objects.create)(room_id=self.room_id, sender_id=content["sender_id"], **kwargs)
+            image = await self.resolve_image(content.pop("image_upload_id", None))
+            # 저장은 write-behind 버퍼에 맡기고, 예약된 id 로 바로 브로드캐스트
+            message = await get_message_buffer().add(
+                self.room_id, content["sender_id"], content.get("content", ""), image
+            )
 
+            content["id"] = message.id
             content["type"] = "chat_message"
+            if image:
+                content["image"] = default_storage.url(image)
 
             await self.channel_layer.group_send(self.room_group_name, content)
+        except BadRequestException as e:
+            await self.error(detail=e.detail)
         except Exception as e:
             # 에러 로그 출력 (필요 시 로그 저장 가능)
             logger.error(f"Error in receive_json: {e}")
             # 에러 메시지 클라이언트로 전송 (선택 사항)
             await self.send_json({"error": "Message delivery failed."})
 
+    async def check_participant(self):
+        """
+        scope 의 유저가 채팅방 참여자인지 확인합니다.
+        메시지마다 조회하지 않도록 확인 결과는 CHAT_PARTICIPANT_RECHECK_SECONDS 동안 연결에 보관합니다.
+        """
+        checked_at = getattr(self, "participant_checked_at", None)
+        if checked_at is not None and time.monotonic() - checked_at < getattr(
+            settings, "CHAT_PARTICIPANT_RECHECK_SECONDS", 30
+        ):
+            return True
+        rooms = ChatRoom.objects.for_participant(self.scope["user"]).filter(id=self.room_id)
+        if not await database_sync_to_async(rooms.exists)():
+            self.participant_checked_at = None
+            return False
+        self.participant_checked_at = time.monotonic()
+        return True
+
     async def error(self, detail):
         await self.send_json({"type": "error", "detail": detail})
 
     async def disconnect(self, code):
+        # 연결이 끊기기 전에 보낸 메시지가 저장되도록 버퍼를 비움
+        await get_message_buffer().flush()
         # 그룹에서 제거
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
     async def chat_message(self, content, **kwargs):
         await self.send_json(content)
 
+    async def chat_read(self, content, **kwargs):
+        await self.send_json(content)
+
+    async def mark_read(self, message_id):
+        """
+        읽음 위치를 message_id 까지 옮기고, 채팅방 참여자에게 읽음 이벤트(chat_read)를 전송합니다.
+        이 워커의 버퍼에 있는 메시지를 먼저 저장하여 방금 받은 메시지도 바로 읽음 처리할 수 있도록 합니다.
+        """
+        if not isinstance(message_id, int):
+            await self.error(detail="message_id required.")
+            return
+
+        await get_message_buffer().flush()
+        user = self.scope["user"]
+        try:
+            advanced = await database_sync_to_async(ChatReadCursor.objects.advance)(self.room_id, user, message_id)
+        except Message.DoesNotExist:
+            await self.error(detail="message not found.")
+            return
+        if advanced:
+            await self.channel_layer.group_send(
+                self.room_group_name, {"type": "chat_read", "user_id": user.id, "message_id": message_id}
+            )
+
     async def validate_content(self, content):
-        if not content.get("content"):
+        # 이미지 메시지는 내용 없이 보낼 수 있음
+        if not content.get("content") and not content.get("image_upload_id"):
             await self.error(detail="message required.")
             return False
         return True
+
+    async def resolve_image(self, upload_id):
+        """
+        직접 업로드한 이미지의 upload_id 를 확인하고 저장소 이름을 반환합니다.
+        (저장소 조회는 이벤트 루프를 막지 않도록 별도 스레드에서 실행)
+        """
+        if not upload_id:
+            return ""
+        return await sync_to_async(confirm_upload, thread_sensitive=False)(self.scope["user"], "chat_image", upload_id)
@@ -0,0 +1,197 @@
+# chat/message_buffer.py
+import asyncio
+import atexit
+import weakref
+from collections import deque
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.db import DataError, IntegrityError, connection, transaction
+from django.db.models import Max
+
+from chat.models import Message
+from common.logging_config import logger
+from common.signals.chat_signals import messages_created
+from common.signals.image_signals import schedule_image_variants
+
+# 한 번에 예약할 메시지 id 수 - 예약이 소진될 때만 DB 를 조회함
+MESSAGE_ID_BLOCK_SIZE = 100
+# 저장 실패 시 재시도 횟수 (초과하면 로그를 남기고 버림)
+MAX_FLUSH_ATTEMPTS = 3
+
+_last_reserved_id = 0
+
+
+def reserve_message_ids(count):
+    """
+    저장 전에 브로드캐스트할 메시지 id 를 미리 예약합니다.
+    - PostgreSQL: id 시퀀스에서 count 개를 가져옴 (여러 워커 프로세스가 동시에 예약해도 겹치지 않음)
+    - 그 외(SQLite 등 개발/테스트 환경): 현재 최대 id 와 마지막 예약 id 이후를 사용 (단일 프로세스 전제)
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                [Message._meta.db_table, count],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    global _last_reserved_id
+    # 아직 저장되지 않은 예약 id 와 겹치지 않도록 마지막 예약 id 이후부터 사용
+    start = max(Message.objects.aggregate(max_id=Max("id"))["max_id"] or 0, _last_reserved_id) + 1
+    _last_reserved_id = start + count - 1
+    return list(range(start, start + count))
+
+
+def write_messages(messages):
+    """
+    메시지를 bulk_create 로 저장하고, 알림은 배치 단위로 한 번에 생성합니다.
+    """
+    with transaction.atomic():
+        Message.objects.bulk_create(messages)
+        messages_created(messages)
+        schedule_image_variants(Message, messages)
+
+
+def write_batch(messages):
+    """
+    버퍼의 메시지를 저장하고 저장하지 못한 메시지 목록을 반환합니다.
+    - 한 번의 bulk_create 로 저장하고, 잘못된 행(삭제된 채팅방/유저 등)으로 실패하면
+      채팅방 별로, 그래도 실패하는 채팅방은 메시지 별로 나누어 저장하여 잘못된 메시지만 남김
+    - DB 연결 오류 등 그 외의 예외는 호출한 쪽에서 배치 전체를 재시도
+    """
+    try:
+        write_messages(messages)
+        return []
+    except (IntegrityError, DataError):
+        pass
+
+    rooms = {}
+    for message in messages:
+        rooms.setdefault(message.room_id, []).append(message)
+
+    failed = []
+    for room_id, room_messages in rooms.items():
+        try:
+            write_messages(room_messages)
+            continue
+        except (IntegrityError, DataError):
+            pass
+        for message in room_messages:
+            try:
+                write_messages([message])
+            except (IntegrityError, DataError) as e:
+                logger.error(f"채팅 메시지 저장 실패: room={room_id} id={message.id} ({str(e)})")
+                failed.append(message)
+    return failed
+
+
+class MessageWriteBuffer:
+    """
+    프로세스(이벤트 루프) 별 채팅 메시지 write-behind 버퍼
+    - add(): 예약된 id 를 붙여 즉시 반환 -> consumer 는 저장을 기다리지 않고 브로드캐스트
+    - flush_size 개가 쌓이거나 flush_interval 초가 지나면 백그라운드에서 저장
+    - 연결 종료 시 flush(), 프로세스 종료 시 atexit 에서 남은 메시지를 저장
+    """
+
+    def __init__(self, flush_size, flush_interval):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.reserved_ids = deque()
+        self.attempts = {}
+        self._flush_lock = asyncio.Lock()
+        self._timer = None
+        self._tasks = set()
+
+    async def next_id(self):
+        if not self.reserved_ids:
+            self.reserved_ids.extend(await database_sync_to_async(reserve_message_ids)(MESSAGE_ID_BLOCK_SIZE))
+        return self.reserved_ids.popleft()
+
+    async def add(self, room_id, sender_id, content, image=""):
+        message = Message(id=await self.next_id(), room_id=room_id, sender_id=sender_id, content=content, image=image)
+        self.pending.append(message)
+
+        if len(self.pending) >= self.flush_size:
+            self._spawn_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._spawn_flush)
+        return message
+
+    def _spawn_flush(self):
+        # 브로드캐스트를 막지 않도록 저장은 별도 task 에서 실행 (task 참조를 유지해야 GC 되지 않음)
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._flush_lock:
+            batch, self.pending = self.pending, []
+            if not batch:
+                return
+            try:
+                failed = await database_sync_to_async(write_batch)(batch)
+            except Exception as e:
+                logger.error(f"채팅 메시지 {len(batch)}건 저장 중 오류 발생: {str(e)}")
+                failed = batch
+            failed_ids = {message.id for message in failed}
+            for message in batch:
+                if message.id not in failed_ids:
+                    self.attempts.pop(message.id, None)
+            if failed:
+                self.requeue(failed)
+
+    def requeue(self, batch):
+        retry = []
+        for message in batch:
+            self.attempts[message.id] = self.attempts.get(message.id, 0) + 1
+            if self.attempts[message.id] < MAX_FLUSH_ATTEMPTS:
+                retry.append(message)
+            else:
+                self.attempts.pop(message.id)
+                logger.error(f"채팅 메시지 저장 재시도 초과로 폐기: room={message.room_id} id={message.id}")
+        self.pending = retry + self.pending
+        if self.pending and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._spawn_flush)
+
+    def flush_sync(self):
+        # 이벤트 루프가 종료된 뒤(atexit)에 남은 메시지를 저장
+        batch, self.pending = self.pending, []
+        if batch:
+            for message in write_batch(batch):
+                logger.error(f"종료 시 채팅 메시지 저장 실패로 폐기: room={message.room_id} id={message.id}")
+
+
+_buffers = weakref.WeakKeyDictionary()
+# 루프가 먼저 정리되어도 종료 시 남은 메시지를 저장할 수 있도록 버퍼 참조를 유지
+_registered_buffers = []
+
+
+def get_message_buffer():
+    """
+    현재 이벤트 루프의 버퍼 (ASGI 워커는 루프가 하나이므로 사실상 프로세스 별 버퍼)
+    """
+    loop = asyncio.get_running_loop()
+    buffer = _buffers.get(loop)
+    if buffer is None:
+        buffer = MessageWriteBuffer(
+            flush_size=getattr(settings, "CHAT_MESSAGE_FLUSH_SIZE", 50),
+            flush_interval=getattr(settings, "CHAT_MESSAGE_FLUSH_INTERVAL_MS", 200) / 1000,
+        )
+        _buffers[loop] = buffer
+        _registered_buffers.append(buffer)
+    return buffer
+
+
+@atexit.register
+def flush_message_buffers():
+    for buffer in _registered_buffers:
+        try:
+            buffer.flush_sync()
+        except Exception as e:
+            logger.error(f"종료 시 채팅 메시지 저장 중 오류 발생: {str(e)}")
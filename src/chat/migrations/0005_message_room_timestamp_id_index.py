@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-18 02:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0004_chatroom_request"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(fields=["room", "timestamp", "id"], name="chat_message_room_ts_id_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-18 02:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0005_message_room_timestamp_id_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                condition=models.Q(("is_read", False)), fields=["room", "sender"], name="chat_message_unread_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0006_message_unread_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="message",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,109 @@
+# Generated by Django 5.1.15 on 2026-10-18 03:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Q
+
+BACKFILL_BATCH_SIZE = 2000
+
+
+def at_or_before(message):
+    # (timestamp, id) 순서로 message 와 같거나 앞의 메시지
+    return Q(timestamp__lt=message["timestamp"]) | Q(timestamp=message["timestamp"], id__lte=message["id"])
+
+
+def create_read_cursors(apps, schema_editor):
+    """
+    참여자 별로 상대방이 보낸 첫 번째 안 읽은(is_read=False) 메시지 바로 앞을 읽음 위치로 저장합니다.
+    (안 읽은 메시지가 없으면 마지막 메시지, 첫 메시지부터 안 읽었으면 읽음 위치 없음)
+    """
+    ChatRoom = apps.get_model("chat", "ChatRoom")
+    Message = apps.get_model("chat", "Message")
+    ChatReadCursor = apps.get_model("chat", "ChatReadCursor")
+
+    cursors = []
+    rooms = ChatRoom.objects.values_list("id", "user_id", "expert__user_id").order_by("id")
+    for room_id, *participants in rooms.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        messages = Message.objects.filter(room_id=room_id).values("id", "timestamp")
+        for user_id in set(participants):
+            first_unread = messages.filter(is_read=False).exclude(sender_id=user_id).order_by("timestamp", "id").first()
+            read = messages
+            if first_unread is not None:
+                read = messages.filter(at_or_before(first_unread)).exclude(id=first_unread["id"])
+            last_read = read.order_by("-timestamp", "-id").first()
+            if last_read is not None:
+                cursors.append(
+                    ChatReadCursor(
+                        room_id=room_id,
+                        user_id=user_id,
+                        last_read_message_id=last_read["id"],
+                        last_read_at=last_read["timestamp"],
+                    )
+                )
+        if len(cursors) >= BACKFILL_BATCH_SIZE:
+            ChatReadCursor.objects.bulk_create(cursors)
+            cursors = []
+    ChatReadCursor.objects.bulk_create(cursors)
+
+
+def restore_read_flags(apps, schema_editor):
+    Message = apps.get_model("chat", "Message")
+    ChatReadCursor = apps.get_model("chat", "ChatReadCursor")
+
+    for cursor in ChatReadCursor.objects.values("room_id", "user_id", "last_read_message_id", "last_read_at"):
+        read = {"id": cursor["last_read_message_id"] or 0, "timestamp": cursor["last_read_at"]}
+        Message.objects.filter(at_or_before(read), room_id=cursor["room_id"]).exclude(
+            sender_id=cursor["user_id"]
+        ).update(is_read=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0007_message_image_variants"),
+        ("expert", "0004_alter_expert_user"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChatReadCursor",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("last_read_at", models.DateTimeField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="chatreadcursor",
+            name="last_read_message",
+            field=models.ForeignKey(
+                null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to="chat.message"
+            ),
+        ),
+        migrations.AddField(
+            model_name="chatreadcursor",
+            name="room",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, related_name="read_cursors", to="chat.chatroom"
+            ),
+        ),
+        migrations.AddField(
+            model_name="chatreadcursor",
+            name="user",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name="chatreadcursor",
+            constraint=models.UniqueConstraint(fields=("room", "user"), name="chat_read_cursor_room_user_uniq"),
+        ),
+        migrations.RunPython(create_read_cursors, restore_read_flags),
+        migrations.RemoveIndex(
+            model_name="message",
+            name="chat_message_unread_idx",
+        ),
+        migrations.RemoveField(
+            model_name="message",
+            name="is_read",
+        ),
+    ]
@@ -1,10 +1,78 @@
 from django.db import models
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    FilteredRelation,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 
 from estimations.models import EstimationsRequest
 from expert.models import Expert
 from users.models import User
 
 
+def count_messages(messages):
+    # 채팅방 별 메시지 수 서브쿼리
+    return messages.order_by().values("room").annotate(count=Count("id")).values("count")
+
+
+class ChatRoomQuerySet(models.QuerySet):
+    def for_participant(self, user):
+        """
+        user 가 게스트(user_id) 또는 전문가(expert.user_id)로 참여한 채팅방
+        - OR 조건 대신 각각 인덱스를 타는 두 조회를 UNION 으로 합쳐 id 목록을 구합니다.
+        """
+        guest_rooms = ChatRoom.objects.filter(user=user).values("id")
+        expert_rooms = ChatRoom.objects.filter(expert__in=Expert.objects.filter(user=user).values("id")).values("id")
+        return self.filter(id__in=guest_rooms.union(expert_rooms))
+
+    def with_last_message(self, user):
+        """
+        마지막 메시지 내용/시각과 user 기준 안 읽은 메시지 수를 상관 서브쿼리로 annotate
+        - 채팅방 수와 관계없이 하나의 쿼리로 조회됩니다.
+        - 안 읽은 메시지 = user 의 읽음 위치(ChatReadCursor) 이후에 상대방이 보낸 메시지
+          ((room, timestamp, id) 인덱스의 범위 count, 읽음 위치가 없으면 상대방이 보낸 전체 메시지)
+        """
+        messages = Message.objects.filter(room=OuterRef("pk"))
+        last_message = messages.order_by("-timestamp", "-id")
+        received = messages.exclude(sender=user)
+        after_cursor = received.filter(
+            Q(timestamp__gt=OuterRef("read_at")) | Q(timestamp=OuterRef("read_at"), id__gt=OuterRef("read_message_id"))
+        )
+        return self.annotate(
+            read_cursor=FilteredRelation("read_cursors", condition=Q(read_cursors__user=user)),
+            read_at=F("read_cursor__last_read_at"),
+            read_message_id=F("read_cursor__last_read_message_id"),
+            last_message=Subquery(last_message.values("content")[:1]),
+            last_message_at=Subquery(last_message.values("timestamp")[:1]),
+            unread_count=Coalesce(
+                Case(
+                    When(read_at__isnull=True, then=Subquery(count_messages(received))),
+                    default=Subquery(count_messages(after_cursor)),
+                ),
+                Value(0),
+            ),
+        )
+
+    def inbox(self, user):
+        """
+        채팅방 목록(inbox) - 최근 메시지 순 정렬, 메시지가 없는 방은 마지막
+        """
+        return (
+            self.for_participant(user)
+            .select_related("user", "expert__user", "request")
+            .with_last_message(user)
+            .order_by(models.F("last_message_at").desc(nulls_last=True), "-id")
+        )
+
+
 class ChatRoom(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     expert = models.ForeignKey(Expert, on_delete=models.CASCADE)
@@ -12,11 +80,63 @@ class ChatRoom(models.Model):
     user_exist = models.BooleanField(default=True)
     expert_exist = models.BooleanField(default=True)
 
+    objects = ChatRoomQuerySet.as_manager()
+
 
 class Message(models.Model):
     room = models.ForeignKey(ChatRoom, on_delete=models.CASCADE)
     sender = models.ForeignKey(User, on_delete=models.CASCADE)
     content = models.TextField()
     image = models.ImageField(upload_to="images/chat/", null=True, blank=True)
-    is_read = models.BooleanField(default=False)
+    # 리사이즈/WebP 변형 이미지 정보 (common.images)
+    image_variants = models.JSONField(default=dict, blank=True)
     timestamp = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # 채팅방 메시지 keyset 페이지네이션, 읽음 위치 이후 메시지 수 조회용 (room_id, timestamp, id) 복합 인덱스
+            models.Index(fields=["room", "timestamp", "id"], name="chat_message_room_ts_id_idx"),
+        ]
+
+
+class ChatReadCursorQuerySet(models.QuerySet):
+    def advance(self, room_id, user, message_id):
+        """
+        user 의 채팅방 읽음 위치를 message_id 메시지까지 옮깁니다. (메시지 행은 수정하지 않음)
+        - 메시지 순서는 목록과 같은 (timestamp, id) 기준 (메시지 id 는 워커 별로 미리 예약되므로 id 만으로는 순서가 맞지 않음)
+        - 이미 더 뒤의 메시지까지 읽었으면 그대로 둠
+        반환: 읽음 위치가 바뀌었는지 여부
+        (아직 저장되지 않았거나 user 가 참여한 채팅방의 메시지가 아니면 Message.DoesNotExist)
+        """
+        message = Message.objects.filter(
+            room__in=ChatRoom.objects.for_participant(user), room_id=room_id, id=message_id
+        )
+        timestamp = message.values_list("timestamp", flat=True).first()
+        if timestamp is None:
+            raise Message.DoesNotExist
+        behind = Q(last_read_at__lt=timestamp) | Q(last_read_at=timestamp, last_read_message_id__lt=message_id)
+        if self.filter(behind, room_id=room_id, user=user).update(
+            last_read_message_id=message_id, last_read_at=timestamp
+        ):
+            return True
+        _, created = self.get_or_create(
+            room_id=room_id, user=user, defaults={"last_read_message_id": message_id, "last_read_at": timestamp}
+        )
+        return created
+
+
+class ChatReadCursor(models.Model):
+    """
+    채팅방 참여자 별 읽음 위치 - 마지막으로 읽은 메시지 (이후 상대방이 보낸 메시지가 안 읽은 메시지)
+    """
+
+    room = models.ForeignKey(ChatRoom, on_delete=models.CASCADE, related_name="read_cursors")
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    last_read_message = models.ForeignKey(Message, on_delete=models.SET_NULL, null=True, related_name="+")
+    # 마지막으로 읽은 메시지의 timestamp (메시지 순서 비교용)
+    last_read_at = models.DateTimeField()
+
+    objects = ChatReadCursorQuerySet.as_manager()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["room", "user"], name="chat_read_cursor_room_user_uniq")]
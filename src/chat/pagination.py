@@ -0,0 +1,11 @@
+from common.pagination import KeysetPagination
+
+
+class MessageCursorPagination(KeysetPagination):
+    """
+    채팅 메시지 목록 페이지네이션 - (timestamp, id) 기준
+    """
+
+    ordering_field = "timestamp"
+    page_size = 50
+    max_page_size = 100
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
-from chat.models import ChatRoom, Message
+from chat.models import ChatReadCursor, ChatRoom, Message
+from common.images import ImageVariantsField
 from estimations.serializers.guest_seriailzers import EstimationsRequestSerializer
 from reservations.seriailzers import ExpertInfoSerializer
 from users.serializers.user_serializers import UserSerializer
@@ -20,6 +21,24 @@ class ChatRoomSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "user", "expert", "request", "expert_exist", "user_exist"]
 
 
+class ChatRoomListSerializer(ChatRoomSerializer):
+    """
+    채팅방 목록(inbox) 용 - ChatRoom.objects.inbox() 의 annotate 값을 함께 반환
+    """
+
+    last_message = serializers.CharField(read_only=True, allow_null=True)
+    last_message_at = serializers.DateTimeField(read_only=True, allow_null=True)
+    unread_count = serializers.IntegerField(read_only=True)
+
+    class Meta(ChatRoomSerializer.Meta):
+        fields = ChatRoomSerializer.Meta.fields + ["last_message", "last_message_at", "unread_count"]
+        read_only_fields = ChatRoomSerializer.Meta.read_only_fields + [
+            "last_message",
+            "last_message_at",
+            "unread_count",
+        ]
+
+
 class ChatroomUpdateSerializer(serializers.ModelSerializer):
     user_exist = serializers.BooleanField(required=False)
     expert_exist = serializers.BooleanField(required=False)
@@ -31,6 +50,8 @@ class ChatroomUpdateSerializer(serializers.ModelSerializer):
 
 
 class MessageSerializer(serializers.ModelSerializer):
+    image_variants = ImageVariantsField(image_field="image")
+
     class Meta:
         model = Message
         fields = "__all__"
@@ -39,3 +60,16 @@ class MessageSerializer(serializers.ModelSerializer):
         if "content" not in data or not data["content"].strip():
             raise serializers.ValidationError("메시지 내용은 필수입니다.")
         return data
+
+
+class ChatReadCursorSerializer(serializers.ModelSerializer):
+    """
+    채팅방 읽음 위치 - message_id 메시지까지 읽음 처리
+    """
+
+    message_id = serializers.IntegerField(write_only=True)
+
+    class Meta:
+        model = ChatReadCursor
+        fields = ["room", "message_id", "last_read_message", "last_read_at"]
+        read_only_fields = ["room", "last_read_message", "last_read_at"]
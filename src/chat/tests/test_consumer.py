@@ -1,17 +1,24 @@
 import asyncio
+import io
 
+import requests
 from channels.db import database_sync_to_async
 from channels.layers import get_channel_layer
 from channels.routing import URLRouter
 from channels.testing import WebsocketCommunicator
 from django.contrib.auth import get_user_model
-from django.test import TransactionTestCase
+from django.test import TransactionTestCase, override_settings
 from django.urls import path
+from PIL import Image
 
 from chat.chat_consumer import ChatConsumer
-from chat.models import ChatRoom, Message
+from chat.message_buffer import MAX_FLUSH_ATTEMPTS, MessageWriteBuffer
+from chat.models import ChatReadCursor, ChatRoom, Message
+from common.s3_stub import stub_s3
+from common.uploads import create_upload
 from estimations.models import EstimationsRequest
 from expert.models import Expert
+from notifications.models import Notification
 
 User = get_user_model()
 
@@ -117,3 +124,150 @@ class ChatConsumerTransactionTest(TransactionTestCase):
         # Finally: WebSocket 연결 종료
         await user_communicator.disconnect()
         await expert_communicator.disconnect()
+
+        # Then: 연결 종료 시 버퍼가 비워져 브로드캐스트된 id 로 메시지가 저장되고 전문가에게 알림 생성
+        message = await database_sync_to_async(Message.objects.get)(id=user_response["id"])
+        self.assertEqual(message.content, message_content)
+        self.assertEqual(message.sender_id, user.id)
+        self.assertTrue(
+            await database_sync_to_async(
+                Notification.objects.filter(receiver=expert, notification_type="message").exists
+            )()
+        )
+
+    @override_settings(CHAT_MESSAGE_FLUSH_SIZE=3, CHAT_MESSAGE_FLUSH_INTERVAL_MS=60 * 1000)
+    async def test_messages_flushed_in_batches(self):
+        # Given: 배치 크기 3, 시간 기준 flush 는 발생하지 않도록 설정
+        user = await self.get_user("testuser@example.com")
+        communicator = WebsocketCommunicator(self.application, f"/ws/chat/{self.chatroom.id}/")
+        communicator.scope["user"] = user
+        connected, _ = await communicator.connect()
+        assert connected
+
+        # When: 2개 전송 -> 아직 저장되지 않음, 3번째 전송 -> 한 번에 저장
+        for index in range(2):
+            await communicator.send_json_to({"content": f"message {index}"})
+            await communicator.receive_json_from(timeout=5)
+        count_before_batch = await database_sync_to_async(Message.objects.count)()
+
+        await communicator.send_json_to({"content": "message 2"})
+        await communicator.receive_json_from(timeout=5)
+        for _ in range(50):
+            if await database_sync_to_async(Message.objects.count)() == 3:
+                break
+            await asyncio.sleep(0.05)
+
+        # Then: 배치 크기에 도달했을 때만 저장되고, 알림도 메시지 수만큼 생성
+        self.assertEqual(count_before_batch, 0)
+        self.assertEqual(
+            await database_sync_to_async(list)(Message.objects.order_by("id").values_list("content", flat=True)),
+            ["message 0", "message 1", "message 2"],
+        )
+        self.assertEqual(
+            await database_sync_to_async(Notification.objects.filter(notification_type="message").count)(), 3
+        )
+
+        await communicator.disconnect()
+
+    @override_settings(IMAGE_VARIANTS_ON_UPLOAD=False)
+    async def test_image_message_from_direct_upload(self):
+        # Given: 저장소에 직접 업로드한 채팅 이미지
+        user = await self.get_user("testuser@example.com")
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 32), "red").save(buffer, "PNG")
+        body = buffer.getvalue()
+
+        with stub_s3() as s3, override_settings(STORAGES=s3.storages):
+            upload = create_upload(user, "chat_image", "image/png", len(body))
+            await database_sync_to_async(requests.put, thread_sensitive=False)(
+                upload["upload_url"], data=body, headers=upload["headers"], timeout=5
+            )
+
+            communicator = WebsocketCommunicator(self.application, f"/ws/chat/{self.chatroom.id}/")
+            communicator.scope["user"] = user
+            connected, _ = await communicator.connect()
+            assert connected
+
+            # When: 파일 대신 upload_id 로 이미지 메시지 전송
+            await communicator.send_json_to({"image_upload_id": upload["upload_id"]})
+            response = await communicator.receive_json_from(timeout=5)
+            await communicator.disconnect()
+
+        # Then: 이미지 URL 이 브로드캐스트되고, 업로드한 객체 키로 메시지가 저장됨
+        self.assertNotIn("image_upload_id", response)
+        self.assertTrue(response["image"].endswith(upload["name"]))
+        message = await database_sync_to_async(Message.objects.get)(id=response["id"])
+        self.assertEqual(message.image.name, upload["name"])
+
+    @override_settings(CHAT_MESSAGE_FLUSH_INTERVAL_MS=60 * 1000)
+    async def test_read_event_advances_cursor(self):
+        # Given: 게스트와 전문가가 연결되고, 게스트가 보낸 메시지가 아직 버퍼에 있음
+        user = await self.get_user("testuser@example.com")
+        expert = await self.get_user("expertuser@example.com")
+        user_communicator = WebsocketCommunicator(self.application, f"/ws/chat/{self.chatroom.id}/")
+        expert_communicator = WebsocketCommunicator(self.application, f"/ws/chat/{self.chatroom.id}/")
+        user_communicator.scope["user"] = user
+        expert_communicator.scope["user"] = expert
+        for communicator in (user_communicator, expert_communicator):
+            connected, _ = await communicator.connect()
+            assert connected
+
+        await user_communicator.send_json_to({"content": "읽어주세요"})
+        message = await user_communicator.receive_json_from(timeout=5)
+        await expert_communicator.receive_json_from(timeout=5)
+
+        # When: 전문가가 받은 메시지 id 로 읽음 이벤트 전송
+        await expert_communicator.send_json_to({"type": "read", "message_id": message["id"]})
+
+        # Then: 참여자 모두에게 읽음 이벤트가 전송되고 전문가의 읽음 위치가 저장됨
+        for communicator in (user_communicator, expert_communicator):
+            response = await communicator.receive_json_from(timeout=5)
+            self.assertEqual(response, {"type": "chat_read", "user_id": expert.id, "message_id": message["id"]})
+        cursor = await database_sync_to_async(ChatReadCursor.objects.get)(room=self.chatroom, user=expert)
+        self.assertEqual(cursor.last_read_message_id, message["id"])
+
+        # When: 존재하지 않는 메시지 -> 오류 응답
+        await expert_communicator.send_json_to({"type": "read", "message_id": message["id"] + 1000})
+        response = await expert_communicator.receive_json_from(timeout=5)
+        self.assertEqual(response["type"], "error")
+
+        await user_communicator.disconnect()
+        await expert_communicator.disconnect()
+
+    async def test_non_participant_cannot_connect(self):
+        # Given: 채팅방에 참여하지 않은 유저
+        outsider = await database_sync_to_async(User.objects.create_user)(
+            email="outsider@example.com", name="외부인", phone_number="01000000000", gender="male"
+        )
+
+        # When: 다른 사람의 채팅방, 존재하지 않는 채팅방에 연결 시도
+        for room_id, user in ((self.chatroom.id, outsider), (999999, await self.get_user("testuser@example.com"))):
+            communicator = WebsocketCommunicator(self.application, f"/ws/chat/{room_id}/")
+            communicator.scope["user"] = user
+            connected, code = await communicator.connect()
+
+            # Then: 권한 없음(4003)으로 연결 거부
+            self.assertFalse(connected)
+            self.assertEqual(code, 4003)
+
+    async def test_invalid_row_does_not_drop_other_messages(self):
+        # Given: 정상 메시지와 존재하지 않는 채팅방의 메시지가 같은 배치에 있음
+        user = await self.get_user("testuser@example.com")
+        buffer = MessageWriteBuffer(flush_size=100, flush_interval=60)
+        valid = await buffer.add(self.chatroom.id, user.id, "정상 메시지")
+        invalid = await buffer.add(999999, user.id, "잘못된 메시지")
+
+        # When: 저장
+        await buffer.flush()
+
+        # Then: 정상 메시지는 저장되고 잘못된 메시지만 재시도 대기
+        self.assertTrue(await database_sync_to_async(Message.objects.filter(id=valid.id).exists)())
+        self.assertEqual([message.id for message in buffer.pending], [invalid.id])
+
+        # When: 재시도 횟수 초과
+        for _ in range(MAX_FLUSH_ATTEMPTS - 1):
+            await buffer.flush()
+
+        # Then: 잘못된 메시지만 폐기됨
+        self.assertEqual(buffer.pending, [])
+        self.assertEqual(await database_sync_to_async(Message.objects.count)(), 1)
@@ -4,7 +4,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from chat.models import ChatRoom, Message
+from chat.models import ChatReadCursor, ChatRoom, Message
 from estimations.models import EstimationsRequest
 from expert.models import Expert
 
@@ -87,8 +87,8 @@ class ChatAPITestCase(TestCase):
 
         # Then: 응답 상태와 데이터 확인
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.chatroom.id)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], self.chatroom.id)
 
     def test_create_chatroom(self):
         # When: 새로운 채팅방 생성
@@ -142,5 +142,143 @@ class ChatAPITestCase(TestCase):
 
         # Then: 메시지 목록 확인
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["content"], self.message.content)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["content"], self.message.content)
+        self.assertIsNone(response.data["previous"])
+        self.assertIsNone(response.data["next"])
+
+    def test_list_messages_with_cursor(self):
+        # Given: 채팅방에 메시지 5개 (setUp 메시지 포함)
+        for index in range(4):
+            Message.objects.create(room=self.chatroom, sender=self.user, content=f"메시지 {index}")
+        url = reverse("message-list-create", kwargs={"room_id": self.chatroom.id})
+
+        # When: 최신 메시지 2개 조회
+        response = self.client.get(url, {"page_size": 2})
+
+        # Then: 최신 2개가 오래된 순으로 반환되고 이전 페이지 링크가 존재
+        self.assertEqual([message["content"] for message in response.data["results"]], ["메시지 2", "메시지 3"])
+        self.assertIsNone(response.data["next"])
+
+        # When: 이전 메시지 더 불러오기
+        response = self.client.get(response.data["previous"])
+
+        # Then: 그 이전 2개가 반환됨
+        self.assertEqual([message["content"] for message in response.data["results"]], ["메시지 0", "메시지 1"])
+
+        # When: 이후 메시지 불러오기
+        response = self.client.get(response.data["next"])
+
+        # Then: 처음 조회한 최신 2개가 다시 반환됨
+        self.assertEqual([message["content"] for message in response.data["results"]], ["메시지 2", "메시지 3"])
+        self.assertIsNone(response.data["next"])
+
+    def test_list_messages_with_invalid_cursor(self):
+        # When: 잘못된 cursor 로 조회
+        url = reverse("message-list-create", kwargs={"room_id": self.chatroom.id})
+        response = self.client.get(url, {"before": "invalid"})
+
+        # Then: 잘못된 요청 응답
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_chatrooms_inbox_annotations(self):
+        # Given: 전문가가 보낸 읽지 않은 메시지 2개
+        Message.objects.create(room=self.chatroom, sender=self.expert_user, content="첫 번째 답장")
+        Message.objects.create(room=self.chatroom, sender=self.expert_user, content="두 번째 답장")
+
+        # When: 게스트가 채팅방 목록 조회
+        response = self.client.get(reverse("chatroom-list-create"))
+
+        # Then: 마지막 메시지와 본인이 받은 안 읽은 메시지 수가 포함됨
+        room = response.data["results"][0]
+        self.assertEqual(room["last_message"], "두 번째 답장")
+        self.assertIsNotNone(room["last_message_at"])
+        self.assertEqual(room["unread_count"], 2)
+
+    def test_list_chatrooms_as_expert(self):
+        # Given: 전문가로 로그인
+        self.client.force_authenticate(user=self.expert_user)
+
+        # When: 채팅방 목록 조회
+        response = self.client.get(reverse("chatroom-list-create"))
+
+        # Then: 전문가로 참여한 채팅방과 게스트가 보낸 안 읽은 메시지 수가 조회됨
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], self.chatroom.id)
+        self.assertEqual(response.data["results"][0]["unread_count"], 1)
+
+    def test_list_chatrooms_with_status_filter(self):
+        # When: 상태 별 채팅방 조회
+        pending = self.client.get(reverse("chatroom-list-create"), {"status": "pending"})
+        completed = self.client.get(reverse("chatroom-list-create"), {"status": "completed"})
+        invalid = self.client.get(reverse("chatroom-list-create"), {"status": "unknown"})
+
+        # Then: 견적 요청 상태로 필터링됨
+        self.assertEqual(pending.data["count"], 1)
+        self.assertEqual(completed.data["count"], 0)
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_chatrooms_query_count_is_constant(self):
+        # Given: 채팅방 여러 개
+        for index in range(5):
+            estimation_request = EstimationsRequest.objects.create(
+                user=self.user,
+                service_list="mc",
+                prefer_gender="male",
+                status="pending",
+                location="Seoul",
+                wedding_datetime="2024-12-12",
+            )
+            room = ChatRoom.objects.create(user=self.user, expert=self.expert, request=estimation_request)
+            Message.objects.create(room=room, sender=self.expert_user, content=f"메시지 {index}")
+
+        # When / Then: 채팅방 수와 관계없이 count + 목록 2개 쿼리
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("chatroom-list-create"))
+        self.assertEqual(response.data["count"], 6)
+        self.assertEqual(response.data["results"][0]["last_message"], "메시지 4")
+
+    def test_read_cursor_updates_unread_count(self):
+        # Given: 전문가가 보낸 메시지 2개
+        first = Message.objects.create(room=self.chatroom, sender=self.expert_user, content="첫 번째 답장")
+        second = Message.objects.create(room=self.chatroom, sender=self.expert_user, content="두 번째 답장")
+        url = reverse("chatroom-read", kwargs={"room_id": self.chatroom.id})
+
+        # When: 첫 번째 메시지까지 읽음 처리
+        response = self.client.post(url, {"message_id": first.id})
+
+        # Then: 읽음 위치가 저장되고, 이후 메시지만 안 읽은 메시지로 집계됨
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["last_read_message"], first.id)
+        self.assertEqual(self.client.get(reverse("chatroom-list-create")).data["results"][0]["unread_count"], 1)
+
+        # When: 마지막 메시지까지 읽은 후 이전 메시지로 다시 요청
+        self.client.post(url, {"message_id": second.id})
+        response = self.client.post(url, {"message_id": self.message.id})
+
+        # Then: 읽음 위치는 뒤로 돌아가지 않음
+        self.assertEqual(response.data["last_read_message"], second.id)
+        self.assertEqual(self.client.get(reverse("chatroom-list-create")).data["results"][0]["unread_count"], 0)
+
+        # When: 새 메시지 도착
+        Message.objects.create(room=self.chatroom, sender=self.expert_user, content="세 번째 답장")
+
+        # Then: 읽음 위치 이후의 메시지만 다시 집계됨
+        self.assertEqual(self.client.get(reverse("chatroom-list-create")).data["results"][0]["unread_count"], 1)
+        self.assertEqual(ChatReadCursor.objects.count(), 1)
+
+    def test_read_cursor_rejects_message_outside_participating_room(self):
+        # Given: 참여하지 않은 유저
+        other = User.objects.create_user(
+            email="other@example.com", name="다른 유저", phone_number="01000000000", gender="male"
+        )
+        self.client.force_authenticate(user=other)
+
+        # When: 다른 사람의 채팅방 메시지를 읽음 처리
+        response = self.client.post(
+            reverse("chatroom-read", kwargs={"room_id": self.chatroom.id}), {"message_id": self.message.id}
+        )
+
+        # Then: 거부되고 읽음 위치가 생기지 않음
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ChatReadCursor.objects.exists())
@@ -3,6 +3,7 @@ from django.urls import path
 from chat.views.chat_views import (
     ChatRoomDetailAPIView,
     ChatRoomListCreateAPIView,
+    ChatRoomReadAPIView,
     ChatRoomUpdateAPIView,
     MessageListCreateAPIView,
 )
@@ -14,6 +15,8 @@ urlpatterns = [
     path("chatrooms/<int:room_id>/", ChatRoomDetailAPIView.as_view(), name="chatroom-detail"),
     # 채팅방 나가기 - 상대방이 존재할 때 업데이트
     path("chatrooms/<int:room_id>/leave/", ChatRoomUpdateAPIView.as_view(), name="chatroom-update"),
+    # 채팅방 읽음 처리 - 참여자의 읽음 위치 이동
+    path("chatrooms/<int:room_id>/read/", ChatRoomReadAPIView.as_view(), name="chatroom-read"),
     # 메시지 목록 조회 및 생성
     path("chatrooms/<int:room_id>/messages/", MessageListCreateAPIView.as_view(), name="message-list-create"),
 ]
@@ -1,11 +1,13 @@
-from django.db.models import Q
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, mixins, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from chat.models import ChatRoom, Message
+from chat.models import ChatReadCursor, ChatRoom, Message
+from chat.pagination import MessageCursorPagination
 from chat.serializers.chat_serializers import (
+    ChatReadCursorSerializer,
+    ChatRoomListSerializer,
     ChatRoomSerializer,
     ChatroomUpdateSerializer,
     MessageSerializer,
@@ -21,28 +23,28 @@ class ChatRoomListCreateAPIView(generics.ListCreateAPIView):
 
     permission_classes = [IsAuthenticated]
     serializer_class = ChatRoomSerializer
+    # 인증 유저 조회 + 페이지 count + 목록
+    query_budget = {"GET": 3}
 
     def get_queryset(self):
         status_filter = self.request.query_params.get("status")
         valid_statuses = ["pending", "completed", "canceled"]
-        user = self.request.user
+        chatrooms = ChatRoom.objects.inbox(self.request.user)
 
         if status_filter:
-            if status_filter in valid_statuses:
-                chatrooms = ChatRoom.objects.filter(
-                    Q(request__user=user) | Q(expert__user=user),
-                    reqeust__status__in=status_filter,
-                )
-                return chatrooms
-
-            else:
+            if status_filter not in valid_statuses:
                 raise BadRequestException(
                     "쿼리 파라미터의 값이 유효하지 않습니다. choice in ['pending', 'completed', 'canceled']"
                 )
+            chatrooms = chatrooms.filter(request__status=status_filter)
 
-        chatrooms = ChatRoom.objects.filter(Q(request__user=user) | Q(expert__user=user))
         return chatrooms
 
+    def get_serializer_class(self):
+        if self.request.method == "GET":
+            return ChatRoomListSerializer
+        return ChatRoomSerializer
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
@@ -52,7 +54,8 @@ class ChatRoomDetailAPIView(generics.RetrieveDestroyAPIView):
     serializer_class = ChatRoomSerializer
     lookup_field = "id"
     lookup_url_kwarg = "room_id"
-    queryset = ChatRoom.objects.all()
+    queryset = ChatRoom.objects.select_related("user", "expert__user", "request")
+    query_budget = {"GET": 2}
 
     @extend_schema(tags=["Chat"])
     def delete(self, request, *args, **kwargs):
@@ -95,11 +98,35 @@ class ChatRoomUpdateAPIView(generics.GenericAPIView, mixins.UpdateModelMixin):
 class MessageListCreateAPIView(generics.ListAPIView):
     """
     메시지 목록 조회 및 생성 API
+    - before=<cursor>: 이전 메시지 더 불러오기, after=<cursor>: 이후 메시지 불러오기
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = MessageSerializer
+    pagination_class = MessageCursorPagination
 
     def get_queryset(self):
         room_id = self.kwargs.get("room_id")
         return Message.objects.filter(room_id=room_id)
+
+
+@extend_schema(tags=["Chat"])
+class ChatRoomReadAPIView(generics.GenericAPIView):
+    """
+    채팅방 읽음 처리 API - 메시지 행을 수정하지 않고 참여자의 읽음 위치만 옮김
+    (WebSocket 에서는 {"type": "read", "message_id": ...} 이벤트로 같은 처리)
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = ChatReadCursorSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        room_id = self.kwargs.get("room_id")
+        try:
+            ChatReadCursor.objects.advance(room_id, request.user, serializer.validated_data["message_id"])
+        except Message.DoesNotExist:
+            raise BadRequestException("채팅방의 메시지가 아닙니다.")
+        cursor = ChatReadCursor.objects.get(room_id=room_id, user=request.user)
+        return Response(self.get_serializer(cursor).data, status=status.HTTP_200_OK)
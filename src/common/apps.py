@@ -6,8 +6,13 @@ class CommonConfig(AppConfig):
     name = "common"
 
     def ready(self):
+        import common.signals.auth_cache_signals
+        import common.signals.cache_signals
         import common.signals.chat_signals
+        import common.signals.choice_index_signals
         import common.signals.estimation_signals
+        import common.signals.expert_signals
+        import common.signals.image_signals
         import common.signals.notification_signals
         import common.signals.request_signals
         import common.signals.reservation_signals
@@ -0,0 +1,59 @@
+# common/choice_index.py
+from collections import defaultdict
+
+
+def split_choices(value):
+    """
+    MultiSelectField 값(list 또는 "a,b" 문자열)을 선택지 목록으로 변환
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return list(value)
+
+
+def sync_choice_index(index_model, owner_field, value_field, owners, source_attr):
+    """
+    owners 의 MultiSelectField(source_attr) 값을 정규화된 index 테이블에 동기화합니다.
+    - 값이 바뀐 owner 의 행만 삭제 후 다시 생성 (조회 1 + 삭제 1 + 생성 1 쿼리)
+    - bulk_create 처럼 post_save 가 발생하지 않는 경로에서도 직접 호출합니다.
+    """
+    wanted = {owner.pk: set(split_choices(getattr(owner, source_attr))) for owner in owners}
+    if not wanted:
+        return
+
+    owner_id_field = f"{owner_field}_id"
+    existing = defaultdict(set)
+    rows = index_model.objects.filter(**{f"{owner_id_field}__in": wanted}).values_list(owner_id_field, value_field)
+    for owner_id, value in rows:
+        existing[owner_id].add(value)
+
+    changed = [owner_id for owner_id, values in wanted.items() if values != existing[owner_id]]
+    if not changed:
+        return
+    index_model.objects.filter(**{f"{owner_id_field}__in": changed}).delete()
+    index_model.objects.bulk_create(
+        [
+            index_model(**{owner_id_field: owner_id, value_field: value})
+            for owner_id in changed
+            for value in sorted(wanted[owner_id])
+        ],
+        batch_size=1000,
+    )
+
+
+def backfill_choice_index(index_model, owner_model, owner_field, value_field, source_attr, batch_size=2000):
+    """
+    데이터 마이그레이션용 - 기존 MultiSelectField 문자열 값으로 index 테이블을 채웁니다.
+    """
+    owner_id_field = f"{owner_field}_id"
+    rows = []
+    values = owner_model.objects.exclude(**{source_attr: ""}).exclude(**{f"{source_attr}__isnull": True})
+    for owner_id, value in values.values_list("pk", source_attr).iterator(chunk_size=batch_size):
+        rows.extend(index_model(**{owner_id_field: owner_id, value_field: item}) for item in set(split_choices(value)))
+        if len(rows) >= batch_size:
+            index_model.objects.bulk_create(rows, ignore_conflicts=True)
+            rows = []
+    if rows:
+        index_model.objects.bulk_create(rows, ignore_conflicts=True)
@@ -0,0 +1,76 @@
+# common/db_router.py
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+class RoutingState:
+    """
+    요청 하나의 DB 라우팅 상태 (ReplicaRoutingMiddleware 가 요청마다 만듦)
+    - use_replica: 안전한 메서드(GET/HEAD/OPTIONS)이고 최근 쓰기가 없는 클라이언트의 요청
+    - wrote: 이 요청에서 쓰기가 있었음 -> 이후 조회는 모두 primary (read-your-writes)
+    """
+
+    def __init__(self, use_replica=False):
+        self.use_replica = use_replica
+        self.wrote = False
+
+
+# 요청 밖(채팅 consumer, 관리 명령, 셸)에서는 상태가 없으므로 모두 primary 로 보냄
+_routing_state = ContextVar("db_routing_state", default=None)
+
+
+def replica_alias():
+    alias = getattr(settings, "DATABASE_REPLICA_ALIAS", "replica")
+    return alias if alias in settings.DATABASES else None
+
+
+def start_routing(use_replica):
+    return _routing_state.set(RoutingState(use_replica))
+
+
+def end_routing(token):
+    state = _routing_state.get()
+    _routing_state.reset(token)
+    return state
+
+
+def pin_to_primary():
+    """
+    현재 요청의 남은 조회를 primary 로 고정합니다.
+    (예: 응답 캐시를 채우는 조회 - 복제 지연으로 오래된 데이터가 캐시에 남지 않도록)
+    """
+    state = _routing_state.get()
+    if state is not None:
+        state.use_replica = False
+
+
+class PrimaryReplicaRouter:
+    """
+    읽기 전용 복제본(DATABASE_REPLICA_ALIAS)이 설정되어 있으면 안전한 요청의 조회를 복제본으로 보냅니다.
+    - 쓰기, select_for_update, get_or_create 등 쓰기용 조회는 항상 primary
+    - 요청 중 쓰기가 한 번이라도 있으면 같은 요청의 이후 조회는 primary
+    - 쓰기 요청 직후 같은 클라이언트의 조회는 DATABASE_REPLICA_STICKY_SECONDS 동안 primary (ReplicaRoutingMiddleware)
+    - 마이그레이션은 primary(default)에만 실행하며 복제본에는 복제로 반영됨
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = replica_alias()
+        state = _routing_state.get()
+        if alias is None or state is None or not state.use_replica or state.wrote:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # primary 와 복제본은 같은 데이터이므로 어느 쪽에서 읽은 객체끼리도 관계를 맺을 수 있음
+        aliases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
@@ -0,0 +1,167 @@
+# common/images.py
+import io
+import posixpath
+
+from django.core.files.base import ContentFile
+from django.db.models.signals import post_save
+from drf_spectacular.utils import extend_schema_field
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+from common.logging_config import logger
+
+# 크기 버킷 - 긴 변 기준 최대 px (원본보다 크게 늘리지 않음)
+IMAGE_VARIANT_SIZES = {"thumb": 160, "small": 480, "medium": 1080}
+WEBP_QUALITY = 80
+# 변형 이미지는 원본과 같은 경로 아래 variants/ 에 저장
+VARIANTS_DIRECTORY = "variants"
+
+
+def variants_field_name(image_field):
+    # 변형 이미지 정보를 저장하는 JSONField 이름 (예: expert_image -> expert_image_variants)
+    return f"{image_field}_variants"
+
+
+def is_stored_image(name):
+    # 소셜 로그인 / 더미 데이터의 외부 URL 은 저장소의 파일이 아니므로 처리하지 않음
+    return bool(name) and "://" not in name and not name.startswith(("http:", "https:"))
+
+
+def variant_name(name, bucket):
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, VARIANTS_DIRECTORY, f"{stem}_{bucket}.webp")
+
+
+def render_variants(source, buckets):
+    """
+    원본 이미지(파일 객체)로 버킷 별 WebP 이미지를 만듭니다. {버킷: (bytes, (width, height))}
+    - JPEG 는 가장 큰 버킷 크기에 맞춰 축소 디코딩(draft)하여 큰 사진의 디코딩 비용을 줄임
+    - EXIF 회전은 픽셀에 적용하고, EXIF(GPS, 기기 정보 등)/XMP 메타데이터는 저장하지 않음 (ICC 색 프로필만 유지)
+    - 큰 버킷부터 차례로 축소하여 작은 버킷은 이전 결과에서 만듦
+    """
+    buckets = sorted(buckets, key=IMAGE_VARIANT_SIZES.get, reverse=True)
+    largest = IMAGE_VARIANT_SIZES[buckets[0]]
+
+    with Image.open(source) as original:
+        original.draft("RGB", (largest, largest))
+        icc_profile = original.info.get("icc_profile")
+        has_alpha = original.mode in ("RGBA", "LA", "PA") or "transparency" in original.info
+        image = ImageOps.exif_transpose(original).convert("RGBA" if has_alpha else "RGB")
+
+    variants = {}
+    for bucket in buckets:
+        size = IMAGE_VARIANT_SIZES[bucket]
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, "WEBP", quality=WEBP_QUALITY, icc_profile=icc_profile)
+        variants[bucket] = (buffer.getvalue(), image.size)
+    return variants
+
+
+def needs_variants(instance, image_field):
+    name = getattr(instance, image_field).name
+    variants = getattr(instance, variants_field_name(image_field)) or {}
+    return is_stored_image(name) and variants.get("source") != name
+
+
+def get_image_variants(instance, image_field):
+    """
+    현재 원본으로 만든 변형 이미지 {버킷: {name, width, height, bytes}} (아직 없거나 원본이 바뀐 경우 빈 dict)
+    """
+    name = getattr(instance, image_field).name
+    variants = getattr(instance, variants_field_name(image_field)) or {}
+    if not name or variants.get("source") != name:
+        return {}
+    return variants.get("sizes", {})
+
+
+def generate_image_variants(instance, image_field, buckets):
+    """
+    instance 의 원본 이미지로 변형 이미지를 만들어 저장소에 저장하고, 변형 이미지 필드에 저장할 값을 반환합니다.
+    """
+    field_file = getattr(instance, image_field)
+    storage = field_file.storage
+    with storage.open(field_file.name, "rb") as source:
+        rendered = render_variants(source, buckets)
+
+    sizes = {}
+    for bucket, (content, (width, height)) in rendered.items():
+        name = variant_name(field_file.name, bucket)
+        # 다시 만드는 경우 이전 변형 이미지를 교체 (MediaStorage 는 같은 이름이면 새 이름을 붙임)
+        if storage.exists(name):
+            storage.delete(name)
+        sizes[bucket] = {
+            "name": storage.save(name, ContentFile(content)),
+            "width": width,
+            "height": height,
+            "bytes": len(content),
+        }
+    return {"source": field_file.name, "sizes": sizes}
+
+
+def process_image_variants(model, pk, image_field, buckets):
+    """
+    저장된 행의 변형 이미지를 만들고 변형 이미지 필드를 갱신합니다. (업로드 커밋 후 / generate_image_variants 명령)
+    - 처리 중에 원본이 바뀐 경우에는 갱신하지 않음 (다음 저장에서 다시 처리)
+    - 캐시 무효화 등을 위해 update() 후 post_save 를 직접 전송합니다.
+    """
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None or not needs_variants(instance, image_field):
+        return None
+
+    source = getattr(instance, image_field).name
+    try:
+        variants = generate_image_variants(instance, image_field, buckets)
+    except (UnidentifiedImageError, Image.DecompressionBombError) as e:
+        # 이미지로 열 수 없는 파일은 다시 처리하지 않도록 빈 변형으로 기록 (클라이언트는 원본 사용)
+        logger.warning(f"변형 이미지를 만들 수 없는 파일: {model.__name__}({pk}) {source} {str(e)}")
+        variants = {"source": source, "sizes": {}}
+    except Exception as e:
+        logger.error(f"변형 이미지 생성 중 오류 발생: {model.__name__}({pk}) {source} {str(e)}")
+        return None
+
+    variants_field = variants_field_name(image_field)
+    updated = model.objects.filter(pk=pk, **{image_field: source}).update(**{variants_field: variants})
+    if not updated:
+        return None
+
+    setattr(instance, variants_field, variants)
+    post_save.send(
+        sender=model,
+        instance=instance,
+        created=False,
+        update_fields=frozenset([variants_field]),
+        raw=False,
+        using=instance._state.db,
+    )
+    return variants
+
+
+@extend_schema_field(
+    {
+        "type": "object",
+        "additionalProperties": {"type": "string", "format": "uri"},
+        "example": {"thumb": "https://example.com/media/images/variants/photo_thumb.webp"},
+    }
+)
+class ImageVariantsField(serializers.Field):
+    """
+    변형 이미지 URL {버킷: URL} - 목록 화면은 원본 대신 작은 버킷을 사용
+    아직 만들어지지 않았으면 빈 객체를 반환하므로 클라이언트는 원본 URL 을 사용합니다.
+    """
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        storage = getattr(instance, self.image_field).storage
+        request = self.context.get("request")
+        urls = {}
+        for bucket, variant in get_image_variants(instance, self.image_field).items():
+            url = storage.url(variant["name"])
+            urls[bucket] = request.build_absolute_uri(url) if request else url
+        return urls
@@ -0,0 +1,60 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common.authentication import CachedJWTAuthentication
+from expert.models import Expert
+from users.auth_cache import invalidate_auth_user
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare identity queries per request for JWTAuthentication vs CachedJWTAuthentication "
+        "(authenticate + request.user.expert, rolled back)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000, help="방식 별 요청 수")
+
+    def handle(self, *args, **options):
+        request_count = max(options["requests"], 1)
+
+        with transaction.atomic():
+            user = User.objects.create(
+                email="bench-auth@example.com", name="expert", gender="M", phone_number="", is_expert=True
+            )
+            Expert.objects.create(user=user, service="mc", available_location="seoul", appeal="benchmark")
+            invalidate_auth_user(user.id)
+            request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+            print(f"{request_count} requests per mode (steady state, first request excluded)")
+            print(f"{'mode':>8} | {'queries/request':>15} | {'median(us)':>10}")
+            for mode, authenticator in (("db", JWTAuthentication()), ("cached", CachedJWTAuthentication())):
+                # 첫 요청(캐시 채우기)은 제외하고 측정
+                self.authenticate(authenticator, request)
+                timings, query_count = self.measure(authenticator, request, request_count)
+                print(f"{mode:>8} | {query_count / request_count:>15.2f} | {statistics.median(timings):>10.1f}")
+
+            invalidate_auth_user(user.id)
+            transaction.set_rollback(True)
+
+    def authenticate(self, authenticator, request):
+        user, _ = authenticator.authenticate(request)
+        # IsExpert / perform_create 처럼 전문가 정보까지 접근
+        return user.is_expert and user.expert.id
+
+    def measure(self, authenticator, request, request_count):
+        timings = []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(request_count):
+                started = time.perf_counter()
+                self.authenticate(authenticator, request)
+                timings.append((time.perf_counter() - started) * 1000 * 1000)
+        return timings, len(queries)
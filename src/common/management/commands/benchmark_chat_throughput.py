@@ -0,0 +1,98 @@
+import time
+
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from channels.layers import InMemoryChannelLayer
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from chat.message_buffer import MessageWriteBuffer
+from chat.models import ChatRoom, Message
+from estimations.models import EstimationsRequest
+from expert.models import Expert
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-message INSERT vs write-behind batching for ChatConsumer and print sustained "
+        "messages per second for a single worker (rolled back)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=5000, help="모드 별 전송 메시지 수")
+        parser.add_argument("--rooms", type=int, default=50, help="채팅방 수")
+        parser.add_argument("--flush-size", type=int, default=50, help="write-behind 배치 크기")
+        parser.add_argument("--flush-interval-ms", type=int, default=200, help="write-behind flush 주기(ms)")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rooms = self.create_rooms(options["rooms"])
+            frames = [(rooms[index % len(rooms)], f"benchmark message {index}") for index in range(options["messages"])]
+
+            results = [
+                ("per-message", async_to_sync(self.per_message)(frames)),
+                ("write-behind", async_to_sync(self.write_behind)(frames, options)),
+            ]
+            saved = Message.objects.filter(room__in=rooms).count()
+
+            print(f"{len(frames)} messages x 2 modes, {len(rooms)} rooms, flush size {options['flush_size']}")
+            print(f"{'mode':>12} | {'total(s)':>8} | {'msg/s':>8}")
+            for mode, elapsed in results:
+                print(f"{mode:>12} | {elapsed:>8.2f} | {len(frames) / elapsed:>8.0f}")
+            print(f"saved messages: {saved} (expected {len(frames) * 2})")
+
+            transaction.set_rollback(True)
+
+    def create_rooms(self, room_count):
+        users = User.objects.bulk_create(
+            [
+                User(email=f"bench-chat-{index}@example.com", name=f"user{index}", gender="M", phone_number="")
+                for index in range(room_count * 2)
+            ]
+        )
+        guests, expert_users = users[:room_count], users[room_count:]
+        experts = Expert.objects.bulk_create(
+            [Expert(user=user, service="mc", available_location="seoul", appeal="benchmark") for user in expert_users]
+        )
+        requests = EstimationsRequest.objects.bulk_create(
+            [
+                EstimationsRequest(
+                    user=guest,
+                    service_list=["mc"],
+                    prefer_gender="M",
+                    location="seoul",
+                    wedding_hall="benchmark hall",
+                    wedding_datetime="2024-12-12T12:00:00+09:00",
+                )
+                for guest in guests
+            ]
+        )
+        return ChatRoom.objects.bulk_create(
+            [
+                ChatRoom(user=guest, expert=expert, request=request)
+                for guest, expert, request in zip(guests, experts, requests)
+            ]
+        )
+
+    async def per_message(self, frames):
+        # 기존 방식: 프레임마다 thread hop + INSERT + post_save 알림 후 브로드캐스트
+        channel_layer = InMemoryChannelLayer()
+        started = time.perf_counter()
+        for room, content in frames:
+            await database_sync_to_async(Message.objects.create)(room=room, sender_id=room.user_id, content=content)
+            await channel_layer.group_send(f"chat_{room.id}", {"type": "chat_message", "content": content})
+        return time.perf_counter() - started
+
+    async def write_behind(self, frames, options):
+        channel_layer = InMemoryChannelLayer()
+        buffer = MessageWriteBuffer(options["flush_size"], options["flush_interval_ms"] / 1000)
+        started = time.perf_counter()
+        for room, content in frames:
+            message = await buffer.add(room.id, room.user_id, content)
+            await channel_layer.group_send(
+                f"chat_{room.id}", {"type": "chat_message", "id": message.id, "content": content}
+            )
+        # 남은 배치와 진행 중인 flush 가 끝날 때까지를 포함해야 지속 처리량이 됨
+        await buffer.flush()
+        return time.perf_counter() - started
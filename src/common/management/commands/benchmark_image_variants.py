@@ -0,0 +1,106 @@
+import io
+import random
+import statistics
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from PIL import Image, ImageDraw, ImageOps
+
+from common.images import IMAGE_VARIANT_SIZES, WEBP_QUALITY, render_variants
+
+
+def sample_photo(width, height, seed):
+    """
+    휴대폰 사진과 비슷한 크기/압축률의 JPEG (그라디언트 + 도형 + 노이즈, EXIF 회전 정보 포함)
+    """
+    rng = random.Random(seed)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge(
+        "RGB", (gradient, gradient.transpose(Image.Transpose.ROTATE_90).resize((width, height)), gradient)
+    )
+    draw = ImageDraw.Draw(image)
+    for _ in range(40):
+        x, y = rng.randrange(width), rng.randrange(height)
+        radius = rng.randrange(width // 20, width // 4)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color)
+    noise = Image.effect_noise((width, height), 40).convert("RGB")
+    image = Image.blend(image, noise, 0.25)
+
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: 90도 회전
+    exif[0x010F] = "Sample Camera"
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90, exif=exif)
+    return buffer.getvalue()
+
+
+def naive_variants(source, buckets):
+    # 비교용: 원본 전체를 디코딩하고 버킷마다 원본에서 축소
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+    variants = {}
+    for bucket in buckets:
+        size = IMAGE_VARIANT_SIZES[bucket]
+        variant = image.copy()
+        variant.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        variant.save(buffer, "WEBP", quality=WEBP_QUALITY)
+        variants[bucket] = (buffer.getvalue(), variant.size)
+    return variants
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure image variant processing throughput and bytes saved on a sample set "
+        "(synthetic phone-sized JPEGs, or real images from --source-dir)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--images", type=int, default=20, help="생성할 샘플 이미지 수")
+        parser.add_argument("--width", type=int, default=4032, help="샘플 이미지 가로(px)")
+        parser.add_argument("--height", type=int, default=3024, help="샘플 이미지 세로(px)")
+        parser.add_argument("--source-dir", help="샘플 대신 사용할 이미지 디렉터리 (jpg/jpeg/png/webp)")
+        parser.add_argument("--page-size", type=int, default=20, help="목록 한 페이지의 이미지 수")
+
+    def handle(self, *args, **options):
+        samples = self.load_samples(options)
+        buckets = list(IMAGE_VARIANT_SIZES)
+        original_bytes = sum(len(sample) for sample in samples)
+        print(f"{len(samples)} images, {original_bytes / len(samples) / 1024:.0f}KB average original")
+
+        print(f"{'pipeline':>10} | {'p50(ms)':>8} | {'images/s':>8}")
+        results = None
+        for name, pipeline in (("naive", naive_variants), ("pipeline", render_variants)):
+            timings = []
+            outputs = []
+            for sample in samples:
+                started = time.perf_counter()
+                outputs.append(pipeline(io.BytesIO(sample), buckets))
+                timings.append(time.perf_counter() - started)
+            print(f"{name:>10} | {statistics.median(timings) * 1000:>8.1f} | {len(samples) / sum(timings):>8.1f}")
+            results = outputs
+
+        print(f"{'variant':>10} | {'avg KB':>8} | {'vs original':>11} | {'page of ' + str(options['page_size']):>12}")
+        print(
+            f"{'original':>10} | {original_bytes / len(samples) / 1024:>8.1f} | {'100.0%':>11} | "
+            f"{original_bytes / len(samples) * options['page_size'] / 1024 / 1024:>10.2f}MB"
+        )
+        for bucket in buckets:
+            bucket_bytes = sum(len(result[bucket][0]) for result in results)
+            print(
+                f"{bucket:>10} | {bucket_bytes / len(samples) / 1024:>8.1f} | "
+                f"{bucket_bytes / original_bytes * 100:>10.2f}% | "
+                f"{bucket_bytes / len(samples) * options['page_size'] / 1024 / 1024:>10.2f}MB"
+            )
+
+    def load_samples(self, options):
+        if options["source_dir"]:
+            paths = sorted(
+                path
+                for path in Path(options["source_dir"]).iterdir()
+                if path.suffix.lower() in (".jpg", ".jpeg", ".png", ".webp")
+            )
+            return [path.read_bytes() for path in paths]
+        return [sample_photo(options["width"], options["height"], seed) for seed in range(options["images"])]
@@ -0,0 +1,113 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from chat.models import ChatRoom, Message
+from chat.pagination import MessageCursorPagination
+from estimations.models import EstimationsRequest
+from expert.models import Expert
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Compare keyset vs OFFSET message page fetch latency at different depths of one large room (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=100000, help="채팅방 메시지 수")
+        parser.add_argument("--page-size", type=int, default=50, help="페이지 크기")
+        parser.add_argument("--repeat", type=int, default=20, help="위치 별 조회 반복 횟수")
+
+    def handle(self, *args, **options):
+        message_count = options["messages"]
+        page_size = options["page_size"]
+        repeat = max(options["repeat"], 1)
+
+        with transaction.atomic():
+            room = self.create_room()
+            message_ids = self.create_messages(room, message_count)
+
+            print(f"{message_count} messages, page_size={page_size}")
+            print(f"{'depth':>10} | {'keyset(ms)':>10} | {'offset(ms)':>10} | keyset queries")
+            for depth in (0, message_count // 2, message_count - page_size):
+                # depth: 최신 메시지로부터 떨어진 위치
+                anchor = Message.objects.get(id=message_ids[-(depth + 1)]) if depth else None
+                keyset_timings, query_count = self.measure_keyset(room, anchor, page_size, repeat)
+                offset_timings = self.measure_offset(room, depth, page_size, repeat)
+                print(
+                    f"{depth:>10} | {statistics.median(keyset_timings):>10.2f} | "
+                    f"{statistics.median(offset_timings):>10.2f} | {query_count}"
+                )
+
+            transaction.set_rollback(True)
+
+    def create_room(self):
+        guest = User.objects.create_user(
+            email="bench-chat-guest@example.com", name="guest", gender="M", phone_number="010-0000-0000"
+        )
+        expert_user = User.objects.create_user(
+            email="bench-chat-expert@example.com", name="expert", gender="M", phone_number="010-0000-0000"
+        )
+        expert = Expert.objects.create(user=expert_user, service="mc", available_location="seoul", appeal="benchmark")
+        request = EstimationsRequest.objects.create(
+            user=guest,
+            service_list=["mc"],
+            prefer_gender="M",
+            location="seoul",
+            wedding_hall="benchmark hall",
+            wedding_datetime=timezone.now(),
+            status="pending",
+        )
+        return ChatRoom.objects.create(user=guest, expert=expert, request=request)
+
+    def create_messages(self, room, message_count):
+        # bulk_create 는 auto_now_add 로 모든 timestamp 를 같은 값으로 덮어쓰므로 벤치마크 동안만 비활성화
+        timestamp_field = Message._meta.get_field("timestamp")
+        started_at = timezone.now() - timedelta(seconds=message_count)
+        timestamp_field.auto_now_add = False
+        try:
+            messages = Message.objects.bulk_create(
+                [
+                    Message(
+                        room=room,
+                        sender_id=room.user_id,
+                        content=f"benchmark message {index}",
+                        timestamp=started_at + timedelta(seconds=index),
+                    )
+                    for index in range(message_count)
+                ],
+                batch_size=5000,
+            )
+        finally:
+            timestamp_field.auto_now_add = True
+        return [message.id for message in messages]
+
+    def measure_keyset(self, room, anchor, page_size, repeat):
+        paginator = MessageCursorPagination()
+        params = {"page_size": page_size}
+        if anchor:
+            params["before"] = paginator.encode_cursor(anchor)
+        request = Request(APIRequestFactory().get("/", params))
+
+        timings = []
+        for _ in range(repeat):
+            queryset = Message.objects.filter(room_id=room.id)
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                MessageCursorPagination().paginate_queryset(queryset, request)
+                timings.append((time.perf_counter() - started) * 1000)
+        return timings, len(queries)
+
+    def measure_offset(self, room, depth, page_size, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(Message.objects.filter(room_id=room.id).order_by("-timestamp", "-id")[depth : depth + page_size])
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
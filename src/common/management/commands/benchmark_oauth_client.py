@@ -0,0 +1,75 @@
+import asyncio
+import statistics
+import time
+
+import requests
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from users.oauth_client import (
+    AsyncOAuthProviderClient,
+    OAuthProviderClient,
+    provider_token_request,
+    provider_user_info_url,
+)
+from users.oauth_stub import stub_oauth_provider
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure OAuth provider round trips (token + user info) against a local stub provider: "
+        "unpooled requests vs pooled OAuthProviderClient, plus concurrent async logins."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=200, help="순차 로그인 수")
+        parser.add_argument("--concurrency", type=int, default=50, help="async 동시 로그인 수")
+        parser.add_argument("--provider", default="kakao", choices=["naver", "kakao", "google"])
+        parser.add_argument("--provider-latency-ms", type=int, default=20, help="stub provider 응답 지연(ms)")
+
+    def handle(self, *args, **options):
+        provider_name = options["provider"]
+        with stub_oauth_provider(options["provider_latency_ms"]) as provider, override_settings(**provider.settings):
+            client = OAuthProviderClient(connect_timeout=3, read_timeout=5, retries=2, pool_size=options["concurrency"])
+
+            print(f"{options['logins']} sequential logins, provider latency {options['provider_latency_ms']}ms")
+            print(f"{'mode':>10} | {'p50(ms)':>8} | {'max(ms)':>8} | new connections")
+            for mode, login in (("unpooled", self.unpooled_login), ("pooled", client_login(client))):
+                connections_before = provider.connection_count
+                timings = []
+                for index in range(options["logins"]):
+                    started = time.perf_counter()
+                    login(provider_name, f"bench-{index}")
+                    timings.append((time.perf_counter() - started) * 1000)
+                print(
+                    f"{mode:>10} | {statistics.median(timings):>8.2f} | {max(timings):>8.2f} | "
+                    f"{provider.connection_count - connections_before}"
+                )
+
+            elapsed = asyncio.run(self.concurrent_logins(AsyncOAuthProviderClient(client), provider_name, options))
+            print(f"async: {options['concurrency']} concurrent logins in {elapsed:.1f}ms")
+            client.close()
+
+    def unpooled_login(self, provider, code):
+        # 이전 방식: 요청마다 새 연결, timeout / 재시도 없음
+        token_url, payload = provider_token_request(provider, code)
+        access_token = requests.post(token_url, data=payload).json()["access_token"]
+        return requests.get(
+            provider_user_info_url(provider), headers={"Authorization": f"Bearer {access_token}"}
+        ).json()
+
+    async def concurrent_logins(self, client, provider, options):
+        async def login(index):
+            access_token = await client.fetch_access_token(provider, f"bench-async-{index}")
+            return await client.fetch_user_info(provider, access_token)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(login(index) for index in range(options["concurrency"])))
+        return (time.perf_counter() - started) * 1000
+
+
+def client_login(client):
+    def login(provider, code):
+        return client.fetch_user_info(provider, client.fetch_access_token(provider, code))
+
+    return login
@@ -0,0 +1,92 @@
+import random
+import statistics
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from expert.models import Career, Expert
+from expert.sampling import expert_pool_key, sample_expert_ids
+from users.models import User
+
+SERVICE = "mc"
+
+
+class Command(BaseCommand):
+    help = "Compare full-shuffle vs id-pool sampling for ExpertListView?random=true (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--experts", type=int, default=100000, help="서비스 전문가 수")
+        parser.add_argument("--sample", type=int, default=3, help="랜덤 조회 전문가 수")
+        parser.add_argument("--repeat", type=int, default=20, help="방식 별 반복 횟수")
+
+    def handle(self, *args, **options):
+        expert_count = options["experts"]
+        k = options["sample"]
+        repeat = max(options["repeat"], 1)
+
+        with transaction.atomic():
+            self.create_experts(expert_count)
+            cache.delete(expert_pool_key(SERVICE))
+
+            started = time.perf_counter()
+            sample_expert_ids(SERVICE, k)
+            warmup = (time.perf_counter() - started) * 1000
+
+            shuffle_timings, shuffle_rows = self.measure(self.full_shuffle, k, repeat)
+            sample_timings, sample_rows = self.measure(self.pool_sample, k, repeat)
+
+            print(f"{expert_count} experts, k={k}, pool warm-up {warmup:.1f}ms")
+            print(f"{'mode':>12} | {'median(ms)':>10} | {'max(ms)':>9} | queries")
+            print(
+                f"{'shuffle':>12} | {statistics.median(shuffle_timings):>10.1f} | {max(shuffle_timings):>9.1f} | {shuffle_rows}"
+            )
+            print(
+                f"{'pool':>12} | {statistics.median(sample_timings):>10.1f} | {max(sample_timings):>9.1f} | {sample_rows}"
+            )
+
+            cache.delete(expert_pool_key(SERVICE))
+            transaction.set_rollback(True)
+
+    def create_experts(self, expert_count):
+        users = User.objects.bulk_create(
+            [
+                User(email=f"bench-random-{index}@example.com", name=f"expert{index}", gender="M", phone_number="")
+                for index in range(expert_count)
+            ],
+            batch_size=5000,
+        )
+        experts = Expert.objects.bulk_create(
+            [Expert(user=user, service=SERVICE, available_location="seoul", appeal="benchmark") for user in users],
+            batch_size=5000,
+        )
+        Career.objects.bulk_create(
+            [
+                Career(expert=expert, title="benchmark", description="benchmark", start_date="2020-01-01")
+                for expert in experts
+            ],
+            batch_size=5000,
+        )
+
+    def queryset(self):
+        return Expert.objects.filter(service=SERVICE).select_related("user").prefetch_related("careers")
+
+    def full_shuffle(self, k):
+        # 기존 방식: 서비스 전문가 전체를 조회한 후 섞어서 k 명 선택
+        experts = list(self.queryset())
+        random.shuffle(experts)
+        return experts[:k]
+
+    def pool_sample(self, k):
+        return list(self.queryset().filter(id__in=sample_expert_ids(SERVICE, k)))
+
+    def measure(self, sampler, k, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                sampler(k)
+                timings.append((time.perf_counter() - started) * 1000)
+        return timings, len(queries)
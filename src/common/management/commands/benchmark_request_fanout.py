@@ -0,0 +1,81 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from estimations.models import EstimationsRequest
+from expert.models import Expert, ExpertServiceArea
+from notifications.models import Notification
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Measure EstimationsRequest creation latency against N matching experts (rolled back after each run)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--experts", default="10,1000,10000", help="쉼표로 구분된 매칭 전문가 수 목록")
+        parser.add_argument("--repeat", type=int, default=5, help="전문가 수 별 견적 요청 생성 반복 횟수")
+
+    def handle(self, *args, **options):
+        expert_counts = [int(count) for count in options["experts"].split(",")]
+        repeat = max(options["repeat"], 1)
+
+        print(f"{'experts':>8} | {'min(ms)':>9} | {'median(ms)':>10} | {'max(ms)':>9} | notifications/run")
+        for expert_count in expert_counts:
+            timings, created = self.run_once(expert_count, repeat)
+            print(
+                f"{expert_count:>8} | {min(timings):>9.1f} | {statistics.median(timings):>10.1f} | "
+                f"{max(timings):>9.1f} | {created}"
+            )
+
+    def run_once(self, expert_count, repeat):
+        timings = []
+
+        # 벤치마크 데이터는 실행 후 모두 롤백
+        with transaction.atomic():
+            guest = User.objects.create_user(
+                email=f"bench-guest-{expert_count}@example.com", name="guest", gender="M", phone_number="010-0000-0000"
+            )
+            expert_users = User.objects.bulk_create(
+                [
+                    User(
+                        email=f"bench-expert-{expert_count}-{index}@example.com",
+                        name=f"expert{index}",
+                        gender="M",
+                        phone_number="010-0000-0000",
+                        is_expert=True,
+                    )
+                    for index in range(expert_count)
+                ],
+                batch_size=1000,
+            )
+            experts = Expert.objects.bulk_create(
+                [
+                    Expert(user=user, service="mc", available_location="seoul", appeal="benchmark")
+                    for user in expert_users
+                ],
+                batch_size=1000,
+            )
+            # bulk_create 는 post_save 를 발생시키지 않으므로 활동 지역 인덱스를 직접 동기화
+            ExpertServiceArea.sync(experts)
+
+            notifications_before = Notification.objects.count()
+            for _ in range(repeat):
+                started = time.perf_counter()
+                EstimationsRequest.objects.create(
+                    user=guest,
+                    service_list=["mc"],
+                    prefer_gender="M",
+                    location="seoul",
+                    wedding_hall="benchmark hall",
+                    wedding_datetime=timezone.now() + timezone.timedelta(days=30),
+                    status="pending",
+                )
+                timings.append((time.perf_counter() - started) * 1000)
+            created = (Notification.objects.count() - notifications_before) // repeat
+
+            transaction.set_rollback(True)
+
+        return timings, created
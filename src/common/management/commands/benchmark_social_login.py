@@ -0,0 +1,81 @@
+import statistics
+import time
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+
+from users.models import User
+from users.oauth_stub import stub_oauth_provider
+from users.serializers.oauth_serializers import SocialLoginSerializer
+from users.tokens import revoke_all_refresh_tokens
+from users.views.oauth_views import SocialLoginAPIView
+
+
+def legacy_save(serializer, **kwargs):
+    # 이전 방식: 이메일로 조회 -> 전체 save (-> 기존 토큰 폐기)
+    validated_data = {**serializer.validated_data, **kwargs}
+    user = User.objects.filter(email=validated_data["email"]).first()
+    if user:
+        user.name = validated_data.get("name") or user.name
+        user.profile_image = validated_data.get("profile_image") or user.profile_image
+        user.phone_number = validated_data.get("phone_number") or user.phone_number
+        user.is_active = True
+    else:
+        user = User(
+            email=validated_data["email"],
+            name=validated_data.get("name", ""),
+            profile_image=validated_data.get("profile_image", ""),
+            phone_number=validated_data.get("phone_number") or "",
+        )
+    user.save()
+    revoke_all_refresh_tokens(user.id)
+    return user
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure social login latency (google flow against a local stub OAuth provider) for the "
+        "lookup + save path vs the single-statement upsert path (rolled back)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=500, help="모드 별 로그인 횟수")
+        parser.add_argument("--users", type=int, default=50, help="로그인하는 서로 다른 유저 수 (재로그인 포함)")
+        parser.add_argument("--provider-latency-ms", type=int, default=0, help="stub provider 응답 지연(ms)")
+
+    def handle(self, *args, **options):
+        view = SocialLoginAPIView.as_view()
+        factory = APIRequestFactory()
+
+        with stub_oauth_provider(options["provider_latency_ms"]) as provider, override_settings(**provider.settings):
+            print(f"{options['logins']} logins per mode, {options['users']} distinct users")
+            print(f"{'mode':>8} | {'p50(ms)':>8} | {'p95(ms)':>8} | queries/login")
+            for mode in ("legacy", "upsert"):
+                with transaction.atomic():
+                    if mode == "legacy":
+                        with mock.patch.object(SocialLoginSerializer, "save", legacy_save):
+                            timings, queries = self.run_logins(view, factory, mode, options)
+                    else:
+                        timings, queries = self.run_logins(view, factory, mode, options)
+                    transaction.set_rollback(True)
+
+                timings.sort()
+                p95 = timings[int(len(timings) * 0.95) - 1]
+                print(
+                    f"{mode:>8} | {statistics.median(timings):>8.2f} | {p95:>8.2f} | " f"{queries / len(timings):.2f}"
+                )
+
+    def run_logins(self, view, factory, mode, options):
+        timings = []
+        with CaptureQueriesContext(connection) as captured:
+            for index in range(options["logins"]):
+                request = factory.post("/", {"code": f"bench-{mode}-{index % options['users']}"}, format="json")
+                started = time.perf_counter()
+                response = view(request, provider="google")
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    raise RuntimeError(f"login failed: {response.status_code} {response.data}")
+        return timings, len(captured)
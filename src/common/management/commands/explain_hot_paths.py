@@ -0,0 +1,262 @@
+import random
+import re
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from chat.models import ChatReadCursor, ChatRoom, Message
+from chat.views.chat_views import ChatRoomListCreateAPIView, MessageListCreateAPIView
+from estimations.models import Estimation, EstimationsRequest, RequestManager
+from estimations.views.expert_views import (
+    EstimationListByExpertAPIView,
+    EstimationRequestListForExpertAPIView,
+)
+from estimations.views.guest_views import (
+    EstimationListAPIView,
+    EstimationRequestListCreateAPIView,
+)
+from expert.models import Expert
+from notifications.models import Notification
+from notifications.views.notification_views import NotificationListAPIView
+from reservations.models import Reservation
+from reservations.views import ExpertReservationListAPIView
+from reviews.views.guest_views import ReviewListByExpertAPIView
+from users.models import User
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large dataset (rolled back) and print EXPLAIN ANALYZE for the main queryset of each hot view. "
+        "With --fail-on-seq-scan the command fails when a plan sequentially scans one of the hot tables."
+    )
+
+    # 인덱스로 조회되어야 하는 테이블 - 이 테이블의 Seq Scan 은 회귀로 판단
+    hot_tables = (
+        "notifications_notification",
+        "chat_message",
+        "chat_chatroom",
+        "chat_chatreadcursor",
+        "estimations_estimationsrequest",
+        "estimations_estimation",
+        "estimations_requestmanager",
+        "reservations_reservation",
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=5000, help="게스트 유저 수")
+        # 전문가 당 견적/예약이 많으면(500명: 전문가 당 견적 20개) 작은 예약 테이블 전체를 Hash Join 하는 것이
+        # 인덱스 조회보다 싸다고 판단하므로, 운영처럼 전문가 당 비중이 작도록 기본값 설정
+        parser.add_argument("--experts", type=int, default=1000, help="전문가 수")
+        parser.add_argument("--notifications", type=int, default=40, help="유저 당 알림 수")
+        parser.add_argument("--messages", type=int, default=20, help="채팅방 당 메시지 수")
+        parser.add_argument("--page-size", type=int, default=20, help="EXPLAIN 할 페이지 크기 (LIMIT)")
+        parser.add_argument("--seed", type=int, default=0, help="데이터 생성 random seed")
+        parser.add_argument("--fail-on-seq-scan", action="store_true", help="hot 테이블 Seq Scan 발견 시 실패")
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        regressions = []
+
+        with transaction.atomic():
+            self.stdout.write("데이터 생성 중...")
+            guest, expert = self.generate(options)
+            self.analyze_tables()
+
+            for name, queryset in self.hot_querysets(guest, expert):
+                plan = self.explain(queryset[: options["page_size"]])
+                self.stdout.write(self.style.MIGRATE_HEADING(f"\n== {name}"))
+                self.stdout.write(plan)
+                seq_scans = self.find_seq_scans(plan)
+                if seq_scans:
+                    regressions.append(f"{name}: {', '.join(seq_scans)}")
+
+            transaction.set_rollback(True)
+
+        if regressions:
+            message = "Seq Scan on hot tables:\n  " + "\n  ".join(regressions)
+            if options["fail_on_seq_scan"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+
+    def generate(self, options):
+        now = timezone.now()
+        user_count = options["users"]
+        expert_count = options["experts"]
+
+        users = User.objects.bulk_create(
+            [
+                User(email=f"explain-user-{index}@example.com", name=f"user{index}", gender="M", phone_number="")
+                for index in range(user_count + expert_count)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        guests, expert_users = users[:user_count], users[user_count:]
+        experts = Expert.objects.bulk_create(
+            [Expert(user=user, service="mc", available_location="seoul", appeal="explain") for user in expert_users],
+            batch_size=BATCH_SIZE,
+        )
+
+        statuses = ["pending", "completed", "canceled"]
+        requests = EstimationsRequest.objects.bulk_create(
+            [
+                EstimationsRequest(
+                    user=guest,
+                    service_list=["mc"],
+                    prefer_gender="M",
+                    location="seoul",
+                    wedding_hall="explain hall",
+                    wedding_datetime=now,
+                    status=random.choice(statuses),
+                )
+                for guest in guests
+                for _ in range(2)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        RequestManager.objects.bulk_create(
+            [RequestManager(expert=random.choice(experts), request=request) for request in requests],
+            batch_size=BATCH_SIZE,
+        )
+
+        estimations = Estimation.objects.bulk_create(
+            [
+                Estimation(
+                    request=request,
+                    expert=random.choice(experts),
+                    service="mc",
+                    location="seoul",
+                    due_date=date.today() + timedelta(days=random.randint(0, 365)),
+                    charge=100000,
+                )
+                for request in requests
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        reservation_statuses = [choice for choice, _ in Reservation._meta.get_field("status").choices]
+        Reservation.objects.bulk_create(
+            [
+                Reservation(estimation=estimation, status=random.choice(reservation_statuses))
+                for estimation in estimations[::2]
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    receiver=user,
+                    notification_type="message",
+                    payload={"sender_id": user.id, "content": "explain"},
+                    is_read=random.random() < 0.8,
+                )
+                for user in users
+                for _ in range(options["notifications"])
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+        rooms = ChatRoom.objects.bulk_create(
+            [ChatRoom(user=request.user, expert=random.choice(experts), request=request) for request in requests[::2]],
+            batch_size=BATCH_SIZE,
+        )
+        messages = Message.objects.bulk_create(
+            [
+                Message(room=room, sender_id=room.user_id, content="explain")
+                for room in rooms
+                for _ in range(options["messages"])
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        # 채팅방 대부분은 전문가가 일부 메시지까지 읽은 상태 (bulk_create 순서대로 채팅방 별 메시지가 이어짐)
+        per_room = options["messages"]
+        cursors = []
+        for index, room in enumerate(rooms):
+            room_messages = messages[index * per_room : (index + 1) * per_room]
+            if room_messages and random.random() < 0.8:
+                message = random.choice(room_messages)
+                cursors.append(
+                    ChatReadCursor(
+                        room=room, user=room.expert.user, last_read_message=message, last_read_at=message.timestamp
+                    )
+                )
+        ChatReadCursor.objects.bulk_create(cursors, batch_size=BATCH_SIZE)
+
+        # 예약/채팅방이 있는 게스트, 전문가를 조회 대상으로 사용
+        return rooms[0].user, experts[0]
+
+    def analyze_tables(self):
+        # 대량 생성 직후 통계를 갱신해야 실제 운영과 같은 실행 계획이 나옴
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+    def explain(self, queryset):
+        if connection.vendor == "postgresql":
+            return queryset.explain(analyze=True, buffers=True)
+        return queryset.explain()
+
+    def relation_pages(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relpages FROM pg_class WHERE oid = to_regclass(%s)", [name])
+            row = cursor.fetchone()
+        return row[0] if row else 0
+
+    def find_seq_scans(self, plan):
+        if connection.vendor == "postgresql":
+            # 월 파티션(notifications_notification_pYYYY_MM 등)은 부모 테이블의 스캔으로 봄
+            # 한 페이지 이하의 파티션(비어 있는 이후 월 등)은 Seq Scan 이 가장 싼 실행 계획이므로 제외
+            relations = {name for name in re.findall(r"Seq Scan on (\w+)", plan) if self.relation_pages(name) > 1}
+            return [
+                table
+                for table in self.hot_tables
+                if any(name == table or name.startswith(f"{table}_") for name in relations)
+            ]
+        # SQLite: 전체 스캔은 "SCAN <table>" 로 끝나는 줄 (인덱스 조회는 "SEARCH", "SCAN ... USING INDEX")
+        lines = plan.splitlines()
+        return [table for table in self.hot_tables if any(line.endswith(f"SCAN {table}") for line in lines)]
+
+    def build_view(self, view_class, user, params=None, **kwargs):
+        request = Request(APIRequestFactory().get("/", params or {}))
+        request.user = user
+        view = view_class()
+        view.setup(request, **kwargs)
+        view.request = request
+        view.format_kwarg = None
+        return view
+
+    def hot_querysets(self, guest, expert):
+        """
+        (이름, view 의 메인 queryset) 목록 - 페이지네이션과 같은 정렬을 적용합니다.
+        """
+        room = ChatRoom.objects.filter(user=guest).first()
+        due_date = Estimation.objects.filter(expert=expert).values_list("due_date", flat=True).first() or date.today()
+
+        yield "NotificationListAPIView", self.build_view(NotificationListAPIView, guest).get_queryset().order_by(
+            "-created_at", "-id"
+        )
+        yield "ChatRoomListCreateAPIView", self.build_view(ChatRoomListCreateAPIView, guest).get_queryset()
+        yield "MessageListCreateAPIView", self.build_view(
+            MessageListCreateAPIView, guest, room_id=room.id
+        ).get_queryset().order_by("-timestamp", "-id")
+        yield "EstimationRequestListCreateAPIView(status)", self.build_view(
+            EstimationRequestListCreateAPIView, guest, {"status": "pending"}
+        ).get_queryset().order_by("id")
+        yield "EstimationListAPIView", self.build_view(EstimationListAPIView, guest).get_queryset().order_by("id")
+        yield "EstimationListByExpertAPIView(year, month)", self.build_view(
+            EstimationListByExpertAPIView, expert.user, {"year": due_date.year, "month": due_date.month}
+        ).get_queryset().order_by("id")
+        yield "EstimationRequestListForExpertAPIView", self.build_view(
+            EstimationRequestListForExpertAPIView, expert.user
+        ).get_queryset()
+        yield "ExpertReservationListAPIView", self.build_view(
+            ExpertReservationListAPIView, expert.user
+        ).get_queryset().order_by("id")
+        yield "ReviewListByExpertAPIView", self.build_view(
+            ReviewListByExpertAPIView, guest, expert_id=expert.id
+        ).get_queryset()
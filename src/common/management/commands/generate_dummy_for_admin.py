@@ -163,10 +163,8 @@ class Command(BaseCommand):
             )
 
     def create_request_manager_for_admin(self, request):
-        experts = Expert.objects.filter(
-            service__in=request.service_list,
-            user__gender=request.prefer_gender,
-            available_location__contains=request.location,
+        experts = Expert.objects.serving(request.location, services=request.service_list).filter(
+            user__gender=request.prefer_gender
         )
 
         if experts.exists():
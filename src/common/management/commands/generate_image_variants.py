@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import F, Q
+from django.db.models.fields.json import KT
+
+from common.images import process_image_variants, variants_field_name
+from common.signals.image_signals import IMAGE_VARIANT_FIELDS
+
+
+def pending_ids(model, image_field, after_id, batch_size):
+    """
+    변형 이미지가 없거나 원본이 바뀐 행의 id (외부 URL 이미지는 제외)
+    """
+    variants_field = variants_field_name(image_field)
+    return list(
+        model.objects.filter(pk__gt=after_id, **{f"{image_field}__gt": ""})
+        .exclude(**{f"{image_field}__contains": "://"})
+        .annotate(variants_source=KT(f"{variants_field}__source"))
+        .filter(Q(variants_source__isnull=True) | ~Q(variants_source=F(image_field)))
+        .order_by("pk")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate resized WebP variants for uploaded images that do not have them yet "
+        "(backfill, or background processing when IMAGE_VARIANTS_ON_UPLOAD is False)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=[model._meta.label_lower for model, _, _ in IMAGE_VARIANT_FIELDS],
+            help="처리할 모델 (기본값: 전체)",
+        )
+        parser.add_argument("--batch-size", type=int, default=100, help="한 번에 조회할 행 수")
+        parser.add_argument("--watch", action="store_true", help="대기 중인 이미지를 처리한 후 계속 확인")
+        parser.add_argument("--poll-interval", type=float, default=10.0, help="--watch 사용 시 확인 주기(초)")
+
+    def handle(self, *args, **options):
+        fields = [field for field in IMAGE_VARIANT_FIELDS if options["model"] in (None, field[0]._meta.label_lower)]
+
+        while True:
+            processed = sum(self.process_field(*field, options["batch_size"]) for field in fields)
+            if not options["watch"]:
+                return
+            if not processed:
+                time.sleep(options["poll_interval"])
+
+    def process_field(self, model, image_field, buckets, batch_size):
+        processed = failed = 0
+        after_id = 0
+        started_at = time.perf_counter()
+
+        while ids := pending_ids(model, image_field, after_id, batch_size):
+            for pk in ids:
+                if process_image_variants(model, pk, image_field, buckets) is None:
+                    failed += 1
+                else:
+                    processed += 1
+            after_id = ids[-1]
+
+        if processed or failed:
+            elapsed = time.perf_counter() - started_at
+            print(f"{model._meta.label}.{image_field}: {processed} processed, {failed} skipped in {elapsed:.1f}s")
+        return processed
@@ -0,0 +1,535 @@
+import multiprocessing
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from faker import Faker
+
+from chat.models import ChatReadCursor, ChatRoom, Message
+from common.choice_index import split_choices
+from common.constants.choices import (
+    AREA_CHOICES,
+    GENDER_CHOICES,
+    NOTIFICATION_TYPE_CHOICES,
+    RATING_CHOICES,
+    REQUEST_STATUS_CHOICES,
+    RESERVATION_STATUS_CHOICES,
+    SERVICE_CHOICES,
+)
+from estimations.models import (
+    Estimation,
+    EstimationsRequest,
+    RequestManager,
+    RequestService,
+)
+from expert.models import Career, Expert, ExpertServiceArea
+from notifications.models import Notification
+from notifications.partitions import ensure_partitions, is_partitioned
+from reservations.models import Reservation
+from reviews.models import Review
+from users.models import User
+
+# fork 된 워커 프로세스가 상속받는 생성 상태 (큰 id 목록을 pickle 하지 않기 위함)
+_worker_state = {}
+
+
+def scale(value):
+    """'1e6', '50000' 같은 값을 정수로 변환"""
+    return int(float(value))
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    auto_now / auto_now_add 필드를 잠시 비활성화하여 생성 시각을 기간 내에 분산시킬 수 있도록 합니다.
+    """
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    originals = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in originals:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large, reproducible dataset for load testing with chunked bulk_create "
+        "(optionally Postgres COPY and multiple worker processes for messages / notifications)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=scale, default=10000, help="게스트 유저 수 (예: 1e6)")
+        parser.add_argument("--experts", type=scale, default=500, help="전문가 수 (예: 5e4)")
+        parser.add_argument("--requests", type=scale, default=None, help="견적 요청 수 (기본: 게스트 유저 수)")
+        parser.add_argument("--fanout", type=int, default=3, help="견적 요청 당 요청을 받는 전문가 수")
+        parser.add_argument("--careers", type=int, default=2, help="전문가 당 경력 수")
+        parser.add_argument("--messages", type=scale, default=100000, help="전체 채팅 메시지 수 (예: 1e7)")
+        parser.add_argument("--notifications", type=scale, default=100000, help="전체 알림 수")
+        parser.add_argument("--days", type=int, default=365, help="생성 시각을 분산시킬 기간 (일)")
+        parser.add_argument("--seed", type=int, default=0, help="random seed (같은 seed 는 같은 데이터를 생성)")
+        parser.add_argument("--chunk-size", type=int, default=10000, help="bulk_create / COPY 한 번에 넣을 행 수")
+        parser.add_argument("--workers", type=int, default=1, help="메시지/알림 생성 워커 프로세스 수")
+        parser.add_argument("--copy", action="store_true", help="메시지/알림을 Postgres COPY 로 적재")
+
+    def handle(self, *args, **options):
+        if (options["copy"] or options["workers"] > 1) and connection.vendor != "postgresql":
+            raise CommandError("--copy 와 --workers 는 PostgreSQL 에서만 사용할 수 있습니다.")
+
+        self.options = options
+        self.seed = options["seed"]
+        self.chunk_size = max(options["chunk_size"], 1)
+        self.now = timezone.now()
+        self.window = timedelta(days=options["days"]).total_seconds()
+        if User.objects.filter(email=self.user_email(0)).exists():
+            raise CommandError(f"seed={self.seed} 로 생성된 데이터가 이미 있습니다. 다른 --seed 를 사용하세요.")
+        self.build_text_pool()
+        self.stats = []
+
+        started = time.perf_counter()
+        with explicit_timestamps(
+            User,
+            Expert,
+            EstimationsRequest,
+            RequestManager,
+            Estimation,
+            Reservation,
+            Review,
+            ChatRoom,
+            Message,
+            Notification,
+        ):
+            self.generate()
+        call_command("rebuild_expert_ratings")
+
+        self.print_stats(time.perf_counter() - started)
+
+    def build_text_pool(self):
+        # 행마다 Faker 를 호출하면 느리므로 seed 고정 후 미리 만든 문장 풀에서 선택
+        fake = Faker("ko_KR")
+        fake.seed_instance(self.seed)
+        self.names = [fake.name() for _ in range(500)]
+        self.sentences = [fake.sentence() for _ in range(500)]
+        self.paragraphs = [fake.paragraph(nb_sentences=3) for _ in range(200)]
+
+    def user_email(self, index):
+        return f"load-{self.seed}-{index}@example.com"
+
+    def rng(self, name, chunk_index):
+        # chunk 단위 seed - 워커 수나 실행 순서와 관계없이 같은 데이터가 생성됨 (시각은 실행 시점 기준 상대값)
+        return random.Random(f"{self.seed}:{name}:{chunk_index}")
+
+    def random_past(self, rng):
+        return self.now - timedelta(seconds=rng.random() * self.window)
+
+    def generate(self):
+        options = self.options
+        guest_count = options["users"]
+        expert_count = options["experts"]
+        request_count = options["requests"] if options["requests"] is not None else guest_count
+        if guest_count < 1 or expert_count < 1:
+            raise CommandError("--users 와 --experts 는 1 이상이어야 합니다.")
+
+        user_ids = self.bulk_step("users", User, guest_count + expert_count, self.build_users)
+        guest_ids, expert_user_ids = user_ids[:guest_count], user_ids[guest_count:]
+
+        expert_ids = self.bulk_step(
+            "experts", Expert, expert_count, lambda rng, start, end: self.build_experts(rng, expert_user_ids[start:end])
+        )
+        expert_user_by_id = dict(zip(expert_ids, expert_user_ids))
+        # bulk_create 는 post_save 를 발생시키지 않으므로 정규화 인덱스 테이블을 직접 생성
+        self.bulk_step(
+            "expert_areas",
+            ExpertServiceArea,
+            expert_count,
+            lambda rng, start, end: self.build_index_rows(
+                ExpertServiceArea, "expert_id", "area", Expert, "available_location", expert_ids[start:end]
+            ),
+            collect=None,
+        )
+        self.bulk_step(
+            "careers",
+            Career,
+            expert_count * options["careers"],
+            lambda rng, start, end: self.build_careers(rng, expert_ids, start, end),
+            collect=None,
+        )
+        requests = self.bulk_step(
+            "requests",
+            EstimationsRequest,
+            request_count,
+            lambda rng, start, end: self.build_requests(rng, guest_ids, start, end),
+            collect=lambda request: (request.pk, request.user_id),
+        )
+        request_ids = [request_id for request_id, _ in requests]
+        self.bulk_step(
+            "request_services",
+            RequestService,
+            request_count,
+            lambda rng, start, end: self.build_index_rows(
+                RequestService, "request_id", "service", EstimationsRequest, "service_list", request_ids[start:end]
+            ),
+            collect=None,
+        )
+        self.bulk_step(
+            "request_managers",
+            RequestManager,
+            request_count * options["fanout"],
+            lambda rng, start, end: self.build_request_managers(rng, request_ids, expert_ids, start, end),
+            collect=None,
+        )
+        # 견적 요청 당 견적 하나 - 채팅방(request 는 OneToOne)도 견적 당 하나씩 생성
+        estimations = self.bulk_step(
+            "estimations",
+            Estimation,
+            request_count,
+            lambda rng, start, end: self.build_estimations(rng, requests[start:end], expert_ids),
+            collect=lambda estimation: (estimation.pk, estimation.request_id, estimation.expert_id),
+        )
+        # 견적의 절반은 예약으로, 완료된 예약은 리뷰로 이어짐
+        reservation_estimation_ids = [estimation_id for estimation_id, _, _ in estimations[::2]]
+        completed_reservation_ids = [
+            reservation_id
+            for reservation_id in self.bulk_step(
+                "reservations",
+                Reservation,
+                len(reservation_estimation_ids),
+                lambda rng, start, end: self.build_reservations(rng, reservation_estimation_ids[start:end]),
+                collect=lambda reservation: reservation.pk if reservation.status == "completed" else None,
+            )
+            if reservation_id is not None
+        ]
+        self.bulk_step(
+            "reviews",
+            Review,
+            len(completed_reservation_ids),
+            lambda rng, start, end: self.build_reviews(rng, completed_reservation_ids[start:end]),
+            collect=None,
+        )
+
+        request_user_by_id = dict(requests)
+        room_rows = [
+            (request_id, request_user_by_id[request_id], expert_id) for _, request_id, expert_id in estimations
+        ]
+        room_ids = self.bulk_step(
+            "chat_rooms", ChatRoom, len(room_rows), lambda rng, start, end: self.build_rooms(room_rows[start:end])
+        )
+        room_participants = {
+            room_id: (user_id, expert_user_by_id[expert_id])
+            for room_id, (_, user_id, expert_id) in zip(room_ids, room_rows)
+        }
+
+        _worker_state.update(
+            {"command": self, "room_ids": room_ids, "room_participants": room_participants, "user_ids": user_ids}
+        )
+        try:
+            self.leaf_step("messages", Message, options["messages"], "build_messages")
+            self.bulk_step(
+                "read_cursors",
+                ChatReadCursor,
+                len(room_ids),
+                lambda rng, start, end: self.build_read_cursors(rng, room_ids[start:end], room_participants),
+                collect=None,
+            )
+            self.ensure_notification_partitions()
+            self.leaf_step("notifications", Notification, options["notifications"], "build_notifications")
+        finally:
+            _worker_state.clear()
+
+    # ------------------------------------------------------------------
+    # 단계 실행
+    # ------------------------------------------------------------------
+
+    def chunks(self, total):
+        for chunk_index, start in enumerate(range(0, total, self.chunk_size)):
+            yield chunk_index, start, min(start + self.chunk_size, total)
+
+    def bulk_step(self, name, model, total, build, collect=lambda obj: obj.pk):
+        """
+        chunk 단위 bulk_create - 다음 단계에서 사용할 값(기본: id) 목록을 반환
+        """
+        started = time.perf_counter()
+        collected = []
+        # builder 가 걸러낸 행(읽음 위치 없는 참여자 등)이 있으므로 요청한 수가 아닌 실제로 넣은 행 수를 기록
+        inserted = 0
+        for chunk_index, start, end in self.chunks(total):
+            objects = model.objects.bulk_create(build(self.rng(name, chunk_index), start, end))
+            inserted += len(objects)
+            if collect is not None:
+                collected.extend(collect(obj) for obj in objects)
+        self.record(name, inserted, time.perf_counter() - started)
+        return collected
+
+    def leaf_step(self, name, model, total, builder_name):
+        """
+        다른 테이블이 참조하지 않는 대용량 테이블 - 워커 프로세스로 나누어 bulk_create 또는 COPY
+        """
+        if total <= 0:
+            return
+        started = time.perf_counter()
+        tasks = [(name, model._meta.label, builder_name, chunk) for chunk in self.chunks(total)]
+        workers = max(self.options["workers"], 1)
+        if workers > 1:
+            # fork 전에 연결을 닫아 각 워커가 자신의 DB 연결을 사용하도록 함
+            connections.close_all()
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                pool.map(_run_leaf_chunk, tasks)
+        else:
+            for task in tasks:
+                _run_leaf_chunk(task)
+        self.record(name, total, time.perf_counter() - started)
+
+    def ensure_notification_partitions(self):
+        # 과거 시각의 알림이 기본 파티션에 쌓이지 않도록 생성 기간의 첫 월부터 월 파티션을 미리 만듦
+        if not is_partitioned(connection):
+            return
+        oldest = self.now - timedelta(seconds=self.window)
+        months_ahead = getattr(settings, "NOTIFICATION_PARTITION_MONTHS_AHEAD", 3)
+        for name in ensure_partitions(connection, oldest, months_ahead):
+            self.stdout.write(f"파티션 생성: {name}")
+
+    def insert_leaf_rows(self, model, rows):
+        if not self.options["copy"]:
+            model.objects.bulk_create([model(**row) for row in rows])
+            return
+        # COPY 는 Django 필드 기본값(빈 이미지, JSON 등)을 채우지 않으므로 행에 없는 컬럼은 기본값으로 넣음
+        fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+        defaults = {field.attname: field.get_default() for field in fields if field.attname not in rows[0]}
+        sql = f"COPY {model._meta.db_table} ({', '.join(field.column for field in fields)}) FROM STDIN"
+        with connection.cursor() as cursor:
+            with cursor.cursor.copy(sql) as copy:
+                for row in rows:
+                    row = {**defaults, **row}
+                    copy.write_row([field.get_db_prep_save(row[field.attname], connection) for field in fields])
+
+    def record(self, name, rows, seconds):
+        self.stats.append((name, rows, seconds))
+        rate = rows / seconds if seconds else 0
+        self.stdout.write(f"{name:>17}: {rows:>12,} rows {seconds:>9.2f}s {rate:>12,.0f} rows/s")
+
+    def print_stats(self, elapsed):
+        total_rows = sum(rows for _, rows, _ in self.stats)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{total_rows:,} rows in {elapsed:.2f}s ({total_rows / elapsed if elapsed else 0:,.0f} rows/s), "
+                f"seed={self.seed}"
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # 행 생성
+    # ------------------------------------------------------------------
+
+    def build_users(self, rng, start, end):
+        return [
+            User(
+                email=self.user_email(index),
+                password=UNUSABLE_PASSWORD_PREFIX,
+                name=rng.choice(self.names),
+                gender=rng.choice(GENDER_CHOICES)[0],
+                phone_number=f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            )
+            for index in range(start, end)
+        ]
+
+    def build_experts(self, rng, user_ids):
+        return [
+            Expert(
+                user_id=user_id,
+                service=rng.choice(SERVICE_CHOICES)[0],
+                standard_charge=rng.randint(100000, 900000),
+                available_location=rng.choice(AREA_CHOICES)[0],
+                appeal=rng.choice(self.paragraphs),
+                create_at=self.random_past(rng),
+            )
+            for user_id in user_ids
+        ]
+
+    def build_careers(self, rng, expert_ids, start, end):
+        careers_per_expert = self.options["careers"]
+        careers = []
+        for index in range(start, end):
+            start_date = self.random_past(rng).date()
+            careers.append(
+                Career(
+                    expert_id=expert_ids[index // careers_per_expert],
+                    title=rng.choice(self.sentences)[:20],
+                    description=rng.choice(self.paragraphs),
+                    start_date=start_date,
+                    end_date=start_date + timedelta(days=rng.randint(30, 3000)),
+                )
+            )
+        return careers
+
+    def build_requests(self, rng, guest_ids, start, end):
+        requests = []
+        for _ in range(start, end):
+            created_at = self.random_past(rng)
+            requests.append(
+                EstimationsRequest(
+                    user_id=rng.choice(guest_ids),
+                    service_list=rng.sample([choice for choice, _ in SERVICE_CHOICES], rng.randint(1, 2)),
+                    prefer_gender=rng.choice(GENDER_CHOICES)[0],
+                    location=rng.choice(AREA_CHOICES)[0],
+                    wedding_hall=rng.choice(self.sentences)[:50],
+                    wedding_datetime=created_at + timedelta(days=rng.randint(30, 365)),
+                    status=rng.choice(REQUEST_STATUS_CHOICES)[0],
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        return requests
+
+    def build_index_rows(self, index_model, owner_id_field, value_field, owner_model, source_attr, owner_ids):
+        rows = owner_model.objects.filter(pk__in=owner_ids).values_list("pk", source_attr)
+        return [
+            index_model(**{owner_id_field: owner_id, value_field: value})
+            for owner_id, values in rows
+            for value in set(split_choices(values))
+        ]
+
+    def build_request_managers(self, rng, request_ids, expert_ids, start, end):
+        fanout = self.options["fanout"]
+        managers = []
+        for index in range(start, end):
+            created_at = self.random_past(rng)
+            managers.append(
+                RequestManager(
+                    expert_id=rng.choice(expert_ids),
+                    request_id=request_ids[index // fanout],
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        return managers
+
+    def build_estimations(self, rng, requests, expert_ids):
+        estimations = []
+        for request_id, _ in requests:
+            created_at = self.random_past(rng)
+            estimations.append(
+                Estimation(
+                    request_id=request_id,
+                    expert_id=rng.choice(expert_ids),
+                    service=rng.choice(SERVICE_CHOICES)[0],
+                    location=rng.choice(AREA_CHOICES)[0],
+                    due_date=(created_at + timedelta(days=rng.randint(1, 365))).date(),
+                    charge=rng.randint(100000, 900000),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        return estimations
+
+    def build_reservations(self, rng, estimation_ids):
+        reservations = []
+        for estimation_id in estimation_ids:
+            created_at = self.random_past(rng)
+            reservations.append(
+                Reservation(
+                    estimation_id=estimation_id,
+                    status=rng.choice(RESERVATION_STATUS_CHOICES)[0],
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        return reservations
+
+    def build_reviews(self, rng, reservation_ids):
+        reviews = []
+        for reservation_id in reservation_ids:
+            created_at = self.random_past(rng)
+            reviews.append(
+                Review(
+                    reservation_id=reservation_id,
+                    content=rng.choice(self.paragraphs),
+                    rating=rng.choice(RATING_CHOICES)[0],
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        return reviews
+
+    def build_rooms(self, room_rows):
+        return [
+            ChatRoom(request_id=request_id, user_id=user_id, expert_id=expert_id)
+            for request_id, user_id, expert_id in room_rows
+        ]
+
+    def build_messages(self, rng, start, end):
+        room_ids = _worker_state["room_ids"]
+        room_participants = _worker_state["room_participants"]
+        rows = []
+        for _ in range(start, end):
+            room_id = rng.choice(room_ids)
+            rows.append(
+                {
+                    "room_id": room_id,
+                    "sender_id": rng.choice(room_participants[room_id]),
+                    "content": rng.choice(self.sentences),
+                    "timestamp": self.random_past(rng),
+                }
+            )
+        return rows
+
+    def build_read_cursors(self, rng, room_ids, room_participants):
+        """
+        참여자 대부분(90%)은 채팅방의 마지막 메시지까지 읽은 상태, 나머지는 읽음 위치 없음 (받은 메시지 전체가 안 읽음)
+        """
+        last_message = Message.objects.filter(room=OuterRef("pk")).order_by("-timestamp", "-id")
+        rooms = (
+            ChatRoom.objects.filter(id__in=room_ids)
+            .annotate(
+                last_id=Subquery(last_message.values("id")[:1]),
+                last_at=Subquery(last_message.values("timestamp")[:1]),
+            )
+            .filter(last_id__isnull=False)
+            .values_list("id", "last_id", "last_at")
+        )
+        return [
+            ChatReadCursor(room_id=room_id, user_id=user_id, last_read_message_id=last_id, last_read_at=last_at)
+            for room_id, last_id, last_at in rooms
+            for user_id in set(room_participants[room_id])
+            if rng.random() < 0.9
+        ]
+
+    def build_notifications(self, rng, start, end):
+        user_ids = _worker_state["user_ids"]
+        return [
+            {
+                "receiver_id": rng.choice(user_ids),
+                "notification_type": rng.choice(NOTIFICATION_TYPE_CHOICES)[0],
+                # 종류와 관계없이 템플릿이 참조하는 id 와 미리보기 값 (제목/내용은 조회 시 렌더링)
+                "payload": {
+                    "user_id": rng.choice(user_ids),
+                    "sender_id": rng.choice(user_ids),
+                    "content": rng.choice(self.sentences)[:100],
+                },
+                "is_read": rng.random() < 0.8,
+                "created_at": self.random_past(rng),
+            }
+            for _ in range(start, end)
+        ]
+
+
+def _run_leaf_chunk(task):
+    name, model_label, builder_name, (chunk_index, start, end) = task
+    command = _worker_state["command"]
+    model = next(model for model in (Message, Notification) if model._meta.label == model_label)
+    rows = getattr(command, builder_name)(command.rng(name, chunk_index), start, end)
+    command.insert_leaf_rows(model, rows)
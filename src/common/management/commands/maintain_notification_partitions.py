@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from notifications.partitions import (
+    archive_partition,
+    create_partition,
+    default_partition_months,
+    detach_partition,
+    drop_partition,
+    ensure_partitions,
+    expired_partitions,
+    invalidate_unread_counts,
+    is_partitioned,
+    month_partitions,
+    prune_default_partition,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintain the monthly Notification partitions: create upcoming partitions and drop partitions past the "
+        "retention period as a whole (DETACH + DROP instead of DELETE), optionally archiving them first. "
+        "Unread notifications newer than the unread retention period are kept in the default partition."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=getattr(settings, "NOTIFICATION_RETENTION_DAYS", 90),
+            help="읽은 알림 보관 기간(일) - 모든 행이 이 기간을 지난 월 파티션을 삭제",
+        )
+        parser.add_argument(
+            "--unread-retention-days",
+            type=int,
+            default=getattr(settings, "NOTIFICATION_UNREAD_RETENTION_DAYS", 365),
+            help="읽지 않은 알림 보관 기간(일) - 삭제할 파티션의 읽지 않은 알림 중 이 기간 이내는 기본 파티션으로 옮겨 보관",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=getattr(settings, "NOTIFICATION_PARTITION_MONTHS_AHEAD", 3),
+            help="미리 만들어 둘 이후 월 파티션 수",
+        )
+        parser.add_argument(
+            "--archive", action="store_true", help="삭제 전 파티션을 gzip CSV 로 저장소(default_storage)에 내보내기"
+        )
+        parser.add_argument(
+            "--partition-default",
+            action="store_true",
+            help="기본 파티션에 월 단위로 들어간 행을 해당 월 파티션으로 옮긴 후 파티션 단위로 정리",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="변경 없이 만들/삭제할 파티션만 출력")
+
+    def handle(self, *args, **options):
+        if not is_partitioned(connection):
+            print("알림 테이블이 파티션 테이블이 아닙니다. (Postgres 에서 notifications 0009 마이그레이션 필요)")
+            return
+        if options["unread_retention_days"] < options["retention_days"]:
+            raise CommandError("--unread-retention-days 는 --retention-days 이상이어야 합니다.")
+
+        # 월 파티션 없이 기본 파티션에 통째로 들어간 월은 행 단위 DELETE 로 정리되므로 경고 (또는 월 파티션으로 이동)
+        misplaced = default_partition_months(connection)
+        if misplaced and not (options["partition_default"] and not options["dry_run"]):
+            months = ", ".join(f"{month:%Y-%m}({count}개)" for month, count in misplaced.items())
+            print(
+                f"경고: 기본 파티션에 월 단위 알림이 있습니다: {months} - "
+                "--partition-default 로 월 파티션으로 옮기지 않으면 행 단위로 삭제됩니다."
+            )
+        elif misplaced:
+            for month in misplaced:
+                print(f"기본 파티션 -> 파티션 이동: {create_partition(connection, month)}")
+
+        now = timezone.now()
+        read_cutoff = now - timedelta(days=options["retention_days"])
+        unread_cutoff = now - timedelta(days=options["unread_retention_days"])
+        expired = expired_partitions(month_partitions(connection), read_cutoff)
+        # 이전 실행에서 분리 후 삭제되지 못한 파티션도 이어서 처리
+        leftovers = sorted(month_partitions(connection, attached=False).values())
+
+        if options["dry_run"]:
+            print(f"보관 기준: 읽은 알림 {read_cutoff:%Y-%m-%d} 이전, 읽지 않은 알림 {unread_cutoff:%Y-%m-%d} 이전")
+            print(f"삭제할 파티션: {', '.join(expired + leftovers) or '없음'}")
+            return
+
+        for name in ensure_partitions(connection, now, options["months_ahead"]):
+            print(f"파티션 생성: {name}")
+
+        for name in expired:
+            kept, receiver_ids = detach_partition(connection, name, unread_cutoff)
+            invalidate_unread_counts(receiver_ids)
+            print(f"파티션 분리: {name} (읽지 않은 알림 {kept}개는 기본 파티션에 보관)")
+
+        for name in expired + leftovers:
+            if options["archive"]:
+                path = archive_partition(
+                    connection, name, getattr(settings, "NOTIFICATION_ARCHIVE_PREFIX", "archives/notifications/")
+                )
+                print(f"파티션 보관: {name} -> {path}")
+            drop_partition(connection, name)
+            print(f"파티션 삭제: {name}")
+
+        deleted, receiver_ids = prune_default_partition(connection, read_cutoff, unread_cutoff)
+        invalidate_unread_counts(receiver_ids)
+        print(f"기본 파티션 정리: {deleted}개 삭제")
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from users.tokens import revoke_refresh_jti
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy unexpired BlacklistedToken rows into the cache-backed revocation store and empty the "
+        "OutstandingToken/BlacklistedToken tables. Run once after deploying RevocableRefreshToken; "
+        "the token_blacklist app can be removed from INSTALLED_APPS afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep-tables", action="store_true", help="복사만 하고 테이블 행은 삭제하지 않음")
+        parser.add_argument("--batch-size", type=int, default=1000, help="조회 배치 크기")
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        # 만료된 토큰은 서명 검증에서 거부되므로 옮길 필요 없음
+        blacklisted = (
+            BlacklistedToken.objects.filter(token__expires_at__gt=now)
+            .values_list("token__jti", "token__expires_at")
+            .iterator(chunk_size=options["batch_size"])
+        )
+
+        copied = 0
+        for jti, expires_at in blacklisted:
+            revoke_refresh_jti(jti, expires_at.timestamp())
+            copied += 1
+        print(f"Copied {copied} revoked refresh tokens to the cache.")
+
+        if not options["keep_tables"]:
+            # BlacklistedToken 은 OutstandingToken 삭제 시 cascade 로 함께 삭제됨
+            deleted, _ = OutstandingToken.objects.all().delete()
+            print(f"Deleted {deleted} token rows.")
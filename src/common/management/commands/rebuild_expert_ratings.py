@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.models import ExpertRating, Review
+
+
+class Command(BaseCommand):
+    help = "Rebuild ExpertRating summaries from the Review table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="bulk_create batch size")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        # 전문가별 리뷰 집계를 한 번의 GROUP BY 쿼리로 계산
+        aggregated_rows = (
+            Review.objects.values("reservation__estimation__expert_id")
+            .order_by()
+            .annotate(**ExpertRating.aggregate_fields())
+        )
+
+        summaries = [
+            ExpertRating(expert_id=row["reservation__estimation__expert_id"], **ExpertRating.build_defaults(row))
+            for row in aggregated_rows
+        ]
+
+        with transaction.atomic():
+            ExpertRating.objects.all().delete()
+            ExpertRating.objects.bulk_create(summaries, batch_size=batch_size)
+
+        print(f"Rebuilt rating summaries for {len(summaries)} experts.")
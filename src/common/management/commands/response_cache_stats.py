@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+
+from common.response_cache import get_stats, stats_key
+
+
+class Command(BaseCommand):
+    help = "Print response cache hit/miss counters per cached view."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="출력 후 카운터 초기화")
+
+    def handle(self, *args, **options):
+        # URLconf 를 불러와야 캐시를 사용하는 view 클래스가 모두 등록됨
+        get_resolver().url_patterns
+        stats = get_stats()
+
+        for view_name, counts in stats.items():
+            total = counts["hit"] + counts["miss"]
+            hit_rate = counts["hit"] / total * 100 if total else 0
+            self.stdout.write(f"{view_name}: hit={counts['hit']} miss={counts['miss']} hit_rate={hit_rate:.1f}%")
+
+        if options["reset"]:
+            cache.delete_many([stats_key(view_name, result) for view_name in stats for result in ("hit", "miss")])
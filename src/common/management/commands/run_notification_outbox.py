@@ -0,0 +1,151 @@
+import asyncio
+import random
+import time
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from common.logging_config import logger
+from notifications.models import NotificationOutbox
+from notifications.rendering import render_payloads
+
+
+class Command(BaseCommand):
+    help = (
+        "Drain NotificationOutbox events to the channel layer in batches. "
+        "Delivery is at-least-once: an event is deleted only after group_send succeeds, "
+        "and events claimed by a crashed worker become available again after the lease expires."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200, help="한 번에 가져와 전송할 이벤트 수")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="대기 이벤트가 없을 때 대기 시간(초)")
+        parser.add_argument(
+            "--lease-seconds", type=int, default=30, help="가져간 이벤트를 다른 워커가 가져가지 않는 시간(초)"
+        )
+        parser.add_argument("--max-attempts", type=int, default=10, help="전송 실패 시 최대 재시도 횟수")
+        parser.add_argument("--metrics-interval", type=float, default=30.0, help="큐 지표 로그 주기(초)")
+        parser.add_argument("--once", action="store_true", help="대기 중인 이벤트를 모두 전송한 후 종료")
+        parser.add_argument("--stats", action="store_true", help="큐 지표만 출력하고 종료")
+
+    def handle(self, *args, **options):
+        self.batch_size = options["batch_size"]
+        self.poll_interval = options["poll_interval"]
+        self.lease_seconds = options["lease_seconds"]
+        self.max_attempts = options["max_attempts"]
+        self.metrics_interval = options["metrics_interval"]
+
+        if options["stats"]:
+            for name, value in self.collect_metrics().items():
+                print(f"{name}: {value}")
+            return
+
+        async_to_sync(self.run)(options["once"])
+
+    async def run(self, once):
+        channel_layer = get_channel_layer()
+        last_metrics_at = 0.0
+
+        while True:
+            delivered = await self.drain_once(channel_layer)
+
+            if time.monotonic() - last_metrics_at >= self.metrics_interval:
+                metrics = await database_sync_to_async(self.collect_metrics)()
+                logger.info(f"Notification outbox metrics - {metrics}")
+                last_metrics_at = time.monotonic()
+
+            if delivered:
+                continue
+            if once:
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    async def drain_once(self, channel_layer):
+        events = await database_sync_to_async(self.claim_batch)()
+        if not events:
+            return 0
+
+        results = await asyncio.gather(
+            *[channel_layer.group_send(event.group_name, event.payload) for event in events],
+            return_exceptions=True,
+        )
+        delivered = [event for event, result in zip(events, results) if not isinstance(result, Exception)]
+        failed = [(event, result) for event, result in zip(events, results) if isinstance(result, Exception)]
+
+        await database_sync_to_async(self.complete_batch)(delivered, failed)
+        return len(delivered)
+
+    def claim_batch(self):
+        """
+        전송 가능한 이벤트를 가져오고 lease 시간 동안 다른 워커가 가져가지 못하도록 available_at 을 미룹니다.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            events = list(
+                NotificationOutbox.objects.select_for_update(skip_locked=True)
+                .filter(available_at__lte=now, attempts__lt=self.max_attempts)
+                .order_by("available_at", "id")[: self.batch_size]
+            )
+            if events:
+                NotificationOutbox.objects.filter(id__in=[event.id for event in events]).update(
+                    available_at=now + timedelta(seconds=self.lease_seconds)
+                )
+        self.render_batch(events)
+        return events
+
+    def render_batch(self, events):
+        """
+        저장된 payload 로 제목/내용을 렌더링하여 전송할 이벤트에 채웁니다. (DB 에 저장하지 않음)
+        배치 전체의 유저/전문가 이름을 한 번에 조회합니다.
+        """
+        notifications = [event.payload["notification"] for event in events]
+        rendered = render_payloads(
+            [(notification["notification_type"], notification.get("payload", {})) for notification in notifications]
+        )
+        for notification, (title, message) in zip(notifications, rendered):
+            notification.setdefault("title", title)
+            notification.setdefault("message", message)
+
+    def complete_batch(self, delivered, failed):
+        now = timezone.now()
+
+        if delivered:
+            NotificationOutbox.objects.filter(id__in=[event.id for event in delivered]).delete()
+            max_lag = max((now - event.created_at).total_seconds() for event in delivered)
+            logger.debug(f"Delivered {len(delivered)} notification events (max lag {max_lag:.3f}s)")
+
+        if failed:
+            for event, error in failed:
+                event.attempts += 1
+                # 지수 백오프 + 지터 (최대 5분)
+                backoff = min(2**event.attempts, 300) + random.uniform(0, 1)
+                event.available_at = now + timedelta(seconds=backoff)
+                event.last_error = str(error)[:500]
+                logger.error(f"Notification event {event.id} delivery failed (attempt {event.attempts}): {error}")
+            NotificationOutbox.objects.bulk_update(
+                [event for event, _ in failed], ["attempts", "available_at", "last_error"]
+            )
+
+    def collect_metrics(self):
+        """
+        queue_depth: 전송 대기 중인 이벤트 수
+        delivery_lag_seconds: 가장 오래된 대기 이벤트가 기록된 후 지난 시간
+        dead_letters: 최대 재시도 횟수를 초과하여 더 이상 전송하지 않는 이벤트 수
+        """
+        pending = NotificationOutbox.objects.filter(attempts__lt=self.max_attempts).aggregate(
+            queue_depth=Count("id"), oldest_created_at=Min("created_at")
+        )
+        oldest_created_at = pending["oldest_created_at"]
+        return {
+            "queue_depth": pending["queue_depth"],
+            "delivery_lag_seconds": (
+                round((timezone.now() - oldest_created_at).total_seconds(), 3) if oldest_created_at else 0.0
+            ),
+            "dead_letters": NotificationOutbox.objects.filter(attempts__gte=self.max_attempts).count(),
+        }
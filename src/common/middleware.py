@@ -0,0 +1,214 @@
+# common/middleware.py
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from common.db_router import end_routing, replica_alias, start_routing
+from common.logging_config import logger
+
+# SQL 의 리터럴 값과 IN (...) 목록을 제거하여 같은 형태의 쿼리를 하나의 fingerprint 로 묶기 위한 패턴
+_IN_LIST_PATTERN = re.compile(r"\bIN\s*\((?:\s*%s\s*,?)+\)", re.IGNORECASE)
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def sql_fingerprint(sql):
+    sql = _IN_LIST_PATTERN.sub("IN (...)", sql)
+    sql = _STRING_LITERAL_PATTERN.sub("?", sql)
+    sql = _NUMBER_LITERAL_PATTERN.sub("?", sql)
+    return _WHITESPACE_PATTERN.sub(" ", sql).strip()
+
+
+class QueryBudgetExceeded(Exception):
+    """QUERY_BUDGET_STRICT 설정 시 view 가 선언한 query_budget 을 초과하면 발생"""
+
+
+class QueryStats:
+    """
+    connection.execute_wrapper 로 등록되어 요청 동안 실행된 쿼리 수, DB 시간, 중복 쿼리를 기록합니다.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.fingerprints[sql_fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self):
+        # 같은 fingerprint 가 2번 이상 실행된 쿼리 (N+1 의심)
+        return {fingerprint: count for fingerprint, count in self.fingerprints.items() if count > 1}
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "db_time_ms": round(self.duration * 1000, 2),
+            "duplicate_count": sum(count - 1 for count in self.duplicates.values()),
+            "duplicates": self.duplicates,
+        }
+
+
+class QueryBudgetMiddleware:
+    """
+    요청 별 쿼리 수 / 중복 SQL / DB 시간 기록
+    - view 클래스의 query_budget 속성(int 또는 메서드 별 dict, 없으면 QUERY_BUDGET_DEFAULT)을 예산으로 사용
+    - DEBUG: X-Query-* 응답 헤더로 노출
+    - 운영: 예산 초과 또는 중복 쿼리가 QUERY_DUPLICATE_THRESHOLD 이상이면 JSON 구조화 로그 기록
+    - QUERY_BUDGET_STRICT: 예산 초과 시 QueryBudgetExceeded 발생 (테스트용)
+    - 결과는 response.query_stats 로도 접근할 수 있습니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = QueryStats()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+
+        budget = getattr(request, "query_budget", getattr(settings, "QUERY_BUDGET_DEFAULT", None))
+        query_stats = {**stats.as_dict(), "budget": budget}
+        response.query_stats = query_stats
+        over_budget = budget is not None and stats.count > budget
+
+        if settings.DEBUG:
+            response["X-Query-Count"] = str(query_stats["count"])
+            response["X-Query-Time-Ms"] = str(query_stats["db_time_ms"])
+            response["X-Query-Duplicates"] = str(query_stats["duplicate_count"])
+            if budget is not None:
+                response["X-Query-Budget"] = str(budget)
+        elif over_budget or query_stats["duplicate_count"] >= getattr(settings, "QUERY_DUPLICATE_THRESHOLD", 5):
+            logger.warning(
+                json.dumps(
+                    {
+                        "event": "query_budget",
+                        "method": request.method,
+                        "path": request.path,
+                        "view": getattr(request, "query_budget_view", None),
+                        "status": response.status_code,
+                        **query_stats,
+                    },
+                    ensure_ascii=False,
+                )
+            )
+
+        if over_budget and getattr(settings, "QUERY_BUDGET_STRICT", False):
+            raise QueryBudgetExceeded(
+                f"{request.method} {request.path} executed {stats.count} queries (budget {budget}): "
+                f"{json.dumps(query_stats['duplicates'], ensure_ascii=False)}"
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        budget = getattr(view_class, "query_budget", None)
+        # {"GET": 3, "DELETE": 6} 처럼 HTTP 메서드 별 예산도 선언할 수 있음
+        if isinstance(budget, dict):
+            budget = budget.get(request.method)
+        if budget is not None:
+            request.query_budget = budget
+            request.query_budget_view = view_class.__name__
+        return None
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def sticky_client_key(request):
+    # 같은 클라이언트를 구분하는 값 (JWT 또는 admin 세션) - 익명 요청은 쓰기 후 다시 읽을 데이터가 없으므로 구분하지 않음
+    credential = request.META.get("HTTP_AUTHORIZATION") or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not credential:
+        return None
+    return f"db:sticky:{hashlib.sha256(credential.encode()).hexdigest()[:32]}"
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청 별 DB 라우팅 상태를 만들어 PrimaryReplicaRouter 가 조회를 복제본으로 보낼지 결정하게 합니다.
+    - 안전한 메서드의 요청만 복제본 사용
+    - 쓰기가 있었던 요청 이후 DATABASE_REPLICA_STICKY_SECONDS 동안 같은 클라이언트의 요청은 primary 사용
+      (복제 지연 때문에 방금 쓴 데이터가 목록/상세에서 사라져 보이지 않도록)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if replica_alias() is None:
+            return self.get_response(request)
+
+        sticky_key = sticky_client_key(request)
+        use_replica = request.method in SAFE_METHODS and not (sticky_key and cache.get(sticky_key))
+        token = start_routing(use_replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            state = end_routing(token)
+
+        if sticky_key and (state.wrote or request.method not in SAFE_METHODS):
+            cache.set(sticky_key, 1, getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 5))
+        return response
+
+
+def collect_pool_stats():
+    """
+    DB alias 별 psycopg 연결 풀 통계 (풀을 사용하지 않는 alias 는 제외)
+    - pool_size / pool_available / requests_waiting: 현재 상태
+    - requests_num / requests_queued / requests_wait_ms / requests_errors: 이전 수집 이후 누적 값 (수집 시 초기화)
+    """
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is not None:
+            stats[alias] = pool.pop_stats()
+    return stats
+
+
+class DatabasePoolMetricsMiddleware:
+    """
+    DB_POOL_METRICS_INTERVAL 초마다 워커의 연결 풀 통계를 JSON 구조화 로그로 기록합니다.
+    - 연결을 기다리는(requests_waiting, requests_queued) 요청이나 대기 시간 초과(requests_errors)가 있으면 포화로 보고 warning
+    - 풀은 워커(프로세스) 별로 따로 만들어지므로 통계도 워커 별 (pid 포함)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.last_logged = time.monotonic()
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        interval = getattr(settings, "DB_POOL_METRICS_INTERVAL", 60)
+        now = time.monotonic()
+        if interval is not None and now - self.last_logged >= interval:
+            self.last_logged = now
+            self.log_pool_stats()
+        return response
+
+    def log_pool_stats(self):
+        for alias, stats in collect_pool_stats().items():
+            saturated = any(
+                stats.get(name, 0) > 0 for name in ("requests_waiting", "requests_queued", "requests_errors")
+            )
+            log = logger.warning if saturated else logger.info
+            log(json.dumps({"event": "db_pool", "alias": alias, "pid": os.getpid(), "saturated": saturated, **stats}))
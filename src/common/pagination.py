@@ -0,0 +1,185 @@
+# common/pagination.py
+import base64
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from common.exceptions import BadRequestException
+
+
+class DefaultLimitOffsetPagination(LimitOffsetPagination):
+    """
+    프로젝트 기본 페이지네이션 (REST_FRAMEWORK DEFAULT_PAGINATION_CLASS)
+    - limit 은 max_limit 을 넘을 수 없습니다.
+    """
+
+    default_limit = 20
+    max_limit = 100
+
+
+class KeysetPagination(BasePagination):
+    """
+    (정렬 필드, id) 기준 keyset(cursor) 페이지네이션
+    - before=<cursor>: cursor 보다 이전(오래된) 항목 조회
+    - after=<cursor>: cursor 보다 이후(최신) 항목 조회
+    - 파라미터가 없으면 가장 최신 페이지를 조회
+    - 결과는 오래된 순(오름차순)으로 반환 (newest_first = True 이면 최신 순)
+    OFFSET 을 사용하지 않으므로 (필터, 정렬 필드, id) 복합 인덱스가 있으면 페이지 위치와 관계없이 조회 비용이 일정합니다.
+    """
+
+    ordering_field = "created_at"
+    page_size = 30
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    before_query_param = "before"
+    after_query_param = "after"
+    newest_first = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+
+        before = request.query_params.get(self.before_query_param)
+        after = request.query_params.get(self.after_query_param)
+        if before and after:
+            raise BadRequestException("before 와 after 는 함께 사용할 수 없습니다.")
+
+        field = self.ordering_field
+        if after:
+            position, pk = self.decode_cursor(after)
+            queryset = queryset.filter(
+                Q(**{f"{field}__gte": position}) & (Q(**{f"{field}__gt": position}) | Q(id__gt=pk))
+            ).order_by(field, "id")
+            rows = list(queryset[: page_size + 1])
+            self.has_newer = len(rows) > page_size
+            self.has_older = True
+            rows = rows[:page_size]
+        else:
+            if before:
+                position, pk = self.decode_cursor(before)
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lte": position}) & (Q(**{f"{field}__lt": position}) | Q(id__lt=pk))
+                )
+            rows = list(queryset.order_by(f"-{field}", "-id")[: page_size + 1])
+            self.has_older = len(rows) > page_size
+            self.has_newer = bool(before)
+            rows = list(reversed(rows[:page_size]))
+
+        self.page = rows
+        return list(reversed(rows)) if self.newest_first else rows
+
+    def get_page_size(self, request):
+        page_size = request.query_params.get(self.page_size_query_param)
+        if page_size is None:
+            return self.page_size
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            raise BadRequestException("page_size 는 정수여야 합니다.")
+        if page_size < 1:
+            raise BadRequestException("page_size 는 1 이상이어야 합니다.")
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, instance):
+        position = getattr(instance, self.ordering_field)
+        raw = f"{position.isoformat()}|{instance.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            position, pk = raw.rsplit("|", 1)
+            parsed_position = parse_datetime(position)
+            if parsed_position is None:
+                raise ValueError(position)
+            return parsed_position, int(pk)
+        except (ValueError, UnicodeDecodeError):
+            raise BadRequestException("유효하지 않은 cursor 입니다.", code="invalid_cursor")
+
+    def get_link(self, query_param, instance):
+        url = remove_query_param(self.base_url, self.before_query_param)
+        url = remove_query_param(url, self.after_query_param)
+        return replace_query_param(url, query_param, self.encode_cursor(instance))
+
+    def get_previous_link(self):
+        if not self.page or not self.has_older:
+            return None
+        return self.get_link(self.before_query_param, self.page[0])
+
+    def get_next_link(self):
+        if not self.page or not self.has_newer:
+            return None
+        return self.get_link(self.after_query_param, self.page[-1])
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("previous", self.get_previous_link()),
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "description": "이전(오래된) 페이지 링크 - before=<cursor>",
+                },
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "description": "다음(최신) 페이지 링크 - after=<cursor>",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.before_query_param,
+                "required": False,
+                "in": "query",
+                "description": "이 cursor 보다 이전(오래된) 항목을 조회합니다.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.after_query_param,
+                "required": False,
+                "in": "query",
+                "description": "이 cursor 보다 이후(최신) 항목을 조회합니다.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"페이지 크기 (최대 {self.max_page_size})",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class CreatedAtCursorPagination(KeysetPagination):
+    """
+    created_at 기준 시간순 리소스(알림, 리뷰 등) 페이지네이션 - 최신 순으로 반환
+    """
+
+    ordering_field = "created_at"
+    newest_first = True
+    page_size = 20
+    max_page_size = 100
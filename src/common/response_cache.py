@@ -0,0 +1,122 @@
+# common/response_cache.py
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import urlencode
+from rest_framework import status
+from rest_framework.response import Response
+
+from common.db_router import pin_to_primary
+
+# 캐시를 사용하는 view 이름 목록 (hit/miss 통계 조회용)
+CACHED_VIEWS = set()
+
+
+def tag_version_key(tag):
+    return f"response-cache:tag:{tag}"
+
+
+def stats_key(view_name, result):
+    return f"response-cache:stats:{view_name}:{result}"
+
+
+def invalidate_tags(*tags):
+    """
+    태그 버전을 올려 해당 태그가 붙은 응답 캐시를 모두 무효화 (이전 키는 만료 시 자연 삭제)
+    """
+    for tag in tags:
+        key = tag_version_key(tag)
+        # 버전 키가 없으면 add 로 생성 (동시에 생성된 경우 incr)
+        if not cache.add(key, 2, timeout=None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 2, timeout=None)
+
+
+def increment_stat(view_name, result):
+    key = stats_key(view_name, result)
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            pass
+
+
+def get_stats():
+    """
+    view 별 {"hit": n, "miss": n} 통계
+    """
+    keys = {stats_key(view_name, result) for view_name in CACHED_VIEWS for result in ("hit", "miss")}
+    values = cache.get_many(keys)
+    return {
+        view_name: {result: values.get(stats_key(view_name, result), 0) for result in ("hit", "miss")}
+        for view_name in sorted(CACHED_VIEWS)
+    }
+
+
+class CachedResponse(Exception):
+    """캐시 hit 시 handler 실행을 건너뛰기 위해 initial() 에서 발생 (handle_exception 에서 응답으로 변환)"""
+
+    def __init__(self, response):
+        self.response = response
+
+
+class CachedResponseMixin:
+    """
+    공개 조회 API 응답 캐시 (인증/권한 확인 이후에 조회)
+    - cache_tags: 응답이 의존하는 태그, view kwargs 로 format (예: "reviews:{expert_id}")
+    - 키: view 이름 + host + 정렬된 query params + 태그 버전 -> 태그 버전이 오르면 이전 응답은 더 이상 조회되지 않음
+    - 200 응답만 캐시하며 X-Cache 헤더로 HIT / MISS 를 표시
+    """
+
+    cache_timeout = 60 * 5
+    cache_tags = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        CACHED_VIEWS.add(cls.__name__)
+
+    def should_cache_response(self, request):
+        return request.method == "GET" and getattr(settings, "RESPONSE_CACHE_ENABLED", True)
+
+    def get_cache_tags(self):
+        return [tag.format(**self.kwargs) for tag in self.cache_tags]
+
+    def get_response_cache_key(self, request):
+        tags = self.get_cache_tags()
+        versions = cache.get_many([tag_version_key(tag) for tag in tags])
+        version = ",".join(f"{tag}={versions.get(tag_version_key(tag), 1)}" for tag in tags)
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        raw = f"{request.get_host()}|{request.path}|{query}|{version}"
+        return f"response-cache:{type(self).__name__}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.response_cache_key = None
+        if not self.should_cache_response(request):
+            return
+
+        self.response_cache_key = self.get_response_cache_key(request)
+        cached = cache.get(self.response_cache_key)
+        if cached is not None:
+            increment_stat(type(self).__name__, "hit")
+            response = Response(cached, status=status.HTTP_200_OK)
+            response["X-Cache"] = "HIT"
+            raise CachedResponse(response)
+        increment_stat(type(self).__name__, "miss")
+        # 캐시를 채우는 조회는 primary 에서 - 복제 지연으로 무효화 직후의 오래된 데이터가 새 버전 키에 저장되지 않도록
+        pin_to_primary()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, CachedResponse):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        cache_key = getattr(self, "response_cache_key", None)
+        if cache_key and response.status_code == status.HTTP_200_OK and "X-Cache" not in response:
+            cache.set(cache_key, response.data, self.cache_timeout)
+            response["X-Cache"] = "MISS"
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,180 @@
+# common/s3_stub.py
+import hashlib
+import hmac
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, quote, urlsplit
+
+STUB_ACCESS_KEY = "stub-access-key"
+STUB_SECRET_KEY = "stub-secret-key"
+STUB_REGION = "kr-standard"
+STUB_BUCKET = "stub-bucket"
+
+
+def presigned_signature(method, path, query, headers, secret_key):
+    """
+    SigV4 query 서명 (presigned URL) - 실제 S3 처럼 서명된 헤더(Content-Type, Content-Length 등)까지 검증
+    """
+    params = sorted((key, value) for key, value in query if key != "X-Amz-Signature")
+    canonical_query = "&".join(f"{quote(key, safe='-_.~')}={quote(value, safe='-_.~')}" for key, value in params)
+    signed_headers = dict(query)["X-Amz-SignedHeaders"].split(";")
+    canonical_headers = "".join(f"{name}:{(headers.get(name) or '').strip()}\n" for name in signed_headers)
+    canonical_request = "\n".join(
+        [method, path, canonical_query, canonical_headers, ";".join(signed_headers)] + ["UNSIGNED-PAYLOAD"]
+    )
+
+    amz_date = dict(query)["X-Amz-Date"]
+    scope = dict(query)["X-Amz-Credential"].split("/", 1)[1]
+    string_to_sign = "\n".join(
+        ["AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()]
+    )
+    key = f"AWS4{secret_key}".encode()
+    for part in scope.split("/"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+
+class StubS3Handler(BaseHTTPRequestHandler):
+    """
+    업로드 테스트용 S3 호환 stub (path-style, 단일 프로세스 메모리 저장)
+    - PUT / HEAD / GET(Range) / DELETE 객체 API
+    - presigned URL 은 만료 시간과 서명(서명된 헤더 포함)을 검증하고, 일반 API 요청의 Authorization 은 검증하지 않음
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def parse(self):
+        url = urlsplit(self.path)
+        bucket, _, key = url.path.lstrip("/").partition("/")
+        return url, bucket, key, parse_qsl(url.query, keep_blank_values=True)
+
+    def check_presigned(self, url, query):
+        params = dict(query)
+        if "X-Amz-Signature" not in params:
+            return True
+        signed_at = datetime.strptime(params["X-Amz-Date"], "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        if time.time() > signed_at.timestamp() + int(params["X-Amz-Expires"]):
+            return False
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        expected = presigned_signature(self.command, url.path, query, headers, STUB_SECRET_KEY)
+        return hmac.compare_digest(expected, params["X-Amz-Signature"])
+
+    def do_PUT(self):
+        url, bucket, key, query = self.parse()
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.check_presigned(url, query):
+            return self.error(403, "SignatureDoesNotMatch")
+        content_type = self.headers.get("Content-Type", "binary/octet-stream")
+        self.server.objects[(bucket, key)] = (body, content_type)
+        self.server.put_count += 1
+        self.respond(200, headers={"ETag": f'"{hashlib.md5(body).hexdigest()}"'})
+
+    def do_HEAD(self):
+        _, bucket, key, _ = self.parse()
+        stored = self.server.objects.get((bucket, key))
+        if stored is None:
+            return self.respond(404)
+        body, content_type = stored
+        self.respond(200, headers=self.object_headers(body, content_type), length=len(body))
+
+    def do_GET(self):
+        _, bucket, key, _ = self.parse()
+        stored = self.server.objects.get((bucket, key))
+        if stored is None:
+            return self.error(404, "NoSuchKey")
+        body, content_type = stored
+        headers = self.object_headers(body, content_type)
+
+        byte_range = self.headers.get("Range")
+        if byte_range:
+            start, _, end = byte_range.removeprefix("bytes=").partition("-")
+            start, end = int(start), min(int(end or len(body) - 1), len(body) - 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+            return self.respond(206, body[start : end + 1], headers)
+        self.respond(200, body, headers)
+
+    def do_DELETE(self):
+        _, bucket, key, _ = self.parse()
+        self.server.objects.pop((bucket, key), None)
+        self.respond(204)
+
+    def object_headers(self, body, content_type):
+        return {
+            "Content-Type": content_type,
+            "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+            "Last-Modified": formatdate(usegmt=True),
+            "Accept-Ranges": "bytes",
+        }
+
+    def error(self, status, code):
+        body = f"<?xml version='1.0' encoding='UTF-8'?><Error><Code>{code}</Code></Error>".encode()
+        self.respond(status, body, {"Content-Type": "application/xml"})
+
+    def respond(self, status, body=b"", headers=None, length=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body) if length is None else length))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubS3:
+    def __init__(self, server):
+        self.server = server
+        self.endpoint_url = f"http://127.0.0.1:{server.server_address[1]}"
+        # override_settings(STORAGES=s3.storages) 로 기본 저장소를 stub 버킷의 S3 저장소로 교체
+        self.storages = {
+            "default": {
+                "BACKEND": "storages.backends.s3.S3Storage",
+                "OPTIONS": {
+                    "bucket_name": STUB_BUCKET,
+                    "endpoint_url": self.endpoint_url,
+                    "access_key": STUB_ACCESS_KEY,
+                    "secret_key": STUB_SECRET_KEY,
+                    "region_name": STUB_REGION,
+                    "addressing_style": "path",
+                    "signature_version": "s3v4",
+                    "location": "media",
+                    "file_overwrite": False,
+                    "querystring_auth": False,
+                },
+            },
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        }
+
+    @property
+    def objects(self):
+        return self.server.objects
+
+    @property
+    def put_count(self):
+        return self.server.put_count
+
+
+@contextmanager
+def stub_s3():
+    """
+    S3 호환 stub 서버를 별도 스레드에서 실행합니다.
+    with stub_s3() as s3, override_settings(STORAGES=s3.storages): ...
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3Handler)
+    server.daemon_threads = True
+    server.objects = {}
+    server.put_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield StubS3(server)
+    finally:
+        server.shutdown()
+        server.server_close()
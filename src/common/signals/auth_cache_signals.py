@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from expert.models import Expert
+from users.auth_cache import invalidate_auth_user
+from users.models import User
+
+
+def invalidate_now_and_on_commit(user_id):
+    # 즉시 + 커밋 후 두 번 버전을 올림 - 커밋 전에 다른 요청이 이전 값으로 캐시를 다시 채워도 커밋 후에는 무효화됨
+    invalidate_auth_user(user_id)
+    transaction.on_commit(lambda: invalidate_auth_user(user_id))
+
+
+# 유저 정보(활성 여부, is_expert 등) 변경 시 인증 유저 캐시 무효화
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_auth_cache_handler(sender, instance, **kwargs):
+    invalidate_now_and_on_commit(instance.id)
+
+
+# 전문가 등록/삭제 시 scope 의 expert_id 가 바뀌므로 캐시 무효화
+@receiver(post_save, sender=Expert)
+@receiver(post_delete, sender=Expert)
+def expert_auth_cache_handler(sender, instance, **kwargs):
+    invalidate_now_and_on_commit(instance.user_id)
@@ -0,0 +1,95 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from common.response_cache import invalidate_tags
+from common.signals.review_signals import get_review_expert_id
+from expert.models import Career, Expert
+from reviews.models import Review, ReviewImages
+from users.models import User
+
+# 캐시된 응답에 노출되는 유저 필드 - 전문가 목록(ExpertSerializer.get_user), 리뷰 목록(UserInfoSerializer)
+EXPERT_USER_FIELDS = {"name", "gender"}
+REVIEW_USER_FIELDS = {"email", "name", "profile_image", "profile_image_variants"}
+
+
+def invalidate_on_commit(*tags):
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+# 전문가 생성/수정/삭제 시 전문가 목록 캐시 무효화
+@receiver(post_save, sender=Expert)
+@receiver(post_delete, sender=Expert)
+def expert_cache_handler(sender, instance, **kwargs):
+    invalidate_on_commit("experts")
+
+
+# 경력은 전문가 목록(careers)과 경력 목록 양쪽에 노출됨
+@receiver(post_save, sender=Career)
+@receiver(post_delete, sender=Career)
+def career_cache_handler(sender, instance, **kwargs):
+    invalidate_on_commit("experts", "careers")
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_cache_handler(sender, instance, **kwargs):
+    # 삭제 시에는 review_signals 의 pre_delete 에서 저장한 expert_id 사용
+    expert_id = getattr(instance, "_rating_expert_id", None) or get_review_expert_id(instance)
+    invalidate_on_commit(f"reviews:{expert_id}")
+
+
+@receiver(post_save, sender=ReviewImages)
+@receiver(post_delete, sender=ReviewImages)
+def review_images_cache_handler(sender, instance, **kwargs):
+    review = Review.objects.filter(id=instance.review_id).first()
+    if review:
+        invalidate_on_commit(f"reviews:{get_review_expert_id(review)}")
+
+
+# 저장 전 값과 비교하기 위해 노출 필드의 DB 값을 기록 (노출 필드를 저장하는 경우만 조회)
+@receiver(pre_save, sender=User)
+def user_cache_snapshot_handler(sender, instance, raw=False, update_fields=None, **kwargs):
+    fields = EXPERT_USER_FIELDS | REVIEW_USER_FIELDS
+    if update_fields is not None:
+        fields &= set(update_fields)
+    if raw or instance._state.adding or not fields:
+        instance._cache_field_values = {}
+        return
+    instance._cache_field_values = User.objects.filter(pk=instance.pk).values(*fields).first() or {}
+
+
+# 전문가/리뷰 작성자인 유저의 노출 필드가 바뀐 경우만 전문가 목록/리뷰 목록 캐시 무효화
+# (로그인의 last_login, 다른 유저의 변형 이미지 생성 등은 무효화하지 않음)
+@receiver(post_save, sender=User)
+def user_cache_handler(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    previous = instance.__dict__.pop("_cache_field_values", None)
+    if previous is not None:
+        # 파일 필드의 None/"" 처럼 표현만 다른 값은 같은 값으로 비교
+        changed = {
+            field
+            for field, value in previous.items()
+            if User._meta.get_field(field).get_prep_value(getattr(instance, field))
+            != User._meta.get_field(field).get_prep_value(value)
+        }
+    else:
+        # pre_save 없이 직접 전송된 post_save (upsert_social_user, process_image_variants) - update_fields 가 바뀐 필드
+        changed = set(update_fields or ())
+
+    tags = []
+    if changed & EXPERT_USER_FIELDS and Expert.objects.filter(user_id=instance.id).exists():
+        tags.append("experts")
+    if (
+        changed & REVIEW_USER_FIELDS
+        and Review.objects.filter(reservation__estimation__request__user_id=instance.id).exists()
+    ):
+        tags.append("reviews")
+    if tags:
+        invalidate_on_commit(*tags)
+
+
+@receiver(post_delete, sender=User)
+def user_delete_cache_handler(sender, instance, **kwargs):
+    invalidate_on_commit("experts", "reviews")
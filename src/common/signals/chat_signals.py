@@ -1,26 +1,53 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from chat.models import Message
+from chat.models import ChatRoom, Message
+from common.signals.notification_signals import notifications_created
 from notifications.models import Notification
+from notifications.rendering import preview
 
+# 알림 bulk_create 배치 크기
+NOTIFICATION_BULK_CREATE_BATCH_SIZE = 1000
 
-@receiver(post_save, sender=Message)
-def chat_post_save_handler(sender, instance, created, **kwargs):
-    if created:
-        message = instance
 
+def messages_created(messages):
+    """
+    새 메시지 목록의 수신자 알림을 생성합니다.
+    채팅방을 한 번에 조회하므로 ChatConsumer 의 배치 저장에서도 배치 당 쿼리 수가 일정합니다.
+    (발신자 이름은 알림을 조회/전송할 때 sender_id 로 렌더링)
+    """
+    rooms = (
+        ChatRoom.objects.select_related("expert")
+        .only("user", "expert__user")
+        .in_bulk({message.room_id for message in messages})
+    )
+
+    notifications = []
+    for message in messages:
+        room = rooms.get(message.room_id)
+        if room is None:
+            continue
         # 수신자를 설정: 전문가가 보낸 경우 일반 사용자, 사용자가 보낸 경우 전문가
-        if message.sender == message.room.user:
-            receiver = message.room.expert.user
-        else:
-            receiver = message.room.user
-
-        # Notification 객체 생성
-        notification = Notification.objects.create(
-            receiver=receiver,
-            title=f"{message.sender.name}님이 메시지를 보냈습니다. 확인해보세요!",
-            message=message.content,
-            notification_type="message",
-            is_read=False,
+        receiver_id = room.expert.user_id if message.sender_id == room.user_id else room.user_id
+        notifications.append(
+            Notification(
+                receiver_id=receiver_id,
+                notification_type="message",
+                payload={
+                    "room_id": message.room_id,
+                    "message_id": message.id,
+                    "sender_id": message.sender_id,
+                    "content": preview(message.content),
+                },
+                is_read=False,
+            )
         )
+
+    notifications = Notification.objects.bulk_create(notifications, batch_size=NOTIFICATION_BULK_CREATE_BATCH_SIZE)
+    notifications_created(notifications)
+
+
+@receiver(post_save, sender=Message)
+def chat_post_save_handler(sender, instance, created, **kwargs):
+    if created:
+        messages_created([instance])
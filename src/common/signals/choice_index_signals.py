@@ -0,0 +1,35 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from estimations.models import EstimationsRequest, RequestService
+from expert.models import Expert, ExpertServiceArea
+from users.models import User, UserPreferredArea
+
+
+def should_sync(instance, created, update_fields, field_name):
+    # 새로 생성된 행은 기존 index 행이 없으므로 값이 있을 때만 동기화
+    if created:
+        return bool(getattr(instance, field_name))
+    # update_fields 로 다른 필드만 저장한 경우(last_login 등)에는 동기화하지 않음
+    return update_fields is None or field_name in update_fields
+
+
+# 전문가 활동 지역 -> ExpertServiceArea
+@receiver(post_save, sender=Expert)
+def sync_expert_service_areas(sender, instance, created, update_fields=None, **kwargs):
+    if should_sync(instance, created, update_fields, "available_location"):
+        ExpertServiceArea.sync([instance])
+
+
+# 유저 선호 지역 -> UserPreferredArea
+@receiver(post_save, sender=User)
+def sync_user_preferred_areas(sender, instance, created, update_fields=None, **kwargs):
+    if should_sync(instance, created, update_fields, "prefer_location"):
+        UserPreferredArea.sync([instance])
+
+
+# 견적 요청 서비스 -> RequestService
+@receiver(post_save, sender=EstimationsRequest)
+def sync_request_services(sender, instance, created, update_fields=None, **kwargs):
+    if should_sync(instance, created, update_fields, "service_list"):
+        RequestService.sync([instance])
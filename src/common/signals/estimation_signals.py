@@ -1,7 +1,7 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from estimations.models import Estimation
+from estimations.models import Estimation, EstimationsRequest
 from notifications.models import Notification
 
 
@@ -9,23 +9,20 @@ from notifications.models import Notification
 def estimation_post_save_handler(sender, instance, created, **kwargs):
     if created:
         estimation = instance
-        notification = Notification.objects.create(
-            receiver=estimation.request.user,
-            title=f"""
-            {estimation.expert.user.name}님이 견적서를 보냈습니다. 확인해보세요!
-            """,
-            message=f"""
-            - 전문가 정보:
-                - 이름: {estimation.expert.user.name}
-                - 성별: {estimation.expert.user.gender}
-                - 서비스: {estimation.service}
-            
-            - 진행 예상 지역: {estimation.location}
-            
-            - 진행 예상 날짜: {estimation.due_date}
-            
-            - 견적 예상 금액: {estimation.charge}
-            """,
+        # 수신자(견적 요청 유저) id 만 조회 - 전문가 이름/성별은 알림을 조회/전송할 때 expert_id 로 렌더링
+        receiver_id = (
+            EstimationsRequest.objects.filter(id=estimation.request_id).values_list("user_id", flat=True).first()
+        )
+        Notification.objects.create(
+            receiver_id=receiver_id,
             notification_type="estimation",
+            payload={
+                "estimation_id": estimation.id,
+                "expert_id": estimation.expert_id,
+                "service": estimation.service,
+                "location": estimation.location,
+                "due_date": str(estimation.due_date),
+                "charge": estimation.charge,
+            },
             is_read=False,
         )
@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from expert.models import Expert
+from expert.sampling import update_expert_pools
+
+
+# 전문가 생성/수정 시 랜덤 조회용 서비스 별 id 풀 갱신
+@receiver(post_save, sender=Expert)
+def expert_post_save_handler(sender, instance, **kwargs):
+    expert_id, service = instance.id, instance.service
+    transaction.on_commit(lambda: update_expert_pools(expert_id, service))
+
+
+# 전문가 삭제 시 id 풀에서 제거
+@receiver(post_delete, sender=Expert)
+def expert_post_delete_handler(sender, instance, **kwargs):
+    expert_id = instance.id
+    transaction.on_commit(lambda: update_expert_pools(expert_id))
@@ -0,0 +1,45 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from chat.models import Message
+from common.images import needs_variants, process_image_variants
+from expert.models import Expert
+from reviews.models import ReviewImages
+from users.models import User
+
+# (모델, 이미지 필드, 만들 크기 버킷) - 변형 이미지 필드는 <이미지 필드>_variants
+IMAGE_VARIANT_FIELDS = (
+    (Expert, "expert_image", ("thumb", "small", "medium")),
+    (User, "profile_image", ("thumb", "small")),
+    (ReviewImages, "image", ("thumb", "medium")),
+    (Message, "image", ("thumb", "medium")),
+)
+
+
+def schedule_image_variants(sender, instances):
+    """
+    커밋 후 변형 이미지 생성 예약
+    IMAGE_VARIANTS_ON_UPLOAD = False 이면 generate_image_variants 명령(백그라운드)에서 처리
+    """
+    if not getattr(settings, "IMAGE_VARIANTS_ON_UPLOAD", True):
+        return
+    for model, image_field, buckets in IMAGE_VARIANT_FIELDS:
+        if model is not sender:
+            continue
+        for instance in instances:
+            if needs_variants(instance, image_field):
+                transaction.on_commit(partial(process_image_variants, model, instance.pk, image_field, buckets))
+
+
+# 이미지 업로드/변경 시 변형 이미지 생성 (bulk_create 로 저장하는 채팅 메시지는 message_buffer 에서 직접 호출)
+@receiver(post_save, sender=Expert)
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=ReviewImages)
+@receiver(post_save, sender=Message)
+def image_variants_handler(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_image_variants(sender, [instance])
@@ -1,29 +1,58 @@
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from notifications.models import Notification
+from notifications.models import Notification, NotificationOutbox
+from notifications.unread_counter import increment_unread_counts
 
-channel_layer = get_channel_layer()
+# 알림 outbox bulk_create 배치 크기
+NOTIFICATION_OUTBOX_BATCH_SIZE = 1000
 
 
-# Django signal을 사용하여 Notification 객체가 생성될 때 웹소켓으로 알림을 전달
+def build_notification_event(notification):
+    # outbox 에는 payload 만 저장하고 제목/내용은 run_notification_outbox 가 전송 직전에 배치 단위로 렌더링
+    return {
+        "type": "send_notification",
+        "notification": {
+            "id": notification.id,
+            "notification_type": notification.notification_type,
+            "payload": notification.payload,
+            "is_read": notification.is_read,
+            "created_at": notification.created_at.isoformat() if notification.created_at else None,
+        },
+    }
+
+
+def enqueue_notifications(notifications):
+    """
+    알림 전송 이벤트를 outbox 테이블에 기록합니다.
+    - 알림을 생성한 트랜잭션과 같은 트랜잭션에서 기록되므로 롤백된 알림은 전송되지 않습니다.
+    - 실제 웹소켓 전송은 run_notification_outbox 워커가 담당합니다.
+    """
+    NotificationOutbox.objects.bulk_create(
+        [
+            NotificationOutbox(
+                notification_id=notification.id,
+                group_name=f"notification_{notification.receiver_id}",
+                payload=build_notification_event(notification),
+            )
+            for notification in notifications
+        ],
+        batch_size=NOTIFICATION_OUTBOX_BATCH_SIZE,
+    )
+
+
+def notifications_created(notifications):
+    """
+    새 알림의 전송 이벤트를 outbox 에 기록하고, 커밋 후 수신자의 읽지 않은 알림 카운터를 증가시킵니다.
+    """
+    enqueue_notifications(notifications)
+    receiver_ids = [notification.receiver_id for notification in notifications]
+    transaction.on_commit(lambda: increment_unread_counts(receiver_ids))
+
+
+# Notification 객체가 생성될 때 웹소켓 전송 이벤트를 outbox 에 기록
 @receiver(post_save, sender=Notification)
 def send_notification_signal(sender, instance, created, **kwargs):
     if created:
-        group_name = f"notification_{instance.receiver.id}"
-        async_to_sync(channel_layer.group_send)(
-            group_name,
-            {
-                "type": "send_notification",
-                "notification": {
-                    "id": instance.id,
-                    "title": instance.title,
-                    "message": instance.message,
-                    "notification_type": instance.notification_type,
-                    "is_read": instance.is_read,
-                    "created_at": instance.created_at,
-                },
-            },
-        )
+        notifications_created([instance])
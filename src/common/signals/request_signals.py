@@ -1,10 +1,15 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from common.choice_index import split_choices
+from common.signals.notification_signals import notifications_created
 from estimations.models import EstimationsRequest
 from expert.models import Expert
 from notifications.models import Notification
 
+# 알림 bulk_create 배치 크기
+NOTIFICATION_BULK_CREATE_BATCH_SIZE = 1000
+
 
 @receiver(post_save, sender=EstimationsRequest)
 def request_post_save_handler(sender, instance, created, **kwargs):
@@ -12,30 +17,37 @@ def request_post_save_handler(sender, instance, created, **kwargs):
         request = instance
 
         # 서비스 리스트를 필터링할 수 있는 형식으로 변환 (예: 콤마로 구분된 문자열을 리스트로 변환)
-        service_list = (
-            request.service_list.split(",") if isinstance(request.service_list, str) else request.service_list
-        )
+        service_list = split_choices(request.service_list)
 
-        # 관련 전문가 필터링
-        experts = Expert.objects.filter(
-            service__in=service_list,
-            user__gender=request.prefer_gender,
-            available_location=request.location,
+        # 관련 전문가 필터링 (활동 지역 인덱스로 조회) - 알림 수신자 id 만 필요하므로 user_id 만 조회
+        expert_user_ids = (
+            Expert.objects.serving(request.location, services=service_list)
+            .filter(user__gender=request.prefer_gender)
+            .values_list("user_id", flat=True)
         )
 
-        # 전문가들에게 알림 생성
-        for expert in experts:
-            Notification.objects.create(
-                receiver=expert.user,
-                title=f"{request.user.name}님이 견적 요청을 보냈습니다. 확인해보세요!",
-                message=(
-                    f"- 요청 서비스: {request.get_service_list_display()}\n"
-                    f"- 선호 하는 성별: {request.get_prefer_gender_display()}\n"
-                    f"- 결혼식 정보:\n"
-                    f"  - 결혼식 예상 지역: {request.get_location_display()}\n"
-                    f"  - 결혼식장: {request.wedding_hall}\n"
-                    f"  - 결혼식 예상 날짜: {request.wedding_datetime}\n"
-                ),
-                notification_type="estimation_request",
-                is_read=False,
-            )
+        # 모든 전문가에게 동일한 payload - 요청 유저 이름과 선택지 표시 이름은 알림 조회 시 렌더링
+        payload = {
+            "request_id": request.id,
+            "user_id": request.user_id,
+            "service_list": ",".join(service_list),
+            "prefer_gender": request.prefer_gender,
+            "location": request.location,
+            "wedding_hall": request.wedding_hall,
+            "wedding_datetime": str(request.wedding_datetime),
+        }
+
+        # 전문가들에게 알림을 한 번에 생성 (bulk_create 는 post_save 를 발생시키지 않으므로 직접 outbox 에 기록)
+        notifications = Notification.objects.bulk_create(
+            [
+                Notification(
+                    receiver_id=user_id,
+                    notification_type="estimation_request",
+                    payload=payload,
+                    is_read=False,
+                )
+                for user_id in expert_user_ids
+            ],
+            batch_size=NOTIFICATION_BULK_CREATE_BATCH_SIZE,
+        )
+        notifications_created(notifications)
@@ -1,6 +1,7 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from estimations.models import Estimation
 from notifications.models import Notification
 from reservations.models import Reservation
 
@@ -9,20 +10,23 @@ from reservations.models import Reservation
 def reservation_post_save_handler(sender, instance, created, **kwargs):
     if created:
         reservation = instance
-        notification = Notification.objects.create(
-            receiver=reservation.estimation.request.user,
-            title=f"""
-            {reservation.estimation.request.user.name}님이 예약하셨습니다. 확인해보세요!
-            """,
-            message=f"""
-            - 진행 서비스: {reservation.estimation.service}
-            
-            - 진행 지역: {reservation.estimation.location}
-            
-            - 진행 날짜: {reservation.estimation.due_date}
-            
-            - 견적 금액: {reservation.estimation.charge}
-            """,
+        # 예약 -> 견적 -> 견적 요청 -> 유저 순으로 객체를 불러오지 않고 필요한 값만 한 번에 조회
+        estimation = (
+            Estimation.objects.filter(id=reservation.estimation_id)
+            .values("request__user_id", "service", "location", "due_date", "charge")
+            .first()
+        )
+        Notification.objects.create(
+            receiver_id=estimation["request__user_id"],
             notification_type="reserved",
+            payload={
+                "reservation_id": reservation.id,
+                "estimation_id": reservation.estimation_id,
+                "user_id": estimation["request__user_id"],
+                "service": estimation["service"],
+                "location": estimation["location"],
+                "due_date": str(estimation["due_date"]),
+                "charge": estimation["charge"],
+            },
             is_read=False,
         )
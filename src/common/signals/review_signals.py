@@ -1,23 +1,54 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
+from estimations.models import Estimation
 from notifications.models import Notification
-from reviews.models import Review
+from notifications.rendering import preview
+from reservations.models import Reservation
+from reviews.models import ExpertRating, Review
 
 
 @receiver(post_save, sender=Review)
 def review_post_save_handler(sender, instance, created, **kwargs):
     if created:
         review = instance
-        notification = Notification.objects.create(
-            receiver=review.reservation.estimation.request.user,
-            title=f"""
-            {review.reservation.estimation.request.user}님이 리뷰를 남겼습니다. 확인해보세요!
-            """,
-            message=f"""
-            - 내용: {review.content}
-            - 평점: {review.rating}
-            """,
+        # 리뷰 -> 예약 -> 견적 -> 견적 요청 순으로 객체를 불러오지 않고 유저 id 만 조회 (이름은 알림 조회 시 렌더링)
+        user_id = (
+            Reservation.objects.filter(id=review.reservation_id)
+            .values_list("estimation__request__user_id", flat=True)
+            .first()
+        )
+        Notification.objects.create(
+            receiver_id=user_id,
             notification_type="review",
+            payload={
+                "review_id": review.id,
+                "user_id": user_id,
+                "content": preview(review.content),
+                "rating": str(review.rating),
+            },
             is_read=False,
         )
+
+
+def get_review_expert_id(review):
+    # 리뷰 -> 예약 -> 견적 -> 전문가 순으로 조인하지 않고 expert_id 만 조회
+    return Estimation.objects.filter(reservation__id=review.reservation_id).values_list("expert_id", flat=True).first()
+
+
+@receiver(post_save, sender=Review)
+def review_rating_post_save_handler(sender, instance, **kwargs):
+    # 리뷰 생성/수정 시 전문가 평점 집계 갱신
+    ExpertRating.refresh_for_expert(get_review_expert_id(instance))
+
+
+@receiver(pre_delete, sender=Review)
+def review_rating_pre_delete_handler(sender, instance, **kwargs):
+    # cascade 삭제 시 예약/견적이 먼저 삭제될 수 있으므로 삭제 전에 expert_id 를 저장
+    instance._rating_expert_id = get_review_expert_id(instance)
+
+
+@receiver(post_delete, sender=Review)
+def review_rating_post_delete_handler(sender, instance, **kwargs):
+    # 리뷰 삭제 시 전문가 평점 집계 갱신
+    ExpertRating.refresh_for_expert(getattr(instance, "_rating_expert_id", None))
@@ -0,0 +1,39 @@
+# common/streaming.py
+import json
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class StreamingListMixin:
+    """
+    ListAPIView 용 opt-in 스트리밍 응답 (?stream=true)
+    - 페이지네이션 없이 전체 결과를 JSON 배열로 내려주되, queryset.iterator(chunk_size=...) 로 나누어 직렬화하므로
+      결과 크기와 관계없이 메모리 사용량이 chunk 크기로 일정합니다.
+    - prefetch_related 는 chunk 단위로 적용됩니다.
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get(self.stream_query_param, "false").lower() != "true":
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # StreamingHttpResponse 는 DRF 렌더러를 거치지 않고 chunk 단위로 바로 전송됩니다.
+        return StreamingHttpResponse(self.stream_json(queryset), content_type="application/json")
+
+    def stream_json(self, queryset):
+        iterator = queryset.iterator(chunk_size=self.stream_chunk_size)
+        yield "["
+        first = True
+        while True:
+            chunk = list(islice(iterator, self.stream_chunk_size))
+            if not chunk:
+                break
+            for item in self.get_serializer(chunk, many=True).data:
+                yield ("" if first else ",") + json.dumps(item, cls=JSONEncoder, ensure_ascii=False)
+                first = False
+        yield "]"
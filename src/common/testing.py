@@ -0,0 +1,32 @@
+# common/testing.py
+from django.test import override_settings
+
+
+class QueryBudgetTestMixin:
+    """
+    QueryBudgetMiddleware 결과를 검증하는 TestCase mixin
+    - 테스트 동안 QUERY_BUDGET_STRICT 를 켜서 view 의 query_budget 초과 시 QueryBudgetExceeded 가 발생합니다.
+    - assertWithinQueryBudget 으로 응답의 쿼리 수를 직접 검증할 수 있습니다.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._query_budget_override = override_settings(QUERY_BUDGET_STRICT=True)
+        cls._query_budget_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._query_budget_override.disable()
+        super().tearDownClass()
+
+    def assertWithinQueryBudget(self, response, budget=None):
+        stats = getattr(response, "query_stats", None)
+        self.assertIsNotNone(stats, "QueryBudgetMiddleware 가 응답에 query_stats 를 기록하지 않았습니다.")
+        budget = stats["budget"] if budget is None else budget
+        self.assertIsNotNone(budget, "검증할 query_budget 이 없습니다.")
+        self.assertLessEqual(
+            stats["count"],
+            budget,
+            f"쿼리 {stats['count']}회 실행 (예산 {budget}회), 중복 쿼리: {stats['duplicates']}",
+        )
@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common.authentication import CachedJWTAuthentication
+from expert.models import Expert
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        # Given: 전문가 유저와 access token
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="expert@example.com",
+            name="전문가",
+            phone_number="01012345678",
+            gender="M",
+            is_active=True,
+            is_expert=True,
+        )
+        self.expert = Expert.objects.create(user=self.user, service="mc", available_location="seoul", appeal="소개")
+        self.request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.authentication = CachedJWTAuthentication()
+
+    def test_steady_state_needs_no_identity_queries(self):
+        # Given: 첫 요청으로 캐시 채움
+        self.authentication.authenticate(self.request)
+
+        # When / Then: 이후 요청은 유저/전문가 조회 쿼리 없음
+        with self.assertNumQueries(0):
+            user, _ = self.authentication.authenticate(self.request)
+            self.assertEqual(user.expert.id, self.expert.id)
+
+    def test_expert_deletion_invalidates_cache(self):
+        self.authentication.authenticate(self.request)
+
+        # When: 전문가 비활성화 (전문가 정보 삭제)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.expert.delete()
+
+        # Then: 새로 조회된 유저에는 전문가 정보가 없음
+        user, _ = self.authentication.authenticate(self.request)
+        self.assertFalse(hasattr(user, "expert"))
+
+    def test_inactive_user_rejected(self):
+        self.authentication.authenticate(self.request)
+
+        # When: 유저 비활성화
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        # Then: 캐시된 정보가 아닌 변경된 정보로 인증 실패
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate(self.request)
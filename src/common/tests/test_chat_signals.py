@@ -70,13 +70,16 @@ class MessageSignalTest(TestCase):
     def test_notification_created_on_message_send(self):
         # Given: 발신자가 메시지를 생성합니다.
         message_content = "안녕하세요, 이건 테스트 메시지입니다."
-        Message.objects.create(room_id=1, sender=self.user, content=message_content)
+        Message.objects.create(room=self.chatroom, sender=self.user, content=message_content)
         assert Notification.objects.all()
 
         # When: post_save 시그널이 트리거됩니다.
         # Then: 수신자를 위한 알림이 생성되어야 합니다.
-        notification_exists = Notification.objects.filter(
-            receiver=self.expert_user, message=message_content, notification_type="message"
-        ).exists()
+        notification = Notification.objects.filter(
+            receiver=self.expert_user, payload__content=message_content, notification_type="message"
+        ).first()
 
-        self.assertTrue(notification_exists, "메시지가 전송되면 알림이 생성되어야 합니다.")
+        self.assertIsNotNone(notification, "메시지가 전송되면 알림이 생성되어야 합니다.")
+        # Then: 제목/내용은 payload 의 발신자 id 와 메시지로 렌더링됩니다.
+        self.assertEqual(notification.title, f"{self.user.name}님이 메시지를 보냈습니다. 확인해보세요!")
+        self.assertEqual(notification.message, message_content)
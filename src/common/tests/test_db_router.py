@@ -0,0 +1,97 @@
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from common.db_router import pin_to_primary
+from common.middleware import ReplicaRoutingMiddleware
+
+User = get_user_model()
+
+# 복제 없이 독립된 두 로컬 인스턴스 (config/settings/settings.py 의 POSTGRES_REPLICA_HOST)
+TWO_INSTANCES = "replica" in settings.DATABASES and not settings.DATABASES["replica"].get("TEST", {}).get("MIRROR")
+
+
+class ReplicaRoutingTest(TestCase):
+    databases = {"default", "replica"} if TWO_INSTANCES else {"default"}
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        if not TWO_INSTANCES:
+            # Given: 복제본 alias 가 설정된 상태 (라우팅 결정만 확인하므로 실제 연결은 필요 없음)
+            for target in ("common.db_router.replica_alias", "common.middleware.replica_alias"):
+                patcher = mock.patch(target, return_value="replica")
+                patcher.start()
+                self.addCleanup(patcher.stop)
+
+    def run_request(self, method, view, token=None):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        request = getattr(self.factory, method.lower())("/api/v1/experts/", **headers)
+        result = {}
+
+        def get_response(request):
+            result.update(view())
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(get_response)(request)
+        return result
+
+    def test_safe_request_reads_replica_until_write(self):
+        def view():
+            before = User.objects.all().db
+            locked = User.objects.select_for_update().db
+            User.objects.create_user(email="new@example.com", name="유저", phone_number="01012345678", gender="M")
+            return {"before": before, "locked": locked, "after": User.objects.all().db}
+
+        # When: GET 요청 중에 쓰기가 발생
+        result = self.run_request("GET", view)
+
+        # Then: 쓰기 전 조회는 복제본, 쓰기용 조회와 쓰기 이후 조회는 primary
+        self.assertEqual(result, {"before": "replica", "locked": "default", "after": "default"})
+
+        # Then: 요청 밖(채팅 consumer, 관리 명령)의 조회는 primary
+        self.assertEqual(User.objects.all().db, "default")
+
+    def test_write_request_sticks_client_to_primary(self):
+        def read():
+            return {"db": User.objects.all().db}
+
+        def read_pinned():
+            pin_to_primary()
+            return read()
+
+        # When: 같은 클라이언트가 쓰기 요청 직후 조회
+        self.run_request("POST", read, token="writer")
+
+        # Then: 쓴 클라이언트만 primary, 다른 클라이언트와 익명 요청은 복제본
+        self.assertEqual(self.run_request("GET", read, token="writer"), {"db": "default"})
+        self.assertEqual(self.run_request("GET", read, token="reader"), {"db": "replica"})
+        self.assertEqual(self.run_request("GET", read), {"db": "replica"})
+        # Then: 응답 캐시를 채우는 조회처럼 primary 로 고정한 요청
+        self.assertEqual(self.run_request("GET", read_pinned, token="reader"), {"db": "default"})
+
+        # When: sticky 기간이 지남
+        cache.clear()
+
+        # Then: 다시 복제본에서 조회
+        self.assertEqual(self.run_request("GET", read, token="writer"), {"db": "replica"})
+
+    @skipUnless(TWO_INSTANCES, "POSTGRES_REPLICA_HOST 로 두 번째 로컬 Postgres 인스턴스를 설정해야 합니다.")
+    def test_reads_served_by_second_instance(self):
+        def create():
+            User.objects.create_user(email="new@example.com", name="유저", phone_number="01012345678", gender="M")
+            return {}
+
+        def read():
+            return {"exists": User.objects.filter(email="new@example.com").exists()}
+
+        # Given: primary 에만 저장된 유저 (복제되지 않는 독립 인스턴스)
+        self.run_request("POST", create, token="writer")
+
+        # Then: 쓴 클라이언트는 primary 에서 읽어 바로 보이고, 다른 클라이언트는 복제본에서 읽음
+        self.assertEqual(self.run_request("GET", read, token="writer"), {"exists": True})
+        self.assertEqual(self.run_request("GET", read, token="reader"), {"exists": False})
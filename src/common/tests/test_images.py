@@ -0,0 +1,117 @@
+import io
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from common.images import IMAGE_VARIANT_SIZES, get_image_variants, render_variants
+from expert.models import Expert
+from expert.seriailzers import ExpertSerializer
+
+User = get_user_model()
+
+
+def jpeg_upload(name="photo.jpg", size=(1600, 1200), orientation=None):
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    exif[0x010F] = "Test Camera"
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 120, 40)).save(buffer, "JPEG", exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+class ImageVariantTest(TestCase):
+    def setUp(self):
+        # Given: 임시 MEDIA_ROOT 와 전문가 유저
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.user = User.objects.create_user(
+            email="expert@example.com", name="전문가", phone_number="01012345678", gender="M", is_expert=True
+        )
+
+    def create_expert(self, image):
+        return Expert.objects.create(
+            user=self.user, expert_image=image, service="mc", available_location="seoul", appeal="소개"
+        )
+
+    def test_render_variants_applies_orientation_and_strips_exif(self):
+        # When: 90도 회전 정보가 있는 가로 사진으로 변형 이미지 생성
+        variants = render_variants(jpeg_upload(orientation=6), ["thumb", "medium"])
+
+        # Then: 세로 방향으로 회전되고, 버킷 크기 이하이며, EXIF 가 없는 WebP
+        for bucket, (content, (width, height)) in variants.items():
+            self.assertLess(width, height)
+            self.assertEqual(height, IMAGE_VARIANT_SIZES[bucket])
+            with Image.open(io.BytesIO(content)) as image:
+                self.assertEqual(image.format, "WEBP")
+                self.assertEqual(image.size, (width, height))
+                self.assertFalse(image.getexif())
+
+    def test_upload_generates_variants_after_commit(self):
+        # When: 전문가 이미지 업로드
+        with self.captureOnCommitCallbacks(execute=True):
+            expert = self.create_expert(jpeg_upload())
+
+        # Then: 버킷 별 변형 이미지가 저장되고, 직렬화 결과에 URL 이 포함됨
+        expert.refresh_from_db()
+        variants = get_image_variants(expert, "expert_image")
+        self.assertEqual(set(variants), {"thumb", "small", "medium"})
+        self.assertTrue(all(expert.expert_image.storage.exists(variant["name"]) for variant in variants.values()))
+        self.assertEqual(variants["thumb"]["width"], IMAGE_VARIANT_SIZES["thumb"])
+
+        urls = ExpertSerializer(expert).data["expert_image_variants"]
+        self.assertTrue(urls["thumb"].endswith("_thumb.webp"))
+
+    def test_replaced_image_hides_stale_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            expert = self.create_expert(jpeg_upload())
+        expert.refresh_from_db()
+
+        # When: 이미지를 교체하고 아직 변형 이미지가 만들어지지 않은 상태
+        expert.expert_image = jpeg_upload("new.jpg")
+        expert.save()
+
+        # Then: 이전 원본의 변형 이미지는 노출되지 않음 (클라이언트는 원본 사용)
+        self.assertEqual(ExpertSerializer(expert).data["expert_image_variants"], {})
+
+    def test_external_url_and_invalid_file_skipped(self):
+        # Given: 소셜 로그인 프로필 이미지(외부 URL)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.profile_image = "https://example.com/profile.jpg"
+            self.user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_variants, {})
+
+        # When: 이미지가 아닌 파일 업로드
+        with self.captureOnCommitCallbacks(execute=True):
+            expert = self.create_expert(SimpleUploadedFile("broken.jpg", b"not an image"))
+
+        # Then: 다시 처리하지 않도록 빈 변형으로 기록됨
+        expert.refresh_from_db()
+        self.assertEqual(expert.expert_image_variants, {"source": expert.expert_image.name, "sizes": {}})
+
+    @override_settings(IMAGE_VARIANTS_ON_UPLOAD=False)
+    def test_command_backfills_pending_images(self):
+        # Given: 업로드 시 처리하지 않은 이미지
+        with self.captureOnCommitCallbacks(execute=True):
+            expert = self.create_expert(jpeg_upload())
+        expert.refresh_from_db()
+        self.assertEqual(get_image_variants(expert, "expert_image"), {})
+
+        # When: 백그라운드 명령 실행
+        call_command("generate_image_variants", "--model", "expert.expert", stdout=io.StringIO())
+
+        # Then: 변형 이미지가 생성됨
+        expert.refresh_from_db()
+        self.assertEqual(set(get_image_variants(expert, "expert_image")), {"thumb", "small", "medium"})
@@ -0,0 +1,117 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from chat.models import ChatRoom
+from common.middleware import sql_fingerprint
+from common.testing import QueryBudgetTestMixin
+from estimations.models import Estimation, EstimationsRequest
+from expert.models import Expert
+from reservations.models import Reservation
+from reviews.models import Review
+
+User = get_user_model()
+
+
+class QueryBudgetMiddlewareTest(QueryBudgetTestMixin, TestCase):
+    def setUp(self):
+        # Given: 여러 전문가 / 채팅방 / 리뷰 생성 (N+1 이면 행 수만큼 쿼리가 늘어남)
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            name="유저",
+            phone_number="01012345678",
+            gender="M",
+            is_active=True,
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.experts = []
+        for index in range(5):
+            expert_user = User.objects.create_user(
+                email=f"expert{index}@example.com",
+                name=f"전문가{index}",
+                phone_number=f"0109999000{index}",
+                gender="M",
+                is_active=True,
+            )
+            expert = Expert.objects.create(
+                user=expert_user,
+                expert_image="path/to/expert_image.jpg",
+                service="mc",
+                standard_charge=100000,
+                available_location="seoul",
+                appeal="경험 많은 웨딩 전문가입니다.",
+            )
+            estimation_request = EstimationsRequest.objects.create(
+                user=self.user,
+                service_list="mc",
+                prefer_gender="M",
+                status="pending",
+                location="seoul",
+                wedding_datetime="2024-12-12",
+            )
+            estimation = Estimation.objects.create(
+                request=estimation_request,
+                expert=expert,
+                service="mc",
+                location="seoul",
+                due_date="2024-12-20",
+                charge=150000,
+            )
+            reservation = Reservation.objects.create(estimation=estimation)
+            Review.objects.create(reservation=reservation, content="좋았어요", rating=4.5)
+            ChatRoom.objects.create(user=self.user, expert=expert, request=estimation_request)
+            self.experts.append(expert)
+
+    def test_expert_list_within_budget(self):
+        # When: 전문가 목록 조회
+        response = self.client.get("/api/v1/experts/", {"service": "mc"})
+
+        # Then: 전문가 수와 관계없이 예산 내 쿼리 실행
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertWithinQueryBudget(response)
+
+    def test_chatroom_list_within_budget(self):
+        response = self.client.get("/api/v1/chat/chatrooms/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertWithinQueryBudget(response)
+        self.assertEqual(response.query_stats["duplicate_count"], 0)
+
+    def test_review_list_within_budget(self):
+        response = self.client.get("/api/v1/reviews/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(response.data["results"][0]["user"]["id"], self.user.id)
+        self.assertWithinQueryBudget(response)
+
+    def test_review_list_by_expert_within_budget(self):
+        response = self.client.get(f"/api/v1/reviews/experts/{self.experts[0].id}/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertWithinQueryBudget(response)
+
+    @override_settings(DEBUG=True)
+    def test_debug_query_headers(self):
+        # When: DEBUG 모드에서 요청
+        response = self.client.get("/api/v1/chat/chatrooms/")
+
+        # Then: 쿼리 통계가 응답 헤더로 노출됨
+        self.assertEqual(response["X-Query-Count"], str(response.query_stats["count"]))
+        self.assertIn("X-Query-Time-Ms", response)
+        self.assertEqual(response["X-Query-Duplicates"], "0")
+        self.assertEqual(response["X-Query-Budget"], str(response.query_stats["budget"]))
+
+    def test_sql_fingerprint_groups_literals(self):
+        # Given: 값만 다른 동일한 형태의 쿼리
+        first = sql_fingerprint("SELECT * FROM users_user WHERE id = 1 AND name = 'a'")
+        second = sql_fingerprint("SELECT *  FROM users_user WHERE id = 22 AND name = 'b'")
+
+        # Then: 같은 fingerprint 로 묶임
+        self.assertEqual(first, second)
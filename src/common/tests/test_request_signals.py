@@ -0,0 +1,115 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from estimations.models import EstimationsRequest
+from expert.models import Expert
+from notifications.models import Notification, NotificationOutbox
+
+User = get_user_model()
+
+
+class EstimationRequestSignalTest(TestCase):
+    def setUp(self):
+        # Given: 게스트 유저와 요청 조건에 맞는 전문가 / 맞지 않는 전문가 생성
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            name="유저",
+            phone_number="01012345678",
+            gender="M",
+            is_active=True,
+        )
+
+        self.matching_experts = []
+        for index in range(3):
+            expert_user = User.objects.create_user(
+                email=f"expert{index}@example.com",
+                name=f"전문가{index}",
+                phone_number="01087654321",
+                gender="M",
+                is_active=True,
+            )
+            self.matching_experts.append(
+                Expert.objects.create(
+                    user=expert_user,
+                    service="mc",
+                    standard_charge=100000,
+                    available_location="seoul",
+                    appeal="경험 많은 웨딩 전문가입니다.",
+                )
+            )
+
+        other_user = User.objects.create_user(
+            email="other@example.com",
+            name="다른 전문가",
+            phone_number="01087654321",
+            gender="F",
+            is_active=True,
+        )
+        Expert.objects.create(
+            user=other_user, service="mc", standard_charge=100000, available_location="seoul", appeal="다른 성별"
+        )
+
+    def test_notifications_bulk_created_for_matching_experts(self):
+        # When: 견적 요청을 생성합니다.
+        EstimationsRequest.objects.create(
+            user=self.user,
+            service_list=["mc"],
+            prefer_gender="M",
+            status="pending",
+            location="seoul",
+            wedding_hall="서울 웨딩홀",
+            wedding_datetime="2024-12-12 15:00:00",
+        )
+
+        # Then: 조건에 맞는 전문가에게만 알림과 전송 이벤트가 생성되어야 합니다.
+        receivers = set(
+            Notification.objects.filter(notification_type="estimation_request").values_list("receiver_id", flat=True)
+        )
+        self.assertEqual(receivers, {expert.user_id for expert in self.matching_experts})
+        outbox_groups = set(NotificationOutbox.objects.values_list("group_name", flat=True))
+        self.assertEqual(outbox_groups, {f"notification_{expert.user_id}" for expert in self.matching_experts})
+
+    def test_multi_area_expert_receives_notification(self):
+        # Given: 여러 지역에서 활동하는 전문가
+        expert_user = User.objects.create_user(
+            email="multi@example.com",
+            name="다지역 전문가",
+            phone_number="01087654321",
+            gender="M",
+            is_active=True,
+        )
+        multi_area_expert = Expert.objects.create(
+            user=expert_user,
+            service="mc",
+            standard_charge=100000,
+            available_location=["busan", "seoul"],
+            appeal="부산, 서울 활동",
+        )
+
+        # When: 서울 지역 견적 요청 생성
+        EstimationsRequest.objects.create(
+            user=self.user,
+            service_list=["mc", "snap"],
+            prefer_gender="M",
+            status="pending",
+            location="seoul",
+            wedding_hall="서울 웨딩홀",
+            wedding_datetime="2024-12-12 15:00:00",
+        )
+
+        # Then: 활동 지역 중 하나가 일치하는 전문가도 알림을 받음
+        self.assertTrue(Notification.objects.filter(receiver_id=multi_area_expert.user_id).exists())
+
+    def test_choice_index_follows_field_updates(self):
+        # Given: 서울에서 활동하는 전문가
+        expert = self.matching_experts[0]
+        self.assertEqual(list(Expert.objects.serving("seoul", services=["mc"]).filter(id=expert.id)), [expert])
+
+        # When: 활동 지역을 부산으로 변경
+        expert.available_location = ["busan"]
+        expert.save()
+
+        # Then: 정규화 인덱스도 함께 변경됨
+        self.assertFalse(Expert.objects.serving("seoul").filter(id=expert.id).exists())
+        self.assertTrue(Expert.objects.serving("busan").filter(id=expert.id).exists())
+        self.assertEqual(set(expert.service_areas.values_list("area", flat=True)), {"busan"})
@@ -0,0 +1,166 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.response_cache import get_stats
+from estimations.models import Estimation, EstimationsRequest
+from expert.models import Career, Expert
+from reservations.models import Reservation
+from reviews.models import Review
+
+User = get_user_model()
+
+
+class ResponseCacheTest(TestCase):
+    def setUp(self):
+        # Given: 전문가 / 리뷰가 있는 상태, 캐시는 비어 있음
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="guest@example.com", name="게스트", phone_number="01012345678", gender="M", is_active=True
+        )
+        self.expert_user = User.objects.create_user(
+            email="expert@example.com", name="전문가", phone_number="01087654321", gender="F", is_active=True
+        )
+        self.expert = Expert.objects.create(
+            user=self.expert_user, service="mc", standard_charge=100000, available_location="seoul", appeal="소개"
+        )
+        estimation_request = EstimationsRequest.objects.create(
+            user=self.user,
+            service_list="mc",
+            prefer_gender="M",
+            status="pending",
+            location="seoul",
+            wedding_datetime="2024-12-12",
+        )
+        estimation = Estimation.objects.create(
+            request=estimation_request,
+            expert=self.expert,
+            service="mc",
+            location="seoul",
+            due_date="2024-12-20",
+            charge=100000,
+        )
+        self.reservation = Reservation.objects.create(estimation=estimation, status="completed")
+        self.expert_list_url = reverse("experts:expert_list")
+        self.review_list_url = reverse("expert-review-list", kwargs={"expert_id": self.expert.id})
+
+    def test_expert_list_hit_after_miss(self):
+        # When: 같은 조건으로 두 번 조회
+        first = self.client.get(self.expert_list_url, {"service": "mc"})
+        with self.assertNumQueries(0):
+            second = self.client.get(self.expert_list_url, {"service": "mc"})
+
+        # Then: 두 번째 요청은 DB 조회 없이 캐시된 응답 반환
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(get_stats()["ExpertListView"], {"hit": 1, "miss": 1})
+
+    def test_cache_key_varies_on_query_params(self):
+        # When: query params 가 다르거나 순서만 다른 요청
+        self.client.get(self.expert_list_url, {"service": "mc", "page": 1})
+        other_service = self.client.get(self.expert_list_url, {"service": "snap"})
+        reordered = self.client.get(f"{self.expert_list_url}?page=1&service=mc")
+
+        # Then: 다른 조건은 MISS, 순서만 다른 같은 조건은 HIT
+        self.assertEqual(other_service["X-Cache"], "MISS")
+        self.assertEqual(reordered["X-Cache"], "HIT")
+
+    def test_random_query_is_not_cached(self):
+        # When: 랜덤 조회
+        response = self.client.get(self.expert_list_url, {"service": "mc", "random": "true"})
+
+        # Then: 캐시를 사용하지 않음
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Cache", response)
+
+    def test_career_change_invalidates_expert_list(self):
+        self.client.get(self.expert_list_url, {"service": "mc"})
+
+        # When: 경력 추가
+        with self.captureOnCommitCallbacks(execute=True):
+            Career.objects.create(expert=self.expert, title="경력", description="설명", start_date="2020-01-01")
+        response = self.client.get(self.expert_list_url, {"service": "mc"})
+
+        # Then: 캐시가 무효화되어 새 경력이 포함됨
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["careers"][0]["title"], "경력")
+
+    def test_review_change_invalidates_only_that_expert(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.review_list_url)
+        other_url = reverse("expert-review-list", kwargs={"expert_id": self.expert.id + 1})
+        self.client.get(other_url)
+
+        # When: 리뷰 작성
+        with self.captureOnCommitCallbacks(execute=True):
+            Review.objects.create(reservation=self.reservation, content="좋아요", rating=5)
+
+        # Then: 해당 전문가의 리뷰 목록만 무효화
+        response = self.client.get(self.review_list_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(self.client.get(other_url)["X-Cache"], "HIT")
+
+    def test_user_login_does_not_invalidate(self):
+        self.client.get(self.expert_list_url, {"service": "mc"})
+
+        # When: 로그인 시각만 저장 / 이름 변경
+        with self.captureOnCommitCallbacks(execute=True):
+            self.expert_user.save(update_fields=["last_login"])
+        after_login = self.client.get(self.expert_list_url, {"service": "mc"})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.expert_user.name = "새 이름"
+            self.expert_user.save()
+        after_rename = self.client.get(self.expert_list_url, {"service": "mc"})
+
+        # Then: 공개 필드가 바뀐 경우에만 무효화
+        self.assertEqual(after_login["X-Cache"], "HIT")
+        self.assertEqual(after_rename["X-Cache"], "MISS")
+
+    def test_user_change_invalidates_only_when_shown_field_changes(self):
+        # Given: 리뷰 작성자(self.user)의 리뷰 목록 캐시, 전문가/리뷰 작성자가 아닌 유저
+        with self.captureOnCommitCallbacks(execute=True):
+            Review.objects.create(reservation=self.reservation, content="좋아요", rating=5)
+        other = User.objects.create_user(email="other@example.com", name="기타", phone_number="01000000000", gender="M")
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.review_list_url)
+
+        # When: 다른 유저의 이름/변형 이미지 변경, 작성자의 값 변경 없는 저장
+        with self.captureOnCommitCallbacks(execute=True):
+            other.name = "새 이름"
+            other.save()
+            post_save.send(
+                sender=User, instance=other, created=False, update_fields=frozenset(["profile_image_variants"])
+            )
+            self.user.save()
+        unchanged = self.client.get(self.review_list_url)
+
+        # When: 리뷰 작성자의 변형 이미지 생성 (process_image_variants 처럼 post_save 직접 전송)
+        with self.captureOnCommitCallbacks(execute=True):
+            post_save.send(
+                sender=User, instance=self.user, created=False, update_fields=frozenset(["profile_image_variants"])
+            )
+        changed = self.client.get(self.review_list_url)
+
+        # Then: 리뷰 작성자의 노출 필드가 바뀐 경우에만 무효화
+        self.assertEqual(unchanged["X-Cache"], "HIT")
+        self.assertEqual(changed["X-Cache"], "MISS")
+
+    def test_stats_command(self):
+        self.client.get(reverse("services:list"))
+        self.client.get(reverse("services:list"))
+
+        # When: 통계 출력 후 초기화
+        call_command("response_cache_stats", "--reset", stdout=StringIO())
+
+        # Then: 카운터가 초기화됨
+        self.assertEqual(get_stats()["ServiceChoicesView"], {"hit": 0, "miss": 0})
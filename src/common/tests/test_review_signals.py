@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from estimations.models import Estimation, EstimationsRequest
+from expert.models import Expert
+from reservations.models import Reservation
+from reviews.models import ExpertRating, Review
+
+User = get_user_model()
+
+
+class ReviewRatingSignalTest(TestCase):
+    def setUp(self):
+        # Given: 사용자와 관련 모델 초기화
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            name="유저",
+            phone_number="01012345678",
+            gender="M",
+            is_active=True,
+        )
+
+        self.expert_user = User.objects.create_user(
+            email="expertuser@example.com",
+            name="전문가",
+            phone_number="01087654321",
+            gender="M",
+            is_active=True,
+        )
+
+        # 전문가 생성
+        self.expert = Expert.objects.create(
+            user=self.expert_user,
+            expert_image="path/to/expert_image.jpg",
+            service="mc",
+            standard_charge=100000,
+            available_location="seoul",
+            appeal="경험 많은 웨딩 전문가입니다.",
+        )
+
+        # 견적 요청, 견적, 예약 생성
+        self.estimation_request = EstimationsRequest.objects.create(
+            user=self.user,
+            service_list="mc",
+            prefer_gender="M",
+            status="pending",
+            location="seoul",
+            wedding_datetime="2024-12-12",
+        )
+        self.estimation = Estimation.objects.create(
+            request=self.estimation_request,
+            expert=self.expert,
+            service="mc",
+            location="seoul",
+            due_date="2024-12-20",
+            charge=150000,
+        )
+        self.reservation = Reservation.objects.create(estimation=self.estimation, status="completed")
+
+    def test_rating_summary_follows_review_changes(self):
+        # When: 리뷰를 생성합니다.
+        first = Review.objects.create(reservation=self.reservation, content="좋아요", rating=Decimal("4.0"))
+        Review.objects.create(reservation=self.reservation, content="최고", rating=Decimal("5.0"))
+
+        # Then: 평점 집계가 생성되어야 합니다.
+        summary = ExpertRating.objects.get(expert=self.expert)
+        self.assertEqual(summary.review_count, 2)
+        self.assertEqual(summary.rating_average, Decimal("4.50"))
+        self.assertEqual(summary.rating_histogram["4.0"], 1)
+        self.assertEqual(summary.rating_histogram["5.0"], 1)
+
+        # When: 리뷰를 수정합니다.
+        first.rating = Decimal("3.0")
+        first.save()
+
+        # Then: 평균이 다시 계산되어야 합니다.
+        summary.refresh_from_db()
+        self.assertEqual(summary.rating_average, Decimal("4.00"))
+        self.assertEqual(summary.rating_histogram["4.0"], 0)
+
+        # When: 리뷰를 삭제합니다.
+        first.delete()
+
+        # Then: 삭제된 리뷰가 집계에서 제외되어야 합니다.
+        summary.refresh_from_db()
+        self.assertEqual(summary.review_count, 1)
+        self.assertEqual(summary.rating_average, Decimal("5.00"))
+
+    def test_rebuild_expert_ratings_command(self):
+        # Given: 리뷰가 존재하지만 집계 테이블이 비어있습니다.
+        Review.objects.create(reservation=self.reservation, content="좋아요", rating=Decimal("3.5"))
+        ExpertRating.objects.all().delete()
+
+        # When: 집계 재생성 커맨드를 실행합니다.
+        call_command("rebuild_expert_ratings")
+
+        # Then: 리뷰 테이블로부터 집계가 다시 만들어져야 합니다.
+        summary = ExpertRating.objects.get(expert=self.expert)
+        self.assertEqual(summary.review_count, 1)
+        self.assertEqual(summary.rating_average, Decimal("3.50"))
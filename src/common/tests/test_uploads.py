@@ -0,0 +1,121 @@
+import io
+
+import requests
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from common.s3_stub import STUB_BUCKET, stub_s3
+from expert.models import Expert
+
+User = get_user_model()
+
+
+def jpeg_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (10, 120, 200)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@override_settings(IMAGE_VARIANTS_ON_UPLOAD=False)
+class DirectUploadTest(APITestCase):
+    def setUp(self):
+        # Given: S3 호환 stub 을 기본 저장소로 사용하는 로그인 유저
+        cache.clear()
+        s3_context = stub_s3()
+        self.s3 = s3_context.__enter__()
+        self.addCleanup(s3_context.__exit__, None, None, None)
+        storage_settings = override_settings(STORAGES=self.s3.storages)
+        storage_settings.enable()
+        self.addCleanup(storage_settings.disable)
+
+        self.user = User.objects.create_user(
+            email="user@example.com", name="유저", phone_number="01012345678", gender="M"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def start_upload(self, kind, body, content_type="image/jpeg"):
+        response = self.client.post(
+            reverse("uploads:create"), {"kind": kind, "content_type": content_type, "size": len(body)}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def put(self, upload, body, **headers):
+        return requests.put(upload["upload_url"], data=body, headers={**upload["headers"], **headers}, timeout=5)
+
+    def test_expert_image_uploaded_directly_and_attached(self):
+        # Given: 전문가 유저가 발급받은 presigned URL 로 저장소에 직접 업로드
+        expert = Expert.objects.create(user=self.user, service="mc", available_location="seoul", appeal="소개")
+        body = jpeg_bytes()
+        upload = self.start_upload("expert_image", body)
+        self.assertTrue(upload["name"].startswith(f"images/experts/profile/{self.user.id}/"))
+        self.assertEqual(self.put(upload, body).status_code, 200)
+        self.assertEqual(self.s3.objects[(STUB_BUCKET, f"media/{upload['name']}")], (body, "image/jpeg"))
+
+        # When: 파일 대신 upload_id 로 전문가 이미지 수정
+        response = self.client.patch(
+            reverse("experts:expert_detail"), {"expert_image_upload_id": upload["upload_id"]}, format="multipart"
+        )
+
+        # Then: 업로드한 객체 키가 전문가 이미지로 연결됨
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expert.refresh_from_db()
+        self.assertEqual(expert.expert_image.name, upload["name"])
+        self.assertTrue(response.data["expert_image"].endswith(upload["name"]))
+
+    def test_presigned_url_only_accepts_declared_size_and_type(self):
+        body = jpeg_bytes()
+        upload = self.start_upload("profile_image", body)
+
+        # When / Then: 신고한 크기/형식과 다르면 저장소가 거부
+        self.assertEqual(self.put(upload, body + b"extra").status_code, 403)
+        self.assertEqual(self.put(upload, body, **{"Content-Type": "image/png"}).status_code, 403)
+        self.assertEqual(self.s3.put_count, 0)
+
+        # When: 최대 크기를 넘는 파일은 URL 을 발급하지 않음
+        response = self.client.post(
+            reverse("uploads:create"), {"kind": "profile_image", "content_type": "image/jpeg", "size": 11 * 1024**2}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_profile_image_upload_id_validated_before_attach(self):
+        url = reverse("users:user_mypage")
+        body = jpeg_bytes()
+        upload = self.start_upload("profile_image", body)
+
+        # When: 업로드 전에 연결 시도 -> 거부
+        response = self.client.patch(url, {"profile_image_upload_id": upload["upload_id"]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # When: 다른 종류(전문가 이미지)로 발급받은 upload_id -> 거부
+        other = self.start_upload("expert_image", body)
+        self.put(other, body)
+        response = self.client.patch(url, {"profile_image_upload_id": other["upload_id"]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # When: 업로드 완료 후 연결
+        self.put(upload, body)
+        response = self.client.patch(url, {"profile_image_upload_id": upload["upload_id"]})
+
+        # Then: 프로필 이미지로 연결됨
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image.name, upload["name"])
+
+    def test_non_image_upload_rejected_and_deleted(self):
+        # Given: 이미지 형식으로 신고하고 이미지가 아닌 파일을 업로드
+        body = b"#!/bin/sh\necho not an image\n"
+        upload = self.start_upload("profile_image", body)
+        self.put(upload, body)
+
+        # When: 연결 시도
+        response = self.client.patch(reverse("users:user_mypage"), {"profile_image_upload_id": upload["upload_id"]})
+
+        # Then: 거부되고 저장소에서 삭제됨
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn((STUB_BUCKET, f"media/{upload['name']}"), self.s3.objects)
@@ -0,0 +1,133 @@
+from channels.db import database_sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+from django.urls import path
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from chat.chat_consumer import ChatConsumer
+from chat.models import ChatRoom
+from common.websocket_auth import JWTAuthMiddleware
+from estimations.models import EstimationsRequest
+from expert.models import Expert
+from notifications.consumers import NotificationConsumer
+from users.auth_cache import get_auth_user
+
+User = get_user_model()
+
+
+class AuthUserCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="expert@example.com", name="전문가", phone_number="01012345678", gender="M", is_active=True
+        )
+        self.expert = Expert.objects.create(user=self.user, service="mc", available_location="seoul", appeal="소개")
+
+    def test_cached_user_needs_no_queries(self):
+        # Given: 한 번 조회하여 캐시에 저장
+        get_auth_user(self.user.id)
+
+        # When / Then: 다시 조회할 때는 전문가 정보까지 DB 조회 없이 반환
+        with self.assertNumQueries(0):
+            user = get_auth_user(self.user.id)
+            self.assertEqual(user.expert.id, self.expert.id)
+
+    def test_cache_invalidated_on_user_change(self):
+        get_auth_user(self.user.id)
+
+        # When: 유저 비활성화
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        # Then: 새 버전의 캐시에서 변경된 정보를 조회
+        self.assertFalse(get_auth_user(self.user.id).is_active)
+
+
+class JWTAuthMiddlewareTest(TransactionTestCase):
+    def setUp(self):
+        # Given: 전문가 유저와 access token
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="expert@example.com",
+            name="전문가",
+            phone_number="01012345678",
+            gender="M",
+            is_active=True,
+            is_expert=True,
+        )
+        self.expert = Expert.objects.create(user=self.user, service="mc", available_location="seoul", appeal="소개")
+        self.token = str(AccessToken.for_user(self.user))
+        self.application = JWTAuthMiddleware(
+            URLRouter(
+                [
+                    path("ws/notifications/<int:user_id>/", NotificationConsumer.as_asgi()),
+                    path("ws/chat/<int:room_id>/", ChatConsumer.as_asgi()),
+                ]
+            )
+        )
+
+    def create_room(self):
+        guest = User.objects.create_user(
+            email="guest@example.com", name="게스트", phone_number="01087654321", gender="M"
+        )
+        request = EstimationsRequest.objects.create(
+            user=guest,
+            service_list="mc",
+            prefer_gender="M",
+            status="pending",
+            location="seoul",
+            wedding_datetime=timezone.now(),
+        )
+        return ChatRoom.objects.create(user=guest, expert=self.expert, request=request)
+
+    async def test_connect_with_query_param_token(self):
+        # When: query param 으로 토큰 전달
+        communicator = WebsocketCommunicator(self.application, f"/ws/notifications/{self.user.id}/?token={self.token}")
+        connected, _ = await communicator.connect()
+
+        # Then: 인증된 유저로 연결됨
+        self.assertTrue(connected)
+        await communicator.disconnect()
+
+    async def test_connect_with_subprotocol_token(self):
+        # Given: 전문가가 참여한 채팅방
+        room = await database_sync_to_async(self.create_room)()
+
+        # When: ["Bearer", token] subprotocol 로 토큰 전달
+        communicator = WebsocketCommunicator(
+            self.application, f"/ws/chat/{room.id}/", subprotocols=["Bearer", self.token]
+        )
+        connected, subprotocol = await communicator.connect()
+
+        # Then: 연결되고 "Bearer" subprotocol 을 선택
+        self.assertTrue(connected)
+        self.assertEqual(subprotocol, "Bearer")
+        await communicator.disconnect()
+
+    async def test_scope_has_expert_info(self):
+        scopes = []
+
+        async def inner(scope, receive, send):
+            scopes.append(scope)
+
+        # When: 미들웨어를 통과한 scope 확인
+        await JWTAuthMiddleware(inner)(
+            {"type": "websocket", "query_string": f"token={self.token}".encode()}, None, None
+        )
+
+        # Then
+        self.assertTrue(scopes[0]["is_expert"])
+        self.assertEqual(scopes[0]["expert_id"], self.expert.id)
+
+    async def test_invalid_token_rejected(self):
+        # When: 잘못된 토큰
+        communicator = WebsocketCommunicator(self.application, "/ws/notifications/1/?token=invalid")
+        connected, _ = await communicator.connect()
+
+        # Then: 익명 유저로 처리되어 연결 거부
+        self.assertFalse(connected)
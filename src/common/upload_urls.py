@@ -0,0 +1,8 @@
+from django.urls import path
+
+from common.views import DirectUploadCreateView
+
+app_name = "uploads"
+urlpatterns = [
+    path("", DirectUploadCreateView.as_view(), name="create"),
+]
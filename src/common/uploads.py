@@ -0,0 +1,155 @@
+# common/uploads.py
+import uuid
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
+from rest_framework import serializers
+from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+from chat.models import Message
+from common.exceptions import BadRequestException
+from expert.models import Expert
+from reviews.models import ReviewImages
+from users.models import User
+
+# 업로드 종류 -> (모델, 이미지 필드) - 객체 키는 이미지 필드의 upload_to 경로 아래에 만듦
+UPLOAD_KINDS = {
+    "expert_image": (Expert, "expert_image"),
+    "profile_image": (User, "profile_image"),
+    "review_image": (ReviewImages, "image"),
+    "chat_image": (Message, "image"),
+}
+CONTENT_TYPE_EXTENSIONS = {"image/jpeg": "jpg", "image/png": "png", "image/webp": "webp"}
+UPLOAD_TOKEN_SALT = "common.uploads"
+# 업로드 완료 확인 시 파일 형식 확인용으로 읽는 앞부분 크기
+SNIFF_BYTES = 16
+
+
+def sniff_content_type(head):
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def max_upload_bytes():
+    return getattr(settings, "DIRECT_UPLOAD_MAX_BYTES", 10 * 1024 * 1024)
+
+
+def get_upload_storage():
+    # presigned URL 은 S3 호환 저장소(NCP Object Storage)에서만 발급 가능
+    if not isinstance(default_storage, S3Storage):
+        raise BadRequestException("직접 업로드를 지원하지 않는 저장소입니다.", code="direct_upload_unavailable")
+    return default_storage
+
+
+def object_key(storage, name):
+    # 저장소 이름(images/...) -> 버킷 객체 키 (MediaStorage.location 접두사 포함)
+    return storage._normalize_name(clean_name(name))
+
+
+def create_upload(user, kind, content_type, size):
+    """
+    클라이언트가 저장소에 직접 올릴 presigned PUT URL 과 upload_id 를 발급합니다.
+    - 키는 업로드 종류의 images/... 경로 아래 유저 별 경로에 임의 이름으로 만듦
+    - Content-Type / Content-Length 가 서명에 포함되므로 신고한 형식/크기와 다른 파일은 저장소가 거부
+    - upload_id 는 (유저, 종류, 이름) 을 서명한 값이며, 모델에 연결할 때 다시 확인합니다.
+    """
+    model, image_field = UPLOAD_KINDS[kind]
+    prefix = model._meta.get_field(image_field).upload_to
+    name = f"{prefix}{user.id}/{uuid.uuid4().hex}.{CONTENT_TYPE_EXTENSIONS[content_type]}"
+
+    storage = get_upload_storage()
+    expires_in = getattr(settings, "DIRECT_UPLOAD_URL_EXPIRES", 300)
+    params = {
+        "Bucket": storage.bucket_name,
+        "Key": object_key(storage, name),
+        "ContentType": content_type,
+        "ContentLength": size,
+    }
+    headers = {"Content-Type": content_type}
+    if storage.default_acl:
+        params["ACL"] = storage.default_acl
+        headers["x-amz-acl"] = storage.default_acl
+
+    upload_url = storage.connection.meta.client.generate_presigned_url(
+        "put_object", Params=params, ExpiresIn=expires_in, HttpMethod="PUT"
+    )
+    upload_id = signing.dumps({"user": user.id, "kind": kind, "name": name}, salt=UPLOAD_TOKEN_SALT)
+    return {
+        "upload_id": upload_id,
+        "name": name,
+        "upload_url": upload_url,
+        "method": "PUT",
+        "headers": headers,
+        "expires_in": expires_in,
+    }
+
+
+def confirm_upload(user, kind, upload_id):
+    """
+    업로드가 끝났는지 확인하고 모델에 연결할 저장소 이름을 반환합니다.
+    - 객체 앞부분만 Range GET 한 번으로 조회하여 존재 여부, 전체 크기, 실제 파일 형식을 확인 (파일 본문은 워커를 거치지 않음)
+    - 이미지가 아니면 객체를 삭제하고 거부합니다.
+    """
+    try:
+        data = signing.loads(
+            upload_id, salt=UPLOAD_TOKEN_SALT, max_age=getattr(settings, "DIRECT_UPLOAD_TOKEN_MAX_AGE", 60 * 60)
+        )
+    except signing.BadSignature:
+        raise BadRequestException("유효하지 않거나 만료된 업로드입니다.", code="invalid_upload")
+    if data["user"] != user.id or data["kind"] != kind:
+        raise BadRequestException("유효하지 않거나 만료된 업로드입니다.", code="invalid_upload")
+
+    storage = get_upload_storage()
+    client = storage.connection.meta.client
+    key = object_key(storage, data["name"])
+    try:
+        response = client.get_object(Bucket=storage.bucket_name, Key=key, Range=f"bytes=0-{SNIFF_BYTES - 1}")
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            raise BadRequestException("업로드가 완료되지 않았습니다.", code="upload_not_found")
+        raise
+
+    head = response["Body"].read()
+    size = int(response.get("ContentRange", "").rpartition("/")[2] or response["ContentLength"])
+    if sniff_content_type(head) is None or size > max_upload_bytes():
+        client.delete_object(Bucket=storage.bucket_name, Key=key)
+        raise BadRequestException("이미지 파일만 업로드할 수 있습니다.", code="invalid_upload")
+    return data["name"]
+
+
+class UploadedImageField(serializers.CharField):
+    """
+    파일 대신 upload_id 를 받아 업로드를 확인하고, 모델 이미지 필드에 저장할 이름으로 변환하는 필드
+    예: expert_image_upload_id = UploadedImageField(kind="expert_image", source="expert_image")
+    """
+
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+        kwargs.setdefault("write_only", True)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        upload_id = super().to_internal_value(data)
+        try:
+            return confirm_upload(self.context["request"].user, self.kind, upload_id)
+        except BadRequestException as e:
+            raise serializers.ValidationError(e.detail, code=e.code)
+
+
+class DirectUploadSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=list(UPLOAD_KINDS))
+    content_type = serializers.ChoiceField(choices=list(CONTENT_TYPE_EXTENSIONS))
+    size = serializers.IntegerField(min_value=1)
+
+    def validate_size(self, value):
+        if value > max_upload_bytes():
+            raise serializers.ValidationError(f"파일 크기는 {max_upload_bytes() // (1024 * 1024)}MB 이하여야 합니다.")
+        return value
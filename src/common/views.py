@@ -1,16 +1,24 @@
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.constants.choices import AREA_CHOICES, SERVICE_CHOICES
+from common.response_cache import CachedResponseMixin
+from common.uploads import DirectUploadSerializer, create_upload
 
+# 선택지는 코드 상수이므로 배포 전까지 변하지 않음
+CHOICES_CACHE_TIMEOUT = 60 * 60 * 24
 
-class ServiceChoicesView(APIView):
+
+class ServiceChoicesView(CachedResponseMixin, APIView):
     """
     서비스 목록을 반환하는 API
     """
 
+    cache_timeout = CHOICES_CACHE_TIMEOUT
+
     @extend_schema(
         tags=["Service"],
         summary="가능한 서비스 목록 조회 - 누구나",
@@ -47,11 +55,13 @@ class ServiceChoicesView(APIView):
             )
 
 
-class LocationChoicesView(APIView):
+class LocationChoicesView(CachedResponseMixin, APIView):
     """
     지역 목록을 반환하는 API
     """
 
+    cache_timeout = CHOICES_CACHE_TIMEOUT
+
     @extend_schema(
         tags=["Service"],
         summary="서비스 가능 지역 목록 조회 - 누구나",
@@ -114,3 +124,37 @@ class LocationChoicesView(APIView):
                 {"detail": f"오류가 발생했습니다. {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class DirectUploadCreateView(APIView):
+    """
+    이미지 직접 업로드 URL 발급 API
+    클라이언트는 upload_url 로 파일을 PUT 한 뒤, 이미지를 받는 API 에 파일 대신 upload_id 를 전달합니다.
+    (전문가 expert_image_upload_id, 유저 profile_image_upload_id, 리뷰 image_upload_ids, 채팅 image_upload_id)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        tags=["Upload"],
+        summary="이미지 직접 업로드 URL 발급 - 로그인 유저",
+        request=DirectUploadSerializer,
+        responses={
+            201: {
+                "type": "object",
+                "properties": {
+                    "upload_id": {"type": "string"},
+                    "name": {"type": "string", "example": "images/experts/profile/1/3f2a.jpg"},
+                    "upload_url": {"type": "string", "format": "uri"},
+                    "method": {"type": "string", "example": "PUT"},
+                    "headers": {"type": "object", "example": {"Content-Type": "image/jpeg"}},
+                    "expires_in": {"type": "integer", "example": 300},
+                },
+            },
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = DirectUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = create_upload(request.user, **serializer.validated_data)
+        return Response(upload, status=status.HTTP_201_CREATED)
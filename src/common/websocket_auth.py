@@ -0,0 +1,59 @@
+# common/websocket_auth.py
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common.logging_config import logger
+from users.auth_cache import get_auth_user, get_expert_id
+
+
+def get_raw_token(scope):
+    """
+    (access token, 응답할 subprotocol) 을 반환합니다.
+    - subprotocol: new WebSocket(url, ["Bearer", token]) -> 핸드셰이크에서 "Bearer" 를 선택해야 함
+    - query param: ws://.../?token=<access token>
+    """
+    subprotocols = scope.get("subprotocols") or []
+    if len(subprotocols) >= 2 and subprotocols[0] in api_settings.AUTH_HEADER_TYPES:
+        return subprotocols[1], subprotocols[0]
+
+    tokens = parse_qs(scope.get("query_string", b"").decode()).get("token")
+    if tokens:
+        return tokens[0], None
+    return None, None
+
+
+@database_sync_to_async
+def resolve_user(raw_token):
+    try:
+        # 서명/만료 검증만 하므로 DB 조회 없음
+        token = AccessToken(raw_token)
+    except TokenError as e:
+        logger.info(f"Invalid WebSocket token: {str(e)}")
+        return None
+    user = get_auth_user(token[api_settings.USER_ID_CLAIM])
+    return user if user and user.is_active else None
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """
+    SimpleJWT access token 으로 WebSocket 연결을 인증합니다 (세션 조회 없음).
+    scope 에 user, is_expert, expert_id, auth_subprotocol 을 설정하며,
+    유저는 짧은 TTL 캐시로 조회하므로 consumer connect 에서 DB 조회가 필요 없습니다.
+    """
+
+    async def __call__(self, scope, receive, send):
+        scope = dict(scope)
+        raw_token, subprotocol = get_raw_token(scope)
+        user = await resolve_user(raw_token) if raw_token else None
+
+        scope["user"] = user or AnonymousUser()
+        scope["is_expert"] = bool(user and user.is_expert)
+        scope["expert_id"] = get_expert_id(user) if user else None
+        scope["auth_subprotocol"] = subprotocol
+        return await super().__call__(scope, receive, send)
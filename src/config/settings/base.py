@@ -50,6 +50,9 @@ INSTALLED_APPS = CUSTOM_APPS + THIRDPARTY_APPS + DJANGO_APPS
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "common.middleware.QueryBudgetMiddleware",
+    "common.middleware.DatabasePoolMetricsMiddleware",
+    "common.middleware.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -59,6 +62,21 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# 요청 별 쿼리 예산 (view 의 query_budget 속성이 없을 때 사용, None 이면 검사하지 않음)
+QUERY_BUDGET_DEFAULT = None
+# 같은 SQL 이 이 횟수 이상 반복되면 N+1 로 보고 로그를 남김
+QUERY_DUPLICATE_THRESHOLD = 5
+# 예산 초과 시 예외 발생 여부 (테스트에서 사용)
+QUERY_BUDGET_STRICT = False
+
+# 읽기 전용 복제본 라우팅 - DATABASES 에 DATABASE_REPLICA_ALIAS 가 있을 때만 안전한 요청의 조회를 복제본으로 보냄
+DATABASE_ROUTERS = ["common.db_router.PrimaryReplicaRouter"]
+DATABASE_REPLICA_ALIAS = "replica"
+# 쓰기 요청 이후 같은 클라이언트의 조회를 primary 로 보내는 시간(초) - 복제 지연보다 길게 설정
+DATABASE_REPLICA_STICKY_SECONDS = 5
+# 워커 별 DB 연결 풀 통계 로그 주기(초), None 이면 기록하지 않음
+DB_POOL_METRICS_INTERVAL = 60
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "https://localhost:5173",
@@ -97,6 +115,37 @@ CHANNEL_LAYERS = {
     },
 }
 
+# 채팅 메시지 write-behind - N 개가 쌓이거나 T ms 가 지나면 bulk_create 로 저장
+CHAT_MESSAGE_FLUSH_SIZE = 50
+CHAT_MESSAGE_FLUSH_INTERVAL_MS = 200
+# 채팅 WebSocket 참여자 확인 결과를 재사용하는 시간(초) - 이후 메시지에서 다시 확인
+CHAT_PARTICIPANT_RECHECK_SECONDS = 30
+
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://redis:6379/1",  # 채널 레이어(db 0)와 분리
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        },
+    },
+    # 리프레시 토큰 폐기 상태(users/tokens.py) 전용 - 응답 캐시와 분리된 Redis (noeviction)
+    # 폐기 기록이 밀려나거나 장애 시 무시되면 로그아웃/폐기된 토큰이 통과하므로 예외를 무시하지 않음
+    "auth": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://redis-auth:6379/0",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": False,
+        },
+    },
+}
+# 리프레시 토큰 폐기 상태를 저장할 캐시 alias (없으면 default 사용)
+AUTH_REVOCATION_CACHE_ALIAS = "auth"
+# Redis 장애 시 캐시 미스로 처리하고 DB 로 대체 (로그만 남김, auth 캐시 제외)
+DJANGO_REDIS_IGNORE_EXCEPTIONS = True
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+
 AUTH_USER_MODEL = "users.User"
 
 SIMPLE_JWT = {
@@ -109,6 +158,9 @@ SIMPLE_JWT = {
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
 }
 
+# JWT 인증 유저 캐시 유지 시간(초) - 유저/전문가 변경 시에는 즉시 삭제
+AUTH_USER_CACHE_TIMEOUT = 60
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -140,11 +192,12 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "common.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    "DEFAULT_PAGINATION_CLASS": "common.pagination.DefaultLimitOffsetPagination",
 }
 
 SPECTACULAR_SETTINGS = {
@@ -159,6 +212,25 @@ STATIC_ROOT = BASE_DIR / "static"
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# 알림 월 파티션 관리 (maintain_notification_partitions) - 읽은 알림 보관 기간(일), 읽지 않은 알림 보관 기간(일),
+# 미리 만들어 둘 이후 월 파티션 수, 삭제 전 내보낸 파티션(--archive)을 저장할 경로
+NOTIFICATION_RETENTION_DAYS = 90
+NOTIFICATION_UNREAD_RETENTION_DAYS = 365
+NOTIFICATION_PARTITION_MONTHS_AHEAD = 3
+NOTIFICATION_ARCHIVE_PREFIX = "archives/notifications/"
+
+# 이미지 업로드 커밋 후 바로 리사이즈/WebP 변형 이미지 생성 (False 이면 generate_image_variants 명령으로 처리)
+IMAGE_VARIANTS_ON_UPLOAD = True
+# 이미지 직접 업로드(presigned PUT) - 최대 파일 크기, 업로드 URL 유효 시간(초), upload_id 유효 시간(초)
+DIRECT_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+DIRECT_UPLOAD_URL_EXPIRES = 300
+DIRECT_UPLOAD_TOKEN_MAX_AGE = 60 * 60
+
+# 소셜 provider HTTP 클라이언트 - 연결/응답 timeout(초), 재시도 횟수, 연결 풀 크기
+OAUTH_HTTP_CONNECT_TIMEOUT = 3
+OAUTH_HTTP_READ_TIMEOUT = 5
+OAUTH_HTTP_RETRIES = 2
+OAUTH_HTTP_POOL_SIZE = 20
 
 # 네이버 oauth
 NAVER_CALLBACK_URL = "http://localhost:5173/login/naver/callback/"
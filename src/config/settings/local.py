@@ -24,6 +24,15 @@ DATABASES = {
     }
 }
 
+# 읽기 분산 테스트용 두 번째 로컬 인스턴스 (docker-compose 의 db_replica)
+# 운영과 달리 복제되지 않는 독립된 DB 이므로 테스트 러너가 복제본 테스트 DB 도 따로 만들고 마이그레이션함
+if ENV.get("POSTGRES_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": ENV["POSTGRES_REPLICA_HOST"],
+        "PORT": ENV.get("POSTGRES_REPLICA_PORT", 5432),
+    }
+
 # Static
 STATIC_URL = "static/"
 STATIC_DIRS = [BASE_DIR / "static"]
@@ -12,17 +12,40 @@ SECRET_KEY = ENV.get(
 )
 
 # Database
+# uvicorn 워커(프로세스) 별 psycopg 연결 풀 - 요청마다 새 연결을 맺지 않음
+# 전체 연결 수 = 서버 수 x 워커 수 x DB_POOL_MAX_SIZE (primary/복제본 각각) 가 Postgres max_connections 보다 작아야 함
+DB_POOL_OPTIONS = {
+    "min_size": int(ENV.get("DB_POOL_MIN_SIZE", 2)),
+    "max_size": int(ENV.get("DB_POOL_MAX_SIZE", 10)),
+    # 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초) - 초과하면 요청 실패 (포화 시 무한정 대기하지 않음)
+    "timeout": float(ENV.get("DB_POOL_TIMEOUT", 5)),
+}
+
 
-DATABASES = {
-    "default": {
+def postgres_database(prefix, **extra):
+    # 복제본(POSTGRES_REPLICA_*) 설정이 없는 값은 primary(POSTGRES_*) 값을 사용
+    def env(name, default):
+        return ENV.get(f"{prefix}_{name}", ENV.get(f"POSTGRES_{name}", default))
+
+    return {
         "ENGINE": "django.db.backends.postgresql",
-        "HOST": ENV.get("POSTGRES_HOST", "db"),
-        "USER": ENV.get("POSTGRES_USER", "postgres"),
-        "PASSWORD": ENV.get("POSTGRES_PASSWORD", "postgres"),
-        "NAME": ENV.get("POSTGRES_DBNAME", "oz_collabo"),
-        "PORT": ENV.get("POSTGRES_PORT", 5432),
+        "HOST": env("HOST", "db"),
+        "USER": env("USER", "postgres"),
+        "PASSWORD": env("PASSWORD", "postgres"),
+        "NAME": env("DBNAME", "oz_collabo"),
+        "PORT": env("PORT", 5432),
+        # 풀에서 꺼낸 연결이 끊어져 있으면 다시 연결 (DB 재시작, 유휴 연결 정리 대비)
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {"pool": DB_POOL_OPTIONS},
+        **extra,
     }
-}
+
+
+DATABASES = {"default": postgres_database("POSTGRES")}
+
+# 읽기 전용 복제본 (POSTGRES_REPLICA_HOST 설정 시) - common.db_router 가 안전한 요청의 조회를 보냄
+if ENV.get("POSTGRES_REPLICA_HOST"):
+    DATABASES["replica"] = postgres_database("POSTGRES_REPLICA", TEST={"MIRROR": "default"})
 
 # OAuth
 NAVER_CLIENT_ID = ENV.get("NAVER_CLIENT_ID", "")
@@ -34,15 +57,20 @@ GOOGLE_CLIENT_ID = ENV.get("GOOGLE_CLIENT_ID", "")
 GOOGLE_CLIENT_SECRET = ENV.get("GOOGLE_CLIENT_SECRET", "")
 
 # NCP Object Storage 설정
-AWS_ACCESS_KEY_ID = (ENV.get("AWS_ACCESS_KEY_ID", ""),)
-AWS_SECRET_ACCESS_KEY = (ENV.get("AWS_SECRET_ACCESS_KEY", ""),)
-AWS_STORAGE_BUCKET_NAME = (ENV.get("AWS_STORAGE_BUCKET_NAME", ""),)
+AWS_ACCESS_KEY_ID = ENV.get("AWS_ACCESS_KEY_ID", "")
+AWS_SECRET_ACCESS_KEY = ENV.get("AWS_SECRET_ACCESS_KEY", "")
+AWS_STORAGE_BUCKET_NAME = ENV.get("AWS_STORAGE_BUCKET_NAME", "")
 AWS_S3_ENDPOINT_URL = "https://kr.object.ncloudstorage.com"  # NCP Endpoint
 AWS_S3_REGION_NAME = "kr-standard"  # 리전 (kr-standard)
+AWS_S3_SIGNATURE_VERSION = "s3v4"  # presigned 업로드 URL 서명 방식
 
-# 정적 및 미디어 파일 설정
-STATICFILES_STORAGE = "config.storages.StaticStorage"  # Static 파일 저장소
-DEFAULT_FILE_STORAGE = "config.storages.s3boto3.MediaStorage"  # Media 파일 저장소
+# 정적 및 미디어 파일 설정 (Django 5.1 부터 STATICFILES_STORAGE / DEFAULT_FILE_STORAGE 대신 STORAGES 사용)
+# - Media: Object Storage
+# - Static: 로컬 파일 (entrypoint.sh 의 collectstatic -> static_volume, nginx 의 /static/ 에서 제공)
+STORAGES = {
+    "default": {"BACKEND": "config.storages.MediaStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
 
 # 파일 URL 설정
 AWS_QUERYSTRING_AUTH = False  # False로 설정하면 Public URL로 접근 가능
@@ -19,6 +19,7 @@ urlpatterns = [
     path("api/v1/chat/", include("chat.urls")),
     path("api/v1/notifications/", include("notifications.urls")),
     path("api/v1/services/", include("common.urls")),
+    path("api/v1/uploads/", include("common.upload_urls")),
 ]
 
 
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-18 02:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("estimations", "0007_alter_estimation_location_alter_estimation_service_and_more"),
+        ("expert", "0006_alter_career_expert"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="estimation",
+            index=models.Index(fields=["expert", "due_date"], name="estimation_expert_due_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="estimationsrequest",
+            index=models.Index(fields=["user", "status"], name="est_request_user_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="requestmanager",
+            index=models.Index(fields=["expert", "-created_at"], name="request_manager_expert_idx"),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.15 on 2026-10-18 02:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from common.choice_index import backfill_choice_index
+
+
+def backfill_request_services(apps, schema_editor):
+    backfill_choice_index(
+        apps.get_model("estimations", "RequestService"),
+        apps.get_model("estimations", "EstimationsRequest"),
+        "request",
+        "service",
+        "service_list",
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("estimations", "0008_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestService",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "service",
+                    models.CharField(
+                        choices=[
+                            ("mc", "결혼식 사회자"),
+                            ("snap", "스냅 촬영"),
+                            ("singer", "축가 가수"),
+                            ("video", "영상 촬영"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "request",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="requested_services",
+                        to="estimations.estimationsrequest",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("service", "request"), name="unique_request_service")],
+            },
+        ),
+        migrations.RunPython(backfill_request_services, migrations.RunPython.noop),
+    ]
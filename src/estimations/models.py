@@ -1,6 +1,7 @@
 from django.db import models
 from multiselectfield import MultiSelectField
 
+from common.choice_index import sync_choice_index
 from common.constants.choices import (
     AREA_CHOICES,
     GENDER_CHOICES,
@@ -11,6 +12,14 @@ from expert.models import Expert
 from users.models import User
 
 
+class EstimationsRequestQuerySet(models.QuerySet):
+    def requesting(self, service):
+        """
+        service 를 요청한 견적 요청 (service_list 문자열 비교 대신 RequestService 인덱스로 조회)
+        """
+        return self.filter(requested_services__service=service)
+
+
 class EstimationsRequest(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     service_list = MultiSelectField(choices=SERVICE_CHOICES, max_length=30)
@@ -22,6 +31,32 @@ class EstimationsRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EstimationsRequestQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 유저의 견적 요청 목록 (status 필터)
+            models.Index(fields=["user", "status"], name="est_request_user_status_idx"),
+        ]
+
+
+class RequestService(models.Model):
+    """
+    EstimationsRequest.service_list 의 정규화 인덱스 - 서비스 별 견적 요청 조회용 (post_save 시그널로 동기화)
+    """
+
+    request = models.ForeignKey(EstimationsRequest, on_delete=models.CASCADE, related_name="requested_services")
+    service = models.CharField(choices=SERVICE_CHOICES, max_length=10)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["service", "request"], name="unique_request_service"),
+        ]
+
+    @classmethod
+    def sync(cls, requests):
+        sync_choice_index(cls, "request", "service", requests, "service_list")
+
 
 class Estimation(models.Model):
     request = models.ForeignKey(EstimationsRequest, on_delete=models.CASCADE)
@@ -33,9 +68,21 @@ class Estimation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 전문가의 견적 목록 (year/month 필터는 due_date 범위 조건으로 변환됨)
+            models.Index(fields=["expert", "due_date"], name="estimation_expert_due_idx"),
+        ]
+
 
 class RequestManager(models.Model):
     expert = models.ForeignKey(Expert, on_delete=models.CASCADE, related_name="received_requests")
     request = models.ForeignKey(EstimationsRequest, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # 전문가가 받은 견적 요청 목록 (최신 순)
+            models.Index(fields=["expert", "-created_at"], name="request_manager_expert_idx"),
+        ]
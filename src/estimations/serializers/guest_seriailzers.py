@@ -1,14 +1,14 @@
 from datetime import timedelta
 
-from django.db.models import Avg
 from django.utils import timezone
 from rest_framework import fields, serializers
 
 from common.constants.choices import AREA_CHOICES, SERVICE_CHOICES
+from common.images import ImageVariantsField
 from estimations.models import Estimation, EstimationsRequest
 from expert.models import Expert
 from expert.seriailzers import CareerSerializer
-from reviews.models import Review
+from reviews.models import ExpertRating
 from users.models import User
 
 
@@ -25,6 +25,7 @@ class EstimationExpertSerializer(serializers.ModelSerializer):
     user = ExpertUserSerializer(read_only=True)
     careers = CareerSerializer(many=True, read_only=True)
     rating = serializers.SerializerMethodField()
+    expert_image_variants = ImageVariantsField(image_field="expert_image")
     service_display = serializers.CharField(source="get_service_display", read_only=True)
     available_location_display = serializers.CharField(source="get_available_location_display", read_only=True)
 
@@ -34,6 +35,7 @@ class EstimationExpertSerializer(serializers.ModelSerializer):
             "id",
             "rating",
             "expert_image",
+            "expert_image_variants",
             "service",
             "service_display",
             "standard_charge",
@@ -47,6 +49,7 @@ class EstimationExpertSerializer(serializers.ModelSerializer):
             "id",
             "rating",
             "expert_image",
+            "expert_image_variants",
             "service",
             "service_display",
             "standard_charge",
@@ -58,13 +61,14 @@ class EstimationExpertSerializer(serializers.ModelSerializer):
         )
 
     def get_rating(self, obj):
-        average_rating = (
-            Review.objects.filter(reservation__estimation__expert_id=obj.id).aggregate(average_rating=Avg("rating"))[
-                "average_rating"
-            ]
-            or 0.0
-        )
-        return round(average_rating, 1)
+        # 리뷰 집계 테이블(ExpertRating)의 평균 평점을 사용 - 뷰에서 select_related("expert__rating_summary") 필요
+        try:
+            summary = obj.rating_summary
+        except ExpertRating.DoesNotExist:
+            return 0.0
+        if not summary.review_count:
+            return 0.0
+        return round(summary.rating_average, 1)
 
 
 class EstimationsRequestSerializer(serializers.ModelSerializer):
@@ -10,6 +10,7 @@ from rest_framework.permissions import IsAuthenticated
 
 from common.exceptions import BadRequestException
 from common.permissions.expert_permissions import IsExpert
+from common.streaming import StreamingListMixin
 from estimations.models import Estimation, EstimationsRequest, RequestManager
 from estimations.serializers.expert_serializers import (
     EstimationCreateByExpertSerializer,
@@ -29,7 +30,7 @@ class EstimationCreateByExpertAPIView(CreateAPIView):
 
 
 @extend_schema(tags=["estimation-expert"], summary="전문가가 자신이 내려준 견적을 params로 필터링 하여 리스트 확인")
-class EstimationListByExpertAPIView(ListAPIView):
+class EstimationListByExpertAPIView(StreamingListMixin, ListAPIView):
     permission_classes = (IsAuthenticated, IsExpert)
     serializer_class = EstimationListForExpertSerializer
 
@@ -74,7 +75,7 @@ class EstimationRequestListForExpertAPIView(ListAPIView):
     serializer_class = EstimationRequestListForExpertSerializer
 
     def get_queryset(self):
-        queryset = RequestManager.objects.filter(expert=self.request.user.expert)
+        queryset = RequestManager.objects.filter(expert=self.request.user.expert).order_by("-created_at")
 
         return queryset
 
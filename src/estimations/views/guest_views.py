@@ -22,14 +22,20 @@ class EstimationListAPIView(ListAPIView):
     serializer_class = EstimationSerializer
 
     def get_queryset(self):
-        return Estimation.objects.filter(request__user=self.request.user)
+        return (
+            Estimation.objects.filter(request__user=self.request.user)
+            .select_related("expert__user", "expert__rating_summary")
+            .prefetch_related("expert__careers")
+        )
 
 
 @extend_schema(tags=["estimations-user"], summary="유저가 견적 요청 후 전문가로 부터 받은 견적 중 특정 견적을 조회")
 class EstimationRetrieveAPIView(RetrieveAPIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = EstimationRetrieveSerializer
-    queryset = Estimation.objects.all()
+    queryset = Estimation.objects.select_related("request", "expert__user", "expert__rating_summary").prefetch_related(
+        "expert__careers"
+    )
     lookup_field = "estimation_id"
 
     def get_object(self):
@@ -1,13 +1,28 @@
 from django.db import models
 from multiselectfield import MultiSelectField
 
+from common.choice_index import sync_choice_index
 from common.constants.choices import AREA_CHOICES, SERVICE_CHOICES
 from users.models import User
 
 
+class ExpertQuerySet(models.QuerySet):
+    def serving(self, area, services=None):
+        """
+        area 지역에서 활동하는 (services 중 하나를 제공하는) 전문가
+        - available_location 문자열 비교 대신 ExpertServiceArea (area, expert) 인덱스로 조회
+        """
+        queryset = self.filter(service_areas__area=area)
+        if services is not None:
+            queryset = queryset.filter(service__in=services)
+        return queryset
+
+
 class Expert(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     expert_image = models.ImageField(upload_to="images/experts/profile/")
+    # 리사이즈/WebP 변형 이미지 정보 (common.images)
+    expert_image_variants = models.JSONField(default=dict, blank=True)
     service = models.CharField(choices=SERVICE_CHOICES, max_length=10, default="")
     standard_charge = models.IntegerField(default=0)
     available_location = MultiSelectField(choices=AREA_CHOICES, max_length=100)
@@ -15,6 +30,27 @@ class Expert(models.Model):
     create_at = models.DateTimeField(auto_now_add=True)
     update_at = models.DateTimeField(null=True, blank=True)
 
+    objects = ExpertQuerySet.as_manager()
+
+
+class ExpertServiceArea(models.Model):
+    """
+    Expert.available_location 의 정규화 인덱스 - 지역 별 전문가 조회용 (post_save 시그널로 동기화)
+    """
+
+    expert = models.ForeignKey(Expert, on_delete=models.CASCADE, related_name="service_areas")
+    area = models.CharField(choices=AREA_CHOICES, max_length=30)
+
+    class Meta:
+        constraints = [
+            # (area, expert) 순서 - 지역으로 전문가를 찾는 조회가 이 인덱스를 사용
+            models.UniqueConstraint(fields=["area", "expert"], name="unique_expert_service_area"),
+        ]
+
+    @classmethod
+    def sync(cls, experts):
+        sync_choice_index(cls, "expert", "area", experts, "available_location")
+
 
 class Career(models.Model):
     expert = models.ForeignKey(Expert, on_delete=models.CASCADE, related_name="careers")
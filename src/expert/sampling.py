@@ -0,0 +1,94 @@
+# expert/sampling.py
+import random
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from common.constants.choices import SERVICE_CHOICES
+from common.logging_config import logger
+from expert.models import Expert
+
+# id 풀 유지 시간 - bulk_create 처럼 시그널이 발생하지 않는 변경도 만료 후 반영됨
+EXPERT_POOL_TIMEOUT = 60 * 60
+# Redis SADD 한 번에 넣을 id 수
+EXPERT_POOL_CHUNK_SIZE = 5000
+
+
+def expert_pool_key(service):
+    return f"experts:pool:{service}"
+
+
+def get_redis_client():
+    """
+    django_redis 캐시이면 raw Redis 클라이언트, 아니면(LocMem 등) None
+    """
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def load_expert_ids(service):
+    return list(Expert.objects.filter(service=service).values_list("id", flat=True).iterator(chunk_size=5000))
+
+
+def sample_expert_ids(service, k):
+    """
+    service 전문가 중 k 명의 id 를 무작위로 선택
+    - Redis: 서비스 별 id SET 에서 SRANDMEMBER (O(k)), SET 이 없으면 DB 에서 한 번 채움
+    - 그 외 캐시: 캐시된 id 목록에서 random.sample
+    """
+    client = get_redis_client()
+    if client is None:
+        pool = cache.get(expert_pool_key(service))
+        if pool is None:
+            pool = load_expert_ids(service)
+            cache.set(expert_pool_key(service), pool, EXPERT_POOL_TIMEOUT)
+        return random.sample(pool, min(k, len(pool)))
+
+    key = cache.make_key(expert_pool_key(service))
+    try:
+        if not client.exists(key):
+            rebuild_redis_pool(client, key, service)
+        return [int(expert_id) for expert_id in client.srandmember(key, k)]
+    except RedisError as error:
+        logger.error(f"전문가 id 풀 조회 중 오류 발생: {str(error)}")
+        return list(Expert.objects.filter(service=service).order_by("?").values_list("id", flat=True)[:k])
+
+
+def rebuild_redis_pool(client, key, service):
+    expert_ids = load_expert_ids(service)
+    if not expert_ids:
+        return
+    # 임시 키에 채운 뒤 RENAME 하여 조회 중인 요청이 반쯤 채워진 SET 을 보지 않도록 함
+    temp_key = f"{key}:building:{random.getrandbits(32)}"
+    pipeline = client.pipeline()
+    for start in range(0, len(expert_ids), EXPERT_POOL_CHUNK_SIZE):
+        pipeline.sadd(temp_key, *expert_ids[start : start + EXPERT_POOL_CHUNK_SIZE])
+    pipeline.expire(temp_key, EXPERT_POOL_TIMEOUT)
+    pipeline.rename(temp_key, key)
+    pipeline.execute()
+
+
+def update_expert_pools(expert_id, service=None):
+    """
+    전문가 저장/삭제 시 id 풀 갱신 - 모든 서비스 풀에서 제거 후 현재 서비스 풀(이미 있는 경우)에 추가
+    service 가 None 이면 삭제로 처리합니다.
+    """
+    client = get_redis_client()
+    if client is None:
+        cache.delete_many([expert_pool_key(choice) for choice, _ in SERVICE_CHOICES])
+        return
+
+    try:
+        pipeline = client.pipeline()
+        for choice, _ in SERVICE_CHOICES:
+            pipeline.srem(cache.make_key(expert_pool_key(choice)), expert_id)
+        pipeline.execute()
+        key = cache.make_key(expert_pool_key(service)) if service else None
+        # 풀이 없으면 다음 조회 시 DB 에서 새로 채우므로 추가하지 않음
+        if key and client.exists(key):
+            client.sadd(key, expert_id)
+    except RedisError as error:
+        logger.error(f"전문가 id 풀 갱신 중 오류 발생: {str(error)}")
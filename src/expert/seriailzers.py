@@ -3,6 +3,8 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from common.constants.choices import AREA_CHOICES, SERVICE_CHOICES
+from common.images import ImageVariantsField
+from common.uploads import UploadedImageField
 from expert.models import Career, Expert
 
 
@@ -15,7 +17,12 @@ class CareerSerializer(serializers.ModelSerializer):
 class ExpertSerializer(serializers.ModelSerializer):
     user = serializers.SerializerMethodField()
     careers = CareerSerializer(many=True)
+    expert_image_variants = ImageVariantsField(image_field="expert_image")
+    # 파일 대신 직접 업로드(presigned URL)한 이미지의 upload_id
+    expert_image_upload_id = UploadedImageField(kind="expert_image", source="expert_image", required=False)
     service_display = serializers.SerializerMethodField()
+    # MultiSelectField 는 기본 매핑(ChoiceField)으로는 여러 지역을 받을 수 없으므로 선택지 목록으로 선언
+    available_location = serializers.ListField(child=serializers.ChoiceField(choices=AREA_CHOICES), allow_empty=False)
     available_location_display = serializers.SerializerMethodField()
 
     class Meta:
@@ -24,6 +31,8 @@ class ExpertSerializer(serializers.ModelSerializer):
             "user",
             "id",
             "expert_image",
+            "expert_image_variants",
+            "expert_image_upload_id",
             "service",
             "service_display",
             "standard_charge",
@@ -36,6 +45,7 @@ class ExpertSerializer(serializers.ModelSerializer):
             "user",
             "id",
         )
+        extra_kwargs = {"expert_image": {"required": False}}
 
     @extend_schema_field(
         {
@@ -79,6 +89,12 @@ class ExpertSerializer(serializers.ModelSerializer):
         careers = instance.career_set.all()
         return CareerSerializer(careers, many=True).data
 
+    def validate(self, attrs):
+        # 전문가 생성 시 이미지(파일 또는 upload_id)는 필수
+        if self.instance is None and not attrs.get("expert_image"):
+            raise serializers.ValidationError({"expert_image_upload_id": "전문가 이미지는 필수입니다."})
+        return attrs
+
     def validate_careers(self, value):
         """
         careers 필드의 데이터 유효성 검증.
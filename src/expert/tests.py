@@ -1,12 +1,18 @@
 import io
+import json
+import shutil
+import tempfile
 
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 from django.urls import reverse
 from PIL import Image
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from expert.models import Career, Expert
+from expert.sampling import sample_expert_ids
 from users.models import User
 
 
@@ -15,6 +21,13 @@ class ExpertCreationTestCase(APITestCase):
         """
         테스트에 필요한 기본 데이터 설정
         """
+        # 업로드한 전문가 이미지는 임시 MEDIA_ROOT 에 저장
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
         self.user = User.objects.create_user(
             email="test@example.com",
             name="Test User",
@@ -45,26 +58,29 @@ class ExpertCreationTestCase(APITestCase):
             "standard_charge": 500000,
             "appeal": "어필1",
             "available_location": ["seoul", "busan"],
-            "careers": [
-                {
-                    "title": "Wedding MC",
-                    "description": "Worked as a wedding MC for 5 years",
-                    "start_date": "2015-01-01",
-                    "end_date": "2020-01-01",
-                },
-                {
-                    "title": "Event Host",
-                    "description": "Hosted corporate events",
-                    "start_date": "2020-02-01",
-                    "end_date": "2023-01-01",
-                },
-                {
-                    "title": "Public Speaker",
-                    "description": "Delivered motivational speeches",
-                    "start_date": "2018-01-01",
-                    "end_date": "2021-01-01",
-                },
-            ],
+            # multipart 요청에서 경력 목록은 JSON 문자열로 전송
+            "careers": json.dumps(
+                [
+                    {
+                        "title": "Wedding MC",
+                        "description": "Worked as a wedding MC for 5 years",
+                        "start_date": "2015-01-01",
+                        "end_date": "2020-01-01",
+                    },
+                    {
+                        "title": "Event Host",
+                        "description": "Hosted corporate events",
+                        "start_date": "2020-02-01",
+                        "end_date": "2023-01-01",
+                    },
+                    {
+                        "title": "Public Speaker",
+                        "description": "Delivered motivational speeches",
+                        "start_date": "2018-01-01",
+                        "end_date": "2021-01-01",
+                    },
+                ]
+            ),
         }
         data["expert_image"] = self.generate_test_image()
 
@@ -80,3 +96,48 @@ class ExpertCreationTestCase(APITestCase):
         self.assertEqual(Career.objects.count(), 3)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Expert.objects.count(), 1)
+
+
+class ExpertRandomListTestCase(APITestCase):
+    def setUp(self):
+        # Given: mc 전문가 5명과 snap 전문가 1명
+        cache.clear()
+        self.mc_expert_ids = set()
+        for index in range(6):
+            user = User.objects.create_user(
+                email=f"expert{index}@example.com",
+                name=f"전문가{index}",
+                gender="M",
+                phone_number="010-1234-5678",
+            )
+            with self.captureOnCommitCallbacks(execute=True):
+                expert = Expert.objects.create(
+                    user=user,
+                    service="mc" if index < 5 else "snap",
+                    available_location="seoul",
+                    appeal="경험 많은 웨딩 전문가입니다.",
+                )
+            if expert.service == "mc":
+                self.mc_expert_ids.add(expert.id)
+
+    def test_random_experts_sampled_from_service(self):
+        # When: 랜덤 조회
+        response = self.client.get(reverse("experts:expert_list"), {"service": "mc", "random": "true"})
+
+        # Then: 해당 서비스의 서로 다른 전문가 3명 반환
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        returned_ids = {expert["id"] for expert in response.data}
+        self.assertEqual(len(returned_ids), 3)
+        self.assertTrue(returned_ids <= self.mc_expert_ids)
+
+    def test_deleted_expert_removed_from_pool(self):
+        # Given: id 풀이 만들어진 상태
+        self.assertEqual(set(sample_expert_ids("mc", 10)), self.mc_expert_ids)
+        deleted = Expert.objects.get(id=min(self.mc_expert_ids))
+
+        # When: 전문가 삭제
+        with self.captureOnCommitCallbacks(execute=True):
+            deleted.delete()
+
+        # Then: 이후 샘플에 포함되지 않음
+        self.assertNotIn(deleted.id, sample_expert_ids("mc", 10))
@@ -17,7 +17,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.exceptions import BadRequestException
+from common.response_cache import CachedResponseMixin
 from expert.models import Career, Expert
+from expert.sampling import sample_expert_ids
 from expert.seriailzers import CareerSerializer, ExpertSerializer
 
 
@@ -47,8 +49,11 @@ class ExpertCreateView(CreateAPIView):
             "appeal": request.data.get("appeal", []),
             "service": request.data.get("service", []),
             "careers": careers,
-            "expert_image": request.data.get("expert_image", []),
         }
+        # 이미지는 직접 업로드한 upload_id 로 받음 (기존 파일 업로드도 클라이언트 전환 전까지 허용)
+        for field in ("expert_image_upload_id", "expert_image"):
+            if request.data.get(field):
+                request_data[field] = request.data.get(field)
 
         # 전문가로 전환
         serializer = self.get_serializer(data=request_data)
@@ -87,13 +92,26 @@ class ExpertDeactivatedView(APIView):
         return Response({"detail": "유저로 전환 되었습니다."}, status=status.HTTP_200_OK)
 
 
+# 랜덤 조회 시 반환할 전문가 수
+RANDOM_EXPERT_COUNT = 3
+
+
 # 전문가 리스트 조회 - 누구나
-class ExpertListView(ListAPIView):
+class ExpertListView(CachedResponseMixin, ListAPIView):
     serializer_class = ExpertSerializer
+    cache_tags = ("experts",)
+    # 인증 유저 조회 + 페이지 count + 목록 + careers prefetch
+    query_budget = 4
     permission_classes = [
         AllowAny,
     ]
 
+    def should_cache_response(self, request):
+        # 랜덤 조회는 매번 다른 결과를 반환해야 하므로 캐시하지 않음
+        if request.query_params.get("random", "false").lower() == "true":
+            return False
+        return super().should_cache_response(request)
+
     @extend_schema(
         tags=["Expert"],
         summary="전문가 목록 조회 - 누구나",
@@ -121,17 +139,22 @@ class ExpertListView(ListAPIView):
             return Response({"detail": "서비스명을 제공해야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         # 서비스명으로 필터링
-        experts = Expert.objects.filter(service=service_name).prefetch_related("careers")
+        experts = Expert.objects.filter(service=service_name).select_related("user").prefetch_related("careers")
 
         # 랜덤 조회 여부 확인
         if random_query == "true":
-            # 랜덤으로 3명의 전문가를 반환
-            experts = list(experts)
+            # 서비스 별 id 풀에서 3명을 먼저 뽑고, 뽑힌 전문가만 조회
+            expert_ids = sample_expert_ids(service_name, RANDOM_EXPERT_COUNT)
+            experts = list(experts.filter(id__in=expert_ids))
             random.shuffle(experts)
-            experts = experts[:3]
 
-        serializer = self.get_serializer(experts, many=True)
-        return Response(serializer.data)
+            serializer = self.get_serializer(experts, many=True)
+            return Response(serializer.data)
+
+        # 전체 조회는 페이지네이션 적용
+        page = self.paginate_queryset(experts.order_by("id"))
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class ExpertDetailView(RetrieveUpdateDestroyAPIView):
@@ -181,9 +204,9 @@ class ExpertDetailView(RetrieveUpdateDestroyAPIView):
         if service:
             request_data["service"] = service
 
-        expert_image = request.data.get("expert_image", None)
-        if expert_image:
-            request_data["expert_image"] = expert_image
+        for field in ("expert_image_upload_id", "expert_image"):
+            if request.data.get(field):
+                request_data[field] = request.data.get(field)
 
         if not request_data:
             raise BadRequestException("아무런 데이터도 제공되지 않았습니다.")
@@ -222,9 +245,10 @@ class ExpertDetailView(RetrieveUpdateDestroyAPIView):
         return Response({"detail": "전문가 정보가 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT)
 
 
-class CareerListViews(ListCreateAPIView):
+class CareerListViews(CachedResponseMixin, ListCreateAPIView):
     serializer_class = CareerSerializer
     permission_classes = (IsAuthenticated,)
+    cache_tags = ("careers",)
 
     def get_queryset(self):
         # URL 경로에서 expert_id를 가져와 필터링
@@ -1,12 +1,14 @@
 import json
 
 from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.layers import get_channel_layer
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from notifications.models import Notification
+from notifications.unread_counter import get_unread_count
 
 
 class NotificationConsumer(AsyncWebsocketConsumer):
@@ -16,7 +18,7 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             self.group_name = f"notification_{self.user.id}"
             # 그룹에 연결
             await self.channel_layer.group_add(self.group_name, self.channel_name)
-            await self.accept()
+            await self.accept(self.scope.get("auth_subprotocol"))
         else:
             # 비인증 유저는 연결을 거부
             await self.close()
@@ -30,3 +32,9 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         # 알림 메시지를 클라이언트로 보냅니다
         notification = event["notification"]
         await self.send(text_data=json.dumps(notification))
+        # 새 알림 이후의 읽지 않은 알림 수를 함께 전송 (클라이언트가 목록을 다시 조회하지 않도록)
+        unread_count = await database_sync_to_async(get_unread_count)(self.user.id)
+        await self.send_unread_count({"unread_count": unread_count})
+
+    async def send_unread_count(self, event):
+        await self.send(text_data=json.dumps({"type": "unread_count", "unread_count": event["unread_count"]}))
@@ -0,0 +1,226 @@
+# Generated by Django 5.1.15 on 2026-10-18 03:35
+
+import textwrap
+from string import Formatter
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+from common.constants.choices import (
+    AREA_CHOICES,
+    GENDER_CHOICES,
+    NOTIFICATION_TYPE_CHOICES,
+    SERVICE_CHOICES,
+)
+
+BACKFILL_BATCH_SIZE = 2000
+
+# 되돌릴 때 사용하는 notifications.rendering 의 템플릿/렌더링 복사본
+# (마이그레이션은 이후 코드/모델 변경과 무관하게 동작해야 하므로 현재 모듈과 모델을 import 하지 않음)
+UNKNOWN_REFERENCE = {"name": "(알 수 없음)", "gender": ""}
+GENDER_LABELS = dict(GENDER_CHOICES)
+NOTIFICATION_TYPE_LABELS = dict(NOTIFICATION_TYPE_CHOICES)
+
+# 템플릿에서 {참조[속성]} 으로 쓰는 참조 -> (payload 의 id 키, 조회할 모델)
+REFERENCES = {
+    "user": ("user_id", "user"),
+    "sender": ("sender_id", "user"),
+    "expert": ("expert_id", "expert"),
+}
+
+# 알림 종류 -> (제목, 내용, {payload 키: 선택지})
+NOTIFICATION_TEMPLATES = {
+    "message": ("{sender[name]}님이 메시지를 보냈습니다. 확인해보세요!", "{content}", {}),
+    "estimation": (
+        "{expert[name]}님이 견적서를 보냈습니다. 확인해보세요!",
+        "- 전문가 정보:\n"
+        "  - 이름: {expert[name]}\n"
+        "  - 성별: {expert[gender]}\n"
+        "  - 서비스: {service}\n"
+        "- 진행 예상 지역: {location}\n"
+        "- 진행 예상 날짜: {due_date}\n"
+        "- 견적 예상 금액: {charge}",
+        {"service": SERVICE_CHOICES, "location": AREA_CHOICES},
+    ),
+    "reserved": (
+        "{user[name]}님이 예약하셨습니다. 확인해보세요!",
+        "- 진행 서비스: {service}\n- 진행 지역: {location}\n- 진행 날짜: {due_date}\n- 견적 금액: {charge}",
+        {"service": SERVICE_CHOICES, "location": AREA_CHOICES},
+    ),
+    "review": ("{user[name]}님이 리뷰를 남겼습니다. 확인해보세요!", "- 내용: {content}\n- 평점: {rating}", {}),
+    "estimation_request": (
+        "{user[name]}님이 견적 요청을 보냈습니다. 확인해보세요!",
+        "- 요청 서비스: {service_list}\n"
+        "- 선호 하는 성별: {prefer_gender}\n"
+        "- 결혼식 정보:\n"
+        "  - 결혼식 예상 지역: {location}\n"
+        "  - 결혼식장: {wedding_hall}\n"
+        "  - 결혼식 예상 날짜: {wedding_datetime}",
+        {"service_list": SERVICE_CHOICES, "prefer_gender": GENDER_CHOICES, "location": AREA_CHOICES},
+    ),
+}
+
+
+class RenderContext(dict):
+    def __missing__(self, key):
+        return ""
+
+
+def template_references(title, message):
+    fields = {name for text in (title, message) for _, name, _, _ in Formatter().parse(text) if name}
+    return {name.split("[")[0] for name in fields} & set(REFERENCES)
+
+
+def choice_display(labels, value):
+    return ", ".join(str(labels.get(item, item)) for item in str(value).split(",")) if value else ""
+
+
+def reference_rows(rows):
+    return {row["id"]: {"name": row["name"], "gender": GENDER_LABELS.get(row["gender"], row["gender"])} for row in rows}
+
+
+def render_batch(apps, notifications):
+    """
+    notifications.rendering.render_payloads 와 같은 규칙으로 배치의 (제목, 내용) 을 렌더링합니다.
+    """
+    loaders = {
+        "user": lambda ids: reference_rows(
+            apps.get_model(settings.AUTH_USER_MODEL).objects.filter(id__in=ids).values("id", "name", "gender")
+        ),
+        "expert": lambda ids: reference_rows(
+            apps.get_model("expert", "Expert")
+            .objects.filter(id__in=ids)
+            .values("id", name=F("user__name"), gender=F("user__gender"))
+        ),
+    }
+    ids = {model: set() for model in loaders}
+    for notification in notifications:
+        template = NOTIFICATION_TEMPLATES.get(notification.notification_type)
+        if template is None or "title" in notification.payload:
+            continue
+        for name in template_references(template[0], template[1]):
+            id_key, model = REFERENCES[name]
+            if notification.payload.get(id_key) is not None:
+                ids[model].add(notification.payload[id_key])
+    loaded = {model: loaders[model](model_ids) if model_ids else {} for model, model_ids in ids.items()}
+
+    rendered = []
+    for notification in notifications:
+        payload = notification.payload
+        template = NOTIFICATION_TEMPLATES.get(notification.notification_type)
+        if "title" in payload:
+            rendered.append((payload["title"], payload.get("message", "")))
+        elif template is None:
+            label = NOTIFICATION_TYPE_LABELS.get(notification.notification_type, notification.notification_type)
+            rendered.append((str(label), ""))
+        else:
+            title, message, choices = template
+            context = RenderContext(payload)
+            for key, labels in choices.items():
+                context[key] = choice_display(dict(labels), payload.get(key))
+            for name in template_references(title, message):
+                id_key, model = REFERENCES[name]
+                context[name] = loaded[model].get(payload.get(id_key), UNKNOWN_REFERENCE)
+            rendered.append((title.format_map(context), message.format_map(context)))
+    return rendered
+
+
+def compact_text(text):
+    # 이전 알림은 들여쓰기/빈 줄이 포함된 triple-quoted 문자열로 저장됨 -> 들여쓰기와 빈 줄 제거
+    lines = (line.rstrip() for line in textwrap.dedent(text.strip("\n")).splitlines())
+    return "\n".join(line for line in lines if line.strip())
+
+
+def save_in_batches(model, rows, fields):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            model.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        model.objects.bulk_update(batch, fields)
+
+
+def backfill_payloads(apps, schema_editor):
+    """
+    이전 알림은 원본 id(견적, 예약 등)가 저장되어 있지 않아 템플릿 payload 로 되돌릴 수 없으므로,
+    정리한 제목/내용을 그대로 payload 에 옮깁니다. (payload 에 title 이 있으면 그대로 표시)
+    """
+    Notification = apps.get_model("notifications", "Notification")
+
+    def rows():
+        for notification in (
+            Notification.objects.only("id", "title", "message").order_by("id").iterator(chunk_size=BACKFILL_BATCH_SIZE)
+        ):
+            notification.payload = {
+                "title": compact_text(notification.title),
+                "message": compact_text(notification.message),
+            }
+            yield notification
+
+    save_in_batches(Notification, rows(), ["payload"])
+
+
+def restore_titles(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+
+    def rows():
+        batch = []
+        for notification in (
+            Notification.objects.only("id", "notification_type", "payload")
+            .order_by("id")
+            .iterator(chunk_size=BACKFILL_BATCH_SIZE)
+        ):
+            batch.append(notification)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                yield from render_rows(batch)
+                batch = []
+        yield from render_rows(batch)
+
+    def render_rows(batch):
+        # 배치 단위로 참조 유저/전문가를 한 번에 조회
+        for notification, (title, message) in zip(batch, render_batch(apps, batch)):
+            notification.title = title[:60]
+            notification.message = message
+            yield notification
+
+    save_in_batches(Notification, rows(), ["title", "message"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0007_notification_unread_index"),
+        ("expert", "0004_alter_expert_user"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="payload",
+            field=models.JSONField(default=dict),
+        ),
+        migrations.RunPython(backfill_payloads, restore_titles),
+        # 되돌릴 때 컬럼을 다시 추가할 수 있도록 삭제 전 기본값 지정
+        migrations.AlterField(
+            model_name="notification",
+            name="message",
+            field=models.TextField(default=""),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="title",
+            field=models.CharField(default="", max_length=60),
+        ),
+        migrations.RemoveField(
+            model_name="notification",
+            name="message",
+        ),
+        migrations.RemoveField(
+            model_name="notification",
+            name="title",
+        ),
+    ]
@@ -0,0 +1,149 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:10
+
+from datetime import datetime
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+# notifications.partitions 의 이름 규칙/월 계산 복사본
+# (마이그레이션은 이후 코드/모델 변경과 무관하게 동작해야 하므로 현재 모듈을 import 하지 않음)
+TABLE = "notifications_notification"
+DEFAULT_PARTITION = f"{TABLE}_default"
+# 파티션 전환 시 미리 만들어 둘 이후 월 파티션 수 (이후에는 maintain_notification_partitions 가 관리)
+MONTHS_AHEAD = 3
+
+
+def month_start(value):
+    value = timezone.localtime(value)
+    return timezone.make_aware(datetime(value.year, value.month, 1))
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return timezone.make_aware(datetime(index // 12, index % 12 + 1, 1))
+
+
+def create_partition(schema_editor, month):
+    # 전환 중에는 기본 파티션이 비어 있으므로 PARTITION OF 로 바로 생성
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    schema_editor.execute(
+        f"CREATE TABLE {TABLE}_p{month:%Y_%m} PARTITION OF {TABLE} FOR VALUES FROM ('{start}') TO ('{end}')"
+    )
+
+
+def partition_notifications(apps, schema_editor):
+    """
+    Notification 테이블을 created_at 월 단위 RANGE 파티션 테이블로 전환합니다. (Postgres 만)
+    - 파티션 키가 PK 에 포함되어야 하므로 PK 는 (id, created_at), id 는 시퀀스 기본값으로 발급
+    - 기존 행이 있는 월부터 현재 + MONTHS_AHEAD 월까지 파티션을 만들고 기존 행을 옮김
+    """
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    users_table = apps.get_model("users", "User")._meta.db_table
+
+    schema_editor.execute(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_unpartitioned")
+    schema_editor.execute(f"ALTER TABLE {TABLE}_unpartitioned ALTER COLUMN id DROP IDENTITY IF EXISTS")
+    schema_editor.execute(f"ALTER TABLE {TABLE}_unpartitioned ALTER COLUMN id DROP DEFAULT")
+    schema_editor.execute(f"DROP SEQUENCE IF EXISTS {TABLE}_id_seq")
+    schema_editor.execute(f"ALTER TABLE {TABLE}_unpartitioned DROP CONSTRAINT {TABLE}_pkey")
+    schema_editor.execute("DROP INDEX notif_unread_receiver_idx")
+
+    schema_editor.execute(f"CREATE SEQUENCE {TABLE}_id_seq AS bigint")
+    schema_editor.execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            id bigint NOT NULL DEFAULT nextval('{TABLE}_id_seq'),
+            notification_type varchar(20) NOT NULL,
+            is_read boolean NOT NULL,
+            created_at timestamp with time zone NOT NULL,
+            receiver_id bigint NOT NULL,
+            payload jsonb NOT NULL,
+            CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    schema_editor.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+    schema_editor.execute(
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_receiver_id_fk_{users_table}_id "
+        f"FOREIGN KEY (receiver_id) REFERENCES {users_table} (id) DEFERRABLE INITIALLY DEFERRED"
+    )
+    schema_editor.execute(f"CREATE INDEX {TABLE}_receiver_id_idx ON {TABLE} (receiver_id)")
+    schema_editor.execute(
+        f"CREATE INDEX notif_unread_receiver_idx ON {TABLE} (receiver_id, created_at DESC, id DESC) WHERE NOT is_read"
+    )
+    schema_editor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(created_at) FROM {TABLE}_unpartitioned")
+        oldest = cursor.fetchone()[0] or timezone.now()
+    month, last = month_start(oldest), add_months(month_start(timezone.now()), MONTHS_AHEAD)
+    while month <= last:
+        create_partition(schema_editor, month)
+        month = add_months(month, 1)
+
+    columns = "id, notification_type, is_read, created_at, receiver_id, payload"
+    schema_editor.execute(f"INSERT INTO {TABLE} ({columns}) SELECT {columns} FROM {TABLE}_unpartitioned")
+    schema_editor.execute(f"SELECT setval('{TABLE}_id_seq', COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)")
+    schema_editor.execute(f"DROP TABLE {TABLE}_unpartitioned")
+
+
+def unpartition_notifications(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    users_table = apps.get_model("users", "User")._meta.db_table
+
+    schema_editor.execute(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_partitioned")
+    schema_editor.execute(f"ALTER TABLE {TABLE}_partitioned RENAME CONSTRAINT {TABLE}_pkey TO {TABLE}_partitioned_pkey")
+    schema_editor.execute("DROP INDEX notif_unread_receiver_idx")
+    schema_editor.execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            id bigint NOT NULL PRIMARY KEY GENERATED BY DEFAULT AS IDENTITY,
+            notification_type varchar(20) NOT NULL,
+            is_read boolean NOT NULL,
+            created_at timestamp with time zone NOT NULL,
+            receiver_id bigint NOT NULL,
+            payload jsonb NOT NULL
+        )
+        """
+    )
+    schema_editor.execute(
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_receiver_id_fk_{users_table}_id "
+        f"FOREIGN KEY (receiver_id) REFERENCES {users_table} (id) DEFERRABLE INITIALLY DEFERRED"
+    )
+    schema_editor.execute(f"CREATE INDEX {TABLE}_receiver_id_plain_idx ON {TABLE} (receiver_id)")
+    schema_editor.execute(
+        f"CREATE INDEX notif_unread_receiver_idx ON {TABLE} (receiver_id, created_at DESC, id DESC) WHERE NOT is_read"
+    )
+    columns = "id, notification_type, is_read, created_at, receiver_id, payload"
+    schema_editor.execute(f"INSERT INTO {TABLE} ({columns}) SELECT {columns} FROM {TABLE}_partitioned")
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)"
+    )
+    # 월 파티션과 시퀀스(OWNED BY)도 함께 삭제
+    schema_editor.execute(f"DROP TABLE {TABLE}_partitioned CASCADE")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0008_notification_payload"),
+        ("users", "0005_user_profile_image_variants"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="notificationoutbox",
+            name="notification",
+            field=models.ForeignKey(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="outbox_events",
+                to="notifications.notification",
+            ),
+        ),
+        migrations.RunPython(partition_notifications, unpartition_notifications),
+    ]
@@ -1,15 +1,75 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 
 from common.constants.choices import NOTIFICATION_TYPE_CHOICES
+from notifications.rendering import render_notifications
 
 User = get_user_model()
 
 
 class Notification(models.Model):
+    """
+    알림은 종류와 작은 payload(id, 값)만 저장하고 제목/내용은 조회/전송 시 종류 별 템플릿으로 렌더링합니다.
+    (notifications.rendering - 목록은 render_notifications 로 한 번에 렌더링)
+    Postgres 에서는 created_at 월 단위 파티션 테이블 (PK 는 (id, created_at), notifications.partitions)
+    - 보관 기간이 지난 알림은 maintain_notification_partitions 명령이 파티션 단위로 삭제
+    """
+
     receiver = models.ForeignKey(User, on_delete=models.CASCADE)
-    title = models.CharField(max_length=60)
-    message = models.TextField()
     notification_type = models.CharField(max_length=20, choices=NOTIFICATION_TYPE_CHOICES)
+    payload = models.JSONField(default=dict)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # 읽지 않은 알림 목록(최신 순 cursor 페이지네이션) / 읽지 않은 알림 수 - is_read = false 행만 담는 부분 인덱스
+            models.Index(
+                fields=["receiver", "-created_at", "-id"],
+                condition=models.Q(is_read=False),
+                name="notif_unread_receiver_idx",
+            ),
+        ]
+
+    @property
+    def rendered(self):
+        if not hasattr(self, "_rendered"):
+            render_notifications([self])
+        return self._rendered
+
+    @property
+    def title(self):
+        return self.rendered[0]
+
+    @title.setter
+    def title(self, value):
+        # 템플릿 없이 문구를 직접 지정하는 알림 (관리자/더미 데이터) - payload 에 렌더링된 문구로 저장
+        self.payload = {**self.payload, "title": value}
+        self.__dict__.pop("_rendered", None)
+
+    @property
+    def message(self):
+        return self.rendered[1]
+
+    @message.setter
+    def message(self, value):
+        self.payload = {**self.payload, "message": value}
+        self.__dict__.pop("_rendered", None)
+
+
+class NotificationOutbox(models.Model):
+    """
+    웹소켓으로 전송 대기 중인 알림 이벤트 (알림과 같은 트랜잭션에서 기록되고 run_notification_outbox 워커가 전송)
+    """
+
+    # 파티션 테이블은 (id, created_at) 전체가 아닌 id 만 참조하는 FK 제약을 가질 수 없으므로 DB 제약 없이 ORM 에서만 연결
+    notification = models.ForeignKey(
+        Notification, on_delete=models.CASCADE, related_name="outbox_events", db_constraint=False
+    )
+    group_name = models.CharField(max_length=100)
+    payload = models.JSONField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    available_at = models.DateTimeField(default=timezone.now, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
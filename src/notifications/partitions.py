@@ -0,0 +1,213 @@
+# notifications/partitions.py
+import gzip
+import tempfile
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from notifications.models import Notification, NotificationOutbox
+from notifications.unread_counter import unread_count_key
+
+# Postgres 에서 Notification 테이블은 created_at 월 단위 RANGE 파티션 (migrations/0009_partition_notification)
+# - <테이블>_pYYYY_MM: 해당 월(TIME_ZONE 기준) 파티션
+# - <테이블>_default: 범위 파티션이 없는 행 (미리 만든 파티션이 부족할 때, 보관 기간이 지난 파티션에서 남긴 읽지 않은 알림)
+PARENT_TABLE = Notification._meta.db_table
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+
+
+def month_start(value):
+    value = timezone.localtime(value)
+    return timezone.make_aware(datetime(value.year, value.month, 1))
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return timezone.make_aware(datetime(index // 12, index % 12 + 1, 1))
+
+
+def partition_name(month):
+    return f"{PARTITION_PREFIX}{month:%Y_%m}"
+
+
+def partition_month(name):
+    try:
+        return timezone.make_aware(datetime.strptime(name.removeprefix(PARTITION_PREFIX), "%Y_%m"))
+    except ValueError:
+        return None
+
+
+def is_partitioned(connection):
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [PARENT_TABLE])
+        return cursor.fetchone() is not None
+
+
+def month_partitions(connection, attached=True):
+    """
+    월 파티션 {월: 테이블 이름}
+    attached=False 이면 분리(DETACH)된 후 아직 삭제되지 않은 파티션 (보관/삭제 도중 중단된 경우)
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT relname FROM pg_class
+            WHERE relkind IN ('r', 'p') AND relispartition = %s AND left(relname, length(%s)) = %s
+            """,
+            [attached, PARTITION_PREFIX, PARTITION_PREFIX],
+        )
+        names = [name for (name,) in cursor.fetchall()]
+    return {partition_month(name): name for name in names if partition_month(name) is not None}
+
+
+def create_partition(connection, month):
+    """
+    월 파티션을 만듭니다.
+    기본 파티션에 이미 같은 범위의 행이 있으면 PARTITION OF 로 만들 수 없으므로,
+    같은 구조의 테이블을 만들어 해당 행을 옮긴 후 ATTACH 합니다.
+    """
+    qn = connection.ops.quote_name
+    name = partition_name(month)
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(PARENT_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {qn(DEFAULT_PARTITION)} WHERE created_at >= %s AND created_at < %s RETURNING *
+            )
+            INSERT INTO {qn(name)} SELECT * FROM moved
+            """,
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(PARENT_TABLE)} ATTACH PARTITION {qn(name)} FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    return name
+
+
+def ensure_partitions(connection, start, months_ahead):
+    """
+    start 가 포함된 월부터 현재 + months_ahead 월까지 없는 파티션을 만들고, 만든 파티션 이름 목록을 반환합니다.
+    """
+    existing = month_partitions(connection)
+    month, last = month_start(start), add_months(month_start(timezone.now()), months_ahead)
+    created = []
+    while month <= last:
+        if month not in existing:
+            created.append(create_partition(connection, month))
+        month = add_months(month, 1)
+    return created
+
+
+def default_partition_months(connection):
+    """
+    읽은 알림이 들어 있는 기본 파티션의 월 {월: 행 수}
+    detach_partition 은 읽지 않은 알림만 기본 파티션에 남기므로, 읽은 알림이 있는 월은 월 파티션 없이 통째로
+    기본 파티션에 적재된 월입니다. (파티션을 만들지 않고 과거 시각의 알림을 넣은 경우 등)
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT date_trunc('month', created_at AT TIME ZONE %s) AS month, COUNT(*)
+            FROM {connection.ops.quote_name(DEFAULT_PARTITION)}
+            GROUP BY month HAVING bool_or(is_read) ORDER BY month
+            """,
+            [settings.TIME_ZONE],
+        )
+        return {timezone.make_aware(month): count for month, count in cursor.fetchall()}
+
+
+def expired_partitions(partitions, cutoff):
+    # 범위 끝(다음 달 1일)이 cutoff 이전인 파티션 = 모든 행이 보관 기간을 지남
+    return [name for month, name in sorted(partitions.items()) if add_months(month, 1) <= cutoff]
+
+
+def invalidate_unread_counts(user_ids):
+    # 삭제된 읽지 않은 알림이 있는 유저의 카운터는 다음 조회 시 DB 로 다시 계산
+    if user_ids:
+        cache.delete_many([unread_count_key(user_id) for user_id in user_ids])
+
+
+def detach_partition(connection, name, unread_cutoff):
+    """
+    파티션을 분리하고, 아직 보관할 읽지 않은 알림(unread_cutoff 이후)만 부모 테이블에 다시 넣습니다.
+    (해당 월의 범위 파티션이 없으므로 기본 파티션에 저장됨 - DELETE 없이 파티션 단위로 정리)
+    반환: (다시 넣은 읽지 않은 알림 수, 함께 삭제될 읽지 않은 알림의 수신자 id 목록)
+    """
+    qn = connection.ops.quote_name
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(PARENT_TABLE)} DETACH PARTITION {qn(name)}")
+        cursor.execute(
+            f"INSERT INTO {qn(PARENT_TABLE)} SELECT * FROM {qn(name)} WHERE NOT is_read AND created_at >= %s",
+            [unread_cutoff],
+        )
+        kept = cursor.rowcount
+        cursor.execute(
+            f"SELECT DISTINCT receiver_id FROM {qn(name)} WHERE NOT is_read AND created_at < %s", [unread_cutoff]
+        )
+        receiver_ids = [receiver_id for (receiver_id,) in cursor.fetchall()]
+        # 알림 FK 제약이 없는 outbox 의 전송되지 않은 이벤트도 함께 정리
+        cursor.execute(
+            f"""
+            DELETE FROM {qn(NotificationOutbox._meta.db_table)} WHERE notification_id IN (
+                SELECT id FROM {qn(name)} WHERE is_read OR created_at < %s
+            )
+            """,
+            [unread_cutoff],
+        )
+    return kept, receiver_ids
+
+
+def archive_partition(connection, name, prefix, storage=None):
+    """
+    분리된 파티션을 gzip CSV 로 내보내 저장소(기본: default_storage)에 저장하고 저장된 이름을 반환합니다.
+    COPY 로 스트리밍하므로 파티션 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    qn = connection.ops.quote_name
+    storage = storage or default_storage
+    with tempfile.TemporaryFile() as archive:
+        with gzip.GzipFile(fileobj=archive, mode="wb") as gzip_file, connection.cursor() as cursor:
+            with cursor.cursor.copy(f"COPY {qn(name)} TO STDOUT WITH (FORMAT csv, HEADER)") as copy:
+                for data in copy:
+                    gzip_file.write(data)
+        archive.seek(0)
+        return storage.save(f"{prefix}{name}.csv.gz", File(archive))
+
+
+def drop_partition(connection, name):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE {connection.ops.quote_name(name)}")
+
+
+def prune_default_partition(connection, read_cutoff, unread_cutoff):
+    """
+    기본 파티션에서 보관 기간이 지난 행을 삭제합니다.
+    기본 파티션에는 월 파티션에서 남긴 읽지 않은 알림 등 소량만 있어야 합니다.
+    (월 단위로 들어간 행은 default_partition_months 로 확인하여 월 파티션으로 옮긴 후 파티션 단위로 정리)
+    반환: (삭제한 행 수, 삭제된 읽지 않은 알림의 수신자 id 목록)
+    """
+    qn = connection.ops.quote_name
+    condition = "created_at < %s AND (is_read OR created_at < %s)"
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM {qn(NotificationOutbox._meta.db_table)} WHERE notification_id IN (
+                SELECT id FROM {qn(DEFAULT_PARTITION)} WHERE {condition}
+            )
+            """,
+            [read_cutoff, unread_cutoff],
+        )
+        cursor.execute(
+            f"DELETE FROM {qn(DEFAULT_PARTITION)} WHERE {condition} RETURNING receiver_id, is_read",
+            [read_cutoff, unread_cutoff],
+        )
+        rows = cursor.fetchall()
+    return len(rows), sorted({receiver_id for receiver_id, is_read in rows if not is_read})
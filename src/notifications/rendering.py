@@ -0,0 +1,170 @@
+# notifications/rendering.py
+from string import Formatter
+
+from django.db.models import F
+
+from common.constants.choices import (
+    AREA_CHOICES,
+    GENDER_CHOICES,
+    NOTIFICATION_TYPE_CHOICES,
+    SERVICE_CHOICES,
+)
+from expert.models import Expert
+from users.models import User
+
+# 미리보기로 저장하는 본문(채팅 메시지, 리뷰 내용) 최대 길이
+PREVIEW_LENGTH = 100
+# 삭제된 유저/전문가를 참조하는 알림의 표시 값
+UNKNOWN_REFERENCE = {"name": "(알 수 없음)", "gender": ""}
+
+
+def preview(text):
+    return text if len(text) <= PREVIEW_LENGTH else f"{text[:PREVIEW_LENGTH]}…"
+
+
+GENDER_LABELS = dict(GENDER_CHOICES)
+
+
+def reference_rows(rows):
+    # {id: {"name": 이름, "gender": 성별 표시 이름}}
+    return {row["id"]: {"name": row["name"], "gender": GENDER_LABELS.get(row["gender"], row["gender"])} for row in rows}
+
+
+def load_users(ids):
+    return reference_rows(User.objects.filter(id__in=ids).values("id", "name", "gender"))
+
+
+def load_experts(ids):
+    return reference_rows(
+        Expert.objects.filter(id__in=ids).values("id", name=F("user__name"), gender=F("user__gender"))
+    )
+
+
+# 템플릿에서 {참조[속성]} 으로 쓰는 참조 -> (payload 의 id 키, 일괄 조회 함수)
+REFERENCES = {
+    "user": ("user_id", load_users),
+    "sender": ("sender_id", load_users),
+    "expert": ("expert_id", load_experts),
+}
+
+
+class RenderContext(dict):
+    # payload 에 없는 값은 빈 문자열로 표시 (이전 형식의 payload 도 렌더링 가능하도록)
+    def __missing__(self, key):
+        return ""
+
+
+def choice_display(labels, value):
+    # 다중 선택 값(콤마로 구분)은 각각 표시 이름으로 변환
+    return ", ".join(str(labels.get(item, item)) for item in str(value).split(",")) if value else ""
+
+
+class NotificationTemplate:
+    """
+    알림 종류 별 제목/내용 템플릿 (str.format 형식)
+    모듈 로드 시 한 번 파싱하여 필요한 참조(유저/전문가)를 미리 계산해 두므로, 렌더링 시에는 필요한 참조만 일괄 조회합니다.
+    """
+
+    def __init__(self, title, message, choices=None):
+        self.title = title
+        self.message = message
+        # payload 키 -> 선택지 (코드를 표시 이름으로 변환)
+        self.choices = {key: dict(value) for key, value in (choices or {}).items()}
+        fields = {name for text in (title, message) for _, name, _, _ in Formatter().parse(text) if name}
+        self.references = {name.split("[")[0] for name in fields} & set(REFERENCES)
+
+    def render(self, payload, loaded):
+        context = RenderContext(payload)
+        for key, choices in self.choices.items():
+            context[key] = choice_display(choices, payload.get(key))
+        for name in self.references:
+            id_key, loader = REFERENCES[name]
+            context[name] = loaded[loader].get(payload.get(id_key), UNKNOWN_REFERENCE)
+        return self.title.format_map(context), self.message.format_map(context)
+
+
+NOTIFICATION_TEMPLATES = {
+    "message": NotificationTemplate(
+        title="{sender[name]}님이 메시지를 보냈습니다. 확인해보세요!",
+        message="{content}",
+    ),
+    "estimation": NotificationTemplate(
+        title="{expert[name]}님이 견적서를 보냈습니다. 확인해보세요!",
+        message=(
+            "- 전문가 정보:\n"
+            "  - 이름: {expert[name]}\n"
+            "  - 성별: {expert[gender]}\n"
+            "  - 서비스: {service}\n"
+            "- 진행 예상 지역: {location}\n"
+            "- 진행 예상 날짜: {due_date}\n"
+            "- 견적 예상 금액: {charge}"
+        ),
+        choices={"service": SERVICE_CHOICES, "location": AREA_CHOICES},
+    ),
+    "reserved": NotificationTemplate(
+        title="{user[name]}님이 예약하셨습니다. 확인해보세요!",
+        message=(
+            "- 진행 서비스: {service}\n" "- 진행 지역: {location}\n" "- 진행 날짜: {due_date}\n" "- 견적 금액: {charge}"
+        ),
+        choices={"service": SERVICE_CHOICES, "location": AREA_CHOICES},
+    ),
+    "review": NotificationTemplate(
+        title="{user[name]}님이 리뷰를 남겼습니다. 확인해보세요!",
+        message="- 내용: {content}\n- 평점: {rating}",
+    ),
+    "estimation_request": NotificationTemplate(
+        title="{user[name]}님이 견적 요청을 보냈습니다. 확인해보세요!",
+        message=(
+            "- 요청 서비스: {service_list}\n"
+            "- 선호 하는 성별: {prefer_gender}\n"
+            "- 결혼식 정보:\n"
+            "  - 결혼식 예상 지역: {location}\n"
+            "  - 결혼식장: {wedding_hall}\n"
+            "  - 결혼식 예상 날짜: {wedding_datetime}"
+        ),
+        choices={"service_list": SERVICE_CHOICES, "prefer_gender": GENDER_CHOICES, "location": AREA_CHOICES},
+    ),
+}
+NOTIFICATION_TYPE_LABELS = dict(NOTIFICATION_TYPE_CHOICES)
+
+
+def render_payloads(items):
+    """
+    (알림 종류, payload) 목록을 (제목, 내용) 목록으로 렌더링합니다.
+    - 참조하는 유저/전문가 이름은 목록 전체에서 모아 조회 함수 당 한 번만 조회
+    - payload 에 title 이 있으면 이미 렌더링된 문구로 그대로 사용 (이전 알림, 관리자/더미 알림)
+    - 템플릿이 없는 종류는 종류 이름을 제목으로 사용
+    """
+    ids = {}
+    for notification_type, payload in items:
+        template = NOTIFICATION_TEMPLATES.get(notification_type)
+        if template is None or "title" in payload:
+            continue
+        for name in template.references:
+            id_key, loader = REFERENCES[name]
+            if payload.get(id_key) is not None:
+                ids.setdefault(loader, set()).add(payload[id_key])
+    loaded = {loader: loader(loader_ids) for loader, loader_ids in ids.items()}
+    loaded.update({loader: {} for _, loader in REFERENCES.values() if loader not in loaded})
+
+    rendered = []
+    for notification_type, payload in items:
+        template = NOTIFICATION_TEMPLATES.get(notification_type)
+        if "title" in payload:
+            rendered.append((payload["title"], payload.get("message", "")))
+        elif template is None:
+            rendered.append((str(NOTIFICATION_TYPE_LABELS.get(notification_type, notification_type)), ""))
+        else:
+            rendered.append(template.render(payload, loaded))
+    return rendered
+
+
+def render_notifications(notifications):
+    # 알림 목록의 제목/내용을 한 번에 렌더링하여 각 알림에 저장 (notification.title / message 접근 시 추가 쿼리 없음)
+    notifications = list(notifications)
+    rendered = render_payloads(
+        [(notification.notification_type, notification.payload) for notification in notifications]
+    )
+    for notification, (title, message) in zip(notifications, rendered):
+        notification._rendered = (title, message)
+    return notifications
@@ -4,22 +4,16 @@ from notifications.models import Notification
 
 
 class NotificationSerializer(serializers.ModelSerializer):
+    # 제목/내용은 저장하지 않고 payload 를 종류 별 템플릿으로 렌더링한 값 (목록은 render_notifications 로 미리 렌더링)
+    title = serializers.CharField(read_only=True)
+    message = serializers.CharField(read_only=True)
+
     class Meta:
         model = Notification
-        fields = "__all__"
-
-    def validate(self, data):
-        # 제목 길이 검증
-        if "title" in data and len(data["title"]) > 50:
-            raise serializers.ValidationError("제목은 50자를 초과할 수 없습니다.")
-        # 내용 길이 검증
-        if "message_id" in data and len(data["message_id"]) > 100:
-            raise serializers.ValidationError("내용은 100자를 초과할 수 없습니다.")
-        return data
+        fields = ("id", "receiver", "notification_type", "title", "message", "payload", "is_read", "created_at")
+        read_only_fields = ("payload",)
 
 
-class NotificationReadSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Notification
-        fields = "__all__"
-        read_only_fields = ("id", "title", "message", "notification_type", "created_at")
+class NotificationReadSerializer(NotificationSerializer):
+    class Meta(NotificationSerializer.Meta):
+        read_only_fields = ("id", "receiver", "notification_type", "payload", "created_at")
@@ -6,6 +6,7 @@ from channels.layers import get_channel_layer
 from channels.routing import URLRouter
 from channels.testing import WebsocketCommunicator
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TransactionTestCase
 from django.urls import path
 
@@ -45,6 +46,7 @@ class NotificationConsumerTest(TransactionTestCase):
             appeal="경험 많은 웨딩 전문가입니다.",
         )
 
+        cache.clear()
         self.application = URLRouter([path("ws/notifications/", NotificationConsumer.as_asgi())])
 
     @database_sync_to_async
@@ -98,5 +100,9 @@ class NotificationConsumerTest(TransactionTestCase):
         assert response["message"] == "테스트 알림입니다."
         assert response["notification_type"] == "message"
 
+        # Then: 이어서 읽지 않은 알림 수 수신
+        response = await communicator.receive_json_from()
+        assert response == {"type": "unread_count", "unread_count": 1}
+
         # Finally: WebSocket 연결 종료
         await communicator.disconnect()
@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from notifications.models import Notification, NotificationOutbox
+
+User = get_user_model()
+
+
+# 워커는 database_sync_to_async 로 DB 를 사용하며 호출마다 close_old_connections 로 연결을 닫으므로
+# TestCase 의 테스트 트랜잭션 안에서는 실행할 수 없음 -> TransactionTestCase 사용
+class NotificationOutboxTest(TransactionTestCase):
+    def setUp(self):
+        # Given: 알림을 받을 사용자 생성
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            name="유저",
+            phone_number="01012345678",
+            gender="M",
+            is_active=True,
+        )
+
+    def create_notification(self):
+        return Notification.objects.create(
+            receiver=self.user,
+            notification_type="message",
+            payload={"sender_id": self.user.id, "content": "테스트 알림입니다."},
+        )
+
+    def test_outbox_event_written_with_notification(self):
+        # When: 알림을 생성합니다.
+        notification = self.create_notification()
+
+        # Then: 같은 트랜잭션에서 전송 이벤트가 기록되어야 합니다.
+        event = NotificationOutbox.objects.get(notification=notification)
+        self.assertEqual(event.group_name, f"notification_{self.user.id}")
+        self.assertEqual(event.payload["notification"]["id"], notification.id)
+
+    def test_rolled_back_notification_is_not_enqueued(self):
+        # When: 알림 생성 트랜잭션이 롤백됩니다.
+        with transaction.atomic():
+            self.create_notification()
+            transaction.set_rollback(True)
+
+        # Then: 전송 이벤트도 남지 않아야 합니다.
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_worker_delivers_and_removes_events(self):
+        # Given: 사용자의 알림 그룹을 구독하는 채널
+        channel_layer = get_channel_layer()
+        channel_name = async_to_sync(channel_layer.new_channel)()
+        async_to_sync(channel_layer.group_add)(f"notification_{self.user.id}", channel_name)
+        notification = self.create_notification()
+
+        # When: outbox 워커를 실행합니다.
+        call_command("run_notification_outbox", "--once")
+
+        # Then: 알림이 전송되고 outbox 에서 제거되어야 합니다.
+        message = async_to_sync(channel_layer.receive)(channel_name)
+        self.assertEqual(message["type"], "send_notification")
+        self.assertEqual(message["notification"]["id"], notification.id)
+        # Then: outbox 에는 payload 만 저장되고, 제목/내용은 전송 직전에 렌더링됩니다.
+        self.assertEqual(message["notification"]["title"], "유저님이 메시지를 보냈습니다. 확인해보세요!")
+        self.assertEqual(message["notification"]["message"], "테스트 알림입니다.")
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_worker_reschedules_failed_events(self):
+        # Given: 전송 대기 중인 알림
+        self.create_notification()
+
+        # When: 채널 레이어 전송이 실패합니다.
+        with patch.object(get_channel_layer(), "group_send", AsyncMock(side_effect=ConnectionError("redis down"))):
+            call_command("run_notification_outbox", "--once")
+
+        # Then: 이벤트가 남아있고 재시도 정보가 기록되어야 합니다.
+        event = NotificationOutbox.objects.get()
+        self.assertEqual(event.attempts, 1)
+        self.assertIn("redis down", event.last_error)
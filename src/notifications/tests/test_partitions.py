@@ -0,0 +1,143 @@
+import gzip
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from notifications.models import Notification, NotificationOutbox
+from notifications.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    create_partition,
+    default_partition_months,
+    expired_partitions,
+    is_partitioned,
+    month_partitions,
+    month_start,
+    partition_month,
+    partition_name,
+)
+from notifications.unread_counter import unread_count_key
+
+User = get_user_model()
+
+
+class PartitionHelperTest(SimpleTestCase):
+    def test_month_boundaries_follow_time_zone(self):
+        # Given: UTC 기준으로는 전월이지만 TIME_ZONE(Asia/Seoul) 기준으로는 3월 1일인 시각
+        value = datetime(2026, 2, 28, 16, tzinfo=dt_timezone.utc)
+
+        # Then: 파티션 월은 TIME_ZONE 기준으로 계산
+        month = month_start(value)
+        self.assertEqual((month.year, month.month, month.day), (2026, 3, 1))
+        self.assertEqual(partition_month(partition_name(month)), month)
+        self.assertEqual(add_months(month, 10), timezone.make_aware(datetime(2027, 1, 1)))
+        self.assertIsNone(partition_month(DEFAULT_PARTITION))
+
+    def test_expired_partitions_only_when_whole_month_past_cutoff(self):
+        months = [timezone.make_aware(datetime(2026, month, 1)) for month in (1, 2, 3)]
+        partitions = {month: partition_name(month) for month in months}
+
+        # When: 3월 1일 0시 기준 -> 2월 파티션까지 모든 행이 보관 기간을 지남
+        expired = expired_partitions(partitions, months[2])
+
+        # Then: 범위 끝이 기준 이전인 파티션만 삭제 대상
+        self.assertEqual(expired, [partitions[months[0]], partitions[months[1]]])
+        self.assertEqual(expired_partitions(partitions, months[2] - timedelta(seconds=1)), [partitions[months[0]]])
+
+
+# 파티션 분리(DETACH)가 커밋된 후 삭제하는 흐름을 그대로 검증하기 위해 TransactionTestCase 사용
+class MaintainNotificationPartitionsTest(TransactionTestCase):
+    def setUp(self):
+        # 모듈 import 시점이 아닌 테스트 DB 연결로 확인 (SQLite 등 파티션 테이블이 없는 DB 에서는 건너뜀)
+        if not is_partitioned(connection):
+            self.skipTest("Postgres 파티션 테이블에서만 실행")
+
+        # Given: 임시 MEDIA_ROOT 와 알림을 받을 사용자
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.user = User.objects.create_user(
+            email="testuser@example.com", name="유저", phone_number="01012345678", gender="M"
+        )
+
+    def create_notification(self, days_ago, is_read):
+        notification = Notification.objects.create(
+            receiver=self.user, notification_type="message", payload={"sender_id": self.user.id, "content": "알림"}
+        )
+        created_at = timezone.now() - timedelta(days=days_ago)
+        Notification.objects.filter(id=notification.id).update(created_at=created_at, is_read=is_read)
+        return notification
+
+    def test_expired_partition_archived_and_dropped(self):
+        # Given: 보관 기간이 지난 월 파티션 두 개 (읽지 않은 알림 보관 기간 이내/이후)
+        recent_month = month_start(timezone.now() - timedelta(days=200))
+        old_month = month_start(timezone.now() - timedelta(days=500))
+        for month in (recent_month, old_month):
+            create_partition(connection, month)
+        read = self.create_notification(days_ago=200, is_read=True)
+        unread = self.create_notification(days_ago=200, is_read=False)
+        expired_unread = self.create_notification(days_ago=500, is_read=False)
+        current = self.create_notification(days_ago=0, is_read=False)
+        cache.set(unread_count_key(self.user.id), 3)
+
+        # When: 아카이브와 함께 파티션 정리
+        call_command("maintain_notification_partitions", "--archive", retention_days=90, unread_retention_days=365)
+
+        # Then: 두 파티션은 분리 후 삭제되고, 보관 기간 이내의 읽지 않은 알림만 기본 파티션에 남음
+        partitions = month_partitions(connection)
+        self.assertNotIn(recent_month, partitions)
+        self.assertNotIn(old_month, partitions)
+        self.assertEqual(month_partitions(connection, attached=False), {})
+        self.assertEqual(set(Notification.objects.values_list("id", flat=True)), {unread.id, current.id})
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT id FROM {DEFAULT_PARTITION}")
+            self.assertEqual(cursor.fetchall(), [(unread.id,)])
+
+        # Then: 삭제된 알림의 전송 이벤트와 읽지 않은 알림 카운터도 정리
+        self.assertFalse(NotificationOutbox.objects.filter(notification_id__in=[read.id, expired_unread.id]).exists())
+        self.assertIsNone(cache.get(unread_count_key(self.user.id)))
+
+        # Then: 삭제 전 파티션 전체가 gzip CSV 로 저장됨
+        with default_storage.open(f"archives/notifications/{partition_name(recent_month)}.csv.gz") as archive:
+            rows = gzip.decompress(archive.read()).decode().splitlines()
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(rows[0].startswith("id,"))
+
+        # Then: 현재 월부터 미리 만든 파티션이 있음
+        self.assertIn(month_start(timezone.now()), partitions)
+        self.assertIn(add_months(month_start(timezone.now()), 3), partitions)
+
+    def test_whole_month_in_default_partition_moved_to_partition(self):
+        # Given: 월 파티션 없이 기본 파티션에 들어간 과거 월의 알림
+        old_month = month_start(timezone.now() - timedelta(days=200))
+        self.create_notification(days_ago=200, is_read=True)
+        self.create_notification(days_ago=200, is_read=False)
+        self.assertEqual(default_partition_months(connection), {old_month: 2})
+
+        # When: 기본 파티션의 월을 파티션으로 옮겨 정리
+        with patch("builtins.print") as printed:
+            call_command(
+                "maintain_notification_partitions", "--partition-default", retention_days=90, unread_retention_days=150
+            )
+
+        # Then: 옮긴 월 파티션이 통째로 삭제되고 기본 파티션에는 행 단위로 삭제할 행이 남지 않음
+        output = [call.args[0] for call in printed.call_args_list]
+        self.assertIn(f"기본 파티션 -> 파티션 이동: {partition_name(old_month)}", output)
+        self.assertIn(f"파티션 삭제: {partition_name(old_month)}", output)
+        self.assertIn("기본 파티션 정리: 0개 삭제", output)
+        self.assertEqual(default_partition_months(connection), {})
+        self.assertFalse(Notification.objects.exists())
@@ -0,0 +1,109 @@
+from importlib import import_module
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from estimations.models import Estimation, EstimationsRequest
+from expert.models import Expert
+from notifications.models import Notification
+
+User = get_user_model()
+
+backfill = import_module("notifications.migrations.0008_notification_payload")
+
+
+class NotificationRenderingTest(APITestCase):
+    def setUp(self):
+        # Given: 견적을 요청한 유저와 견적을 보낼 전문가들
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="user@example.com", name="유저", phone_number="01012345678", gender="F"
+        )
+        self.request = EstimationsRequest.objects.create(
+            user=self.user,
+            service_list=["mc"],
+            prefer_gender="M",
+            status="pending",
+            location="seoul",
+            wedding_hall="서울 웨딩홀",
+            wedding_datetime="2024-12-12 15:00:00",
+        )
+        self.experts = []
+        for index in range(3):
+            expert_user = User.objects.create_user(
+                email=f"expert{index}@example.com", name=f"전문가{index}", phone_number="01087654321", gender="M"
+            )
+            self.experts.append(
+                Expert.objects.create(user=expert_user, service="mc", available_location="seoul", appeal="소개")
+            )
+        self.client.force_authenticate(user=self.user)
+
+    def send_estimation(self, expert):
+        return Estimation.objects.create(
+            request=self.request, expert=expert, service="mc", location="seoul", due_date="2024-12-12", charge=300000
+        )
+
+    def test_estimation_notification_stores_compact_payload(self):
+        # When: 전문가가 견적을 보냄
+        estimation = self.send_estimation(self.experts[0])
+
+        # Then: 제목/내용 대신 id 와 값만 저장되고, 조회 시 템플릿으로 렌더링됨
+        notification = Notification.objects.get(notification_type="estimation")
+        self.assertEqual(notification.receiver_id, self.user.id)
+        self.assertEqual(
+            notification.payload,
+            {
+                "estimation_id": estimation.id,
+                "expert_id": self.experts[0].id,
+                "service": "mc",
+                "location": "seoul",
+                "due_date": "2024-12-12",
+                "charge": 300000,
+            },
+        )
+        self.assertEqual(notification.title, "전문가0님이 견적서를 보냈습니다. 확인해보세요!")
+        self.assertIn("- 성별: 남성", notification.message)
+        self.assertIn("- 진행 예상 지역: 서울", notification.message)
+
+    def test_list_renders_page_with_fixed_queries(self):
+        for expert in self.experts[:1]:
+            self.send_estimation(expert)
+        url = reverse("notification-list")
+        # 인증 유저 / 읽지 않은 알림 수 캐시를 채운 뒤 측정
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as one_expert:
+            self.client.get(url)
+
+        # Given: 여러 전문가의 견적 알림과 문구를 직접 지정한 알림
+        for expert in self.experts[1:]:
+            self.send_estimation(expert)
+        Notification.objects.create(receiver=self.user, title="공지", message="점검 안내", notification_type="schedule")
+
+        # When: 알림 목록 조회
+        with CaptureQueriesContext(connection) as many_experts:
+            response = self.client.get(url)
+
+        # Then: 전문가 이름은 한 번에 조회되어 쿼리 수가 알림 수와 무관
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(many_experts), len(one_expert))
+        titles = {notification["title"] for notification in response.data["notifications"]}
+        self.assertEqual(
+            titles, {"공지"} | {f"{expert.user.name}님이 견적서를 보냈습니다. 확인해보세요!" for expert in self.experts}
+        )
+
+    def test_backfill_compacts_legacy_text(self):
+        # Given: 이전 signal 이 저장하던 들여쓰기/빈 줄이 포함된 문구
+        legacy = """
+            - 진행 서비스: mc
+            
+            - 진행 지역: seoul
+                - 세부: 강남
+            """
+
+        # Then: 들여쓰기 구조는 유지하고 공통 들여쓰기와 빈 줄은 제거됨
+        self.assertEqual(backfill.compact_text(legacy), "- 진행 서비스: mc\n- 진행 지역: seoul\n    - 세부: 강남")
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
@@ -92,3 +93,64 @@ class NotificationAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.notification.refresh_from_db()
         self.assertTrue(self.notification.is_read)
+
+    def test_notification_unread_count_api(self):
+        # Given: 캐시가 비어 있는 상태에서 알림 하나 추가 생성
+        cache.clear()
+        Notification.objects.create(
+            receiver=self.user,
+            title="새로운 견적",
+            message="전문가로부터 견적이 도착했습니다.",
+            notification_type="estimation",
+        )
+        url = reverse("notification-unread-count")
+
+        # When: 읽지 않은 알림 수 조회 (첫 조회는 DB 로 계산)
+        response = self.client.get(url)
+
+        # Then: 읽지 않은 알림 수 반환
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["unread_count"], 2)
+
+        # When: 알림이 추가되면 커밋 후 카운터가 증가하고 이후 조회는 DB 를 사용하지 않음
+        with self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.create(
+                receiver=self.user,
+                title="새로운 메시지",
+                message="새 메시지가 도착했습니다.",
+                notification_type="message",
+            )
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        # Then: 증가된 카운터 반환
+        self.assertEqual(response.data["unread_count"], 3)
+
+    def test_notification_unread_count_after_read(self):
+        # Given: 카운터가 계산된 상태
+        cache.clear()
+        url = reverse("notification-unread-count")
+        self.assertEqual(self.client.get(url).data["unread_count"], 1)
+
+        # When: 알림 읽음 처리 (커밋 전에는 카운터 유지)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(reverse("notification-detail", args=[self.notification.id]))
+            self.assertEqual(self.client.get(url).data["unread_count"], 1)
+
+        # Then: 커밋 후 카운터 감소
+        self.assertEqual(self.client.get(url).data["unread_count"], 0)
+
+        # When: 새 알림 생성 후 전체 읽음 처리
+        with self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.create(
+                receiver=self.user,
+                title="새로운 메시지",
+                message="새 메시지가 도착했습니다.",
+                notification_type="message",
+            )
+        self.assertEqual(self.client.get(url).data["unread_count"], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(reverse("notification-read-all"))
+
+        # Then: 커밋 후 카운터 초기화
+        self.assertEqual(self.client.get(url).data["unread_count"], 0)
@@ -0,0 +1,74 @@
+# notifications/unread_counter.py
+from collections import Counter
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+
+from common.logging_config import logger
+from notifications.models import Notification
+
+# 카운터 캐시 유지 시간 - 만료되면 다음 조회 시 DB 로 재계산하여 오차를 바로잡음
+UNREAD_COUNT_TIMEOUT = 60 * 60 * 24
+# 한 번에 이 수를 넘는 유저의 카운터를 올려야 하면 INCR 대신 키를 삭제 (DEL 한 번으로 처리)
+UNREAD_COUNT_BULK_THRESHOLD = 100
+
+
+def unread_count_key(user_id):
+    return f"notifications:unread:{user_id}"
+
+
+def get_unread_count(user_id):
+    """
+    유저의 읽지 않은 알림 수 - 캐시에 없으면 DB 에서 계산 후 저장
+    """
+    key = unread_count_key(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(receiver_id=user_id, is_read=False).count()
+        # 계산 중 다른 요청이 먼저 저장한 값(INCR 결과)을 덮어쓰지 않도록 add 사용
+        cache.add(key, count, UNREAD_COUNT_TIMEOUT)
+    return count
+
+
+def increment_unread_counts(user_ids):
+    """
+    알림이 생성된 유저들의 카운터 증가
+    - 키가 없는 유저는 건너뛰고 다음 조회 시 DB 로 계산
+    """
+    counts = Counter(user_ids)
+    if len(counts) > UNREAD_COUNT_BULK_THRESHOLD:
+        cache.delete_many([unread_count_key(user_id) for user_id in counts])
+        return
+    for user_id, delta in counts.items():
+        try:
+            cache.incr(unread_count_key(user_id), delta)
+        except ValueError:
+            continue
+
+
+def decrement_unread_count(user_id, delta=1):
+    key = unread_count_key(user_id)
+    try:
+        count = cache.decr(key, delta)
+    except ValueError:
+        return
+    if count is not None and count < 0:
+        cache.delete(key)
+
+
+def reset_unread_count(user_id):
+    cache.set(unread_count_key(user_id), 0, UNREAD_COUNT_TIMEOUT)
+
+
+def push_unread_count(user_id):
+    """
+    NotificationConsumer 로 현재 카운터를 전송 (실패해도 요청은 계속 진행)
+    """
+    try:
+        async_to_sync(get_channel_layer().group_send)(
+            f"notification_{user_id}",
+            {"type": "send_unread_count", "unread_count": get_unread_count(user_id)},
+        )
+    except Exception as error:
+        logger.warning(f"읽지 않은 알림 수 전송 중 오류 발생: User ID {user_id} - {str(error)}")
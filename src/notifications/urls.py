@@ -4,10 +4,12 @@ from notifications.views.notification_views import (
     NotificationDetailAPIView,
     NotificationListAPIView,
     NotificationReadAllAPIView,
+    NotificationUnreadCountAPIView,
 )
 
 urlpatterns = [
     path("notifications/", NotificationListAPIView.as_view(), name="notification-list"),
     path("notifications/<int:notification_id>/", NotificationDetailAPIView.as_view(), name="notification-detail"),
+    path("notifications/unread-count/", NotificationUnreadCountAPIView.as_view(), name="notification-unread-count"),
     path("notifications/read_all/", NotificationReadAllAPIView.as_view(), name="notification-read-all"),
 ]
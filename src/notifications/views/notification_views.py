@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, mixins, status
@@ -5,11 +6,19 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.pagination import CreatedAtCursorPagination
 from notifications.models import Notification
+from notifications.rendering import render_notifications
 from notifications.serializers.notification_serializers import (
     NotificationReadSerializer,
     NotificationSerializer,
 )
+from notifications.unread_counter import (
+    decrement_unread_count,
+    get_unread_count,
+    push_unread_count,
+    reset_unread_count,
+)
 
 
 @extend_schema(tags=["Notification"])
@@ -20,6 +29,7 @@ class NotificationListAPIView(generics.ListAPIView):
 
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -27,8 +37,16 @@ class NotificationListAPIView(generics.ListAPIView):
 
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({"unread_count": queryset.count(), "notifications": serializer.data})
+        page = render_notifications(self.paginate_queryset(queryset))
+        serializer = self.get_serializer(page, many=True)
+        return Response(
+            {
+                "unread_count": get_unread_count(request.user.id),
+                "previous": self.paginator.get_previous_link(),
+                "next": self.paginator.get_next_link(),
+                "notifications": serializer.data,
+            }
+        )
 
 
 @extend_schema(tags=["Notification"])
@@ -47,6 +65,32 @@ class NotificationDetailAPIView(generics.GenericAPIView, mixins.UpdateModelMixin
     def patch(self, request, *args, **kwargs):
         return self.partial_update(request, *args, **kwargs)
 
+    def perform_update(self, serializer):
+        was_read = serializer.instance.is_read
+        notification = serializer.save(is_read=True)
+        if not was_read:
+            user_id = notification.receiver_id
+            # 롤백된 읽음 처리로 카운터가 줄지 않도록 커밋 후 감소 (등록 순서대로 실행되어 감소 후 전송)
+            transaction.on_commit(lambda: decrement_unread_count(user_id))
+            transaction.on_commit(lambda: push_unread_count(user_id))
+
+
+@extend_schema(tags=["Notification"])
+class NotificationUnreadCountAPIView(APIView):
+    """
+    읽지 않은 알림 수 조회 API (알림 뱃지용)
+    """
+
+    permission_classes = [IsAuthenticated]
+    # 인증 유저 조회 + 캐시 미스 시 count
+    query_budget = 2
+
+    @extend_schema(
+        responses={200: {"type": "object", "properties": {"unread_count": {"type": "integer"}}}},
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({"unread_count": get_unread_count(request.user.id)}, status=status.HTTP_200_OK)
+
 
 @extend_schema(tags=["Notification"])
 class NotificationReadAllAPIView(APIView):
@@ -56,8 +100,10 @@ class NotificationReadAllAPIView(APIView):
 
     permission_classes = [IsAuthenticated]
 
-    def update(self, request, *args, **kwargs):
+    def patch(self, request, *args, **kwargs):
         user = request.user
         notifications = Notification.objects.filter(receiver_id=user.id, is_read=False)
         notifications.update(is_read=True)
+        transaction.on_commit(lambda: reset_unread_count(user.id))
+        transaction.on_commit(lambda: push_unread_count(user.id))
         return Response({"detail": "전체 알림이 읽음 처리되었습니다."}, status=status.HTTP_200_OK)
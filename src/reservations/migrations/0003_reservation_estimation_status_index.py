@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("estimations", "0008_hot_path_indexes"),
+        ("reservations", "0002_cancelmanager"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(fields=["estimation", "status"], name="reservation_est_status_idx"),
+        ),
+    ]
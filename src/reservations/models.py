@@ -10,6 +10,12 @@ class Reservation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 견적 -> 예약 조인 후 status 필터를 인덱스만으로 처리 (estimation, status 를 모두 포함)
+            models.Index(fields=["estimation", "status"], name="reservation_est_status_idx"),
+        ]
+
 
 class CancelManager(models.Model):
     reservation = models.ForeignKey(Reservation, on_delete=models.CASCADE)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from common.images import ImageVariantsField
 from estimations.models import Estimation
 from expert.models import Expert
 from reservations.models import Reservation
@@ -14,10 +15,11 @@ class UserInfoSerializer(serializers.ModelSerializer):  # 사용자 정보를 
 
 class ExpertInfoSerializer(serializers.ModelSerializer):
     user = UserInfoSerializer(read_only=True)
+    expert_image_variants = ImageVariantsField(image_field="expert_image")
 
     class Meta:
         model = Expert
-        fields = ("id", "user", "expert_image")
+        fields = ("id", "user", "expert_image", "expert_image_variants")
 
 
 class EstimationInfoSerializer(serializers.ModelSerializer):
@@ -1,3 +1,4 @@
+import json
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
@@ -86,7 +87,26 @@ class ReservationTestCase(APITestCase):
 
         # then
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), Reservation.objects.count())
+        self.assertEqual(response.data["count"], Reservation.objects.count())
+
+    def test_list_reservations_stream(self):
+        # given
+        for estimation in self.estimations:
+            Reservation.objects.create(
+                estimation=estimation,
+                status="pending",
+            )
+        url = reverse("reservation-list")
+
+        # when
+        response = self.client.get(url, {"stream": "true"}, headers={"Authorization": f"Bearer {self.access}"})
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(data), Reservation.objects.count())
+        self.assertEqual(data[0]["estimation"]["id"], self.estimations[0].id)
 
     def test_create_reservation(self):
         data = {"estimation_id": self.estimations[0].id}
@@ -121,19 +141,31 @@ class ReservationTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["status"], data["status"])
 
+    def expert_reservation(self):
+        # 전문가 계정으로 인증하고 해당 전문가의 예약 생성
+        expert_user = self.expert_users[0]
+        expert_user.is_expert = True
+        expert_user.save(update_fields=["is_expert"])
+        access = str(RefreshToken.for_user(expert_user).access_token)
+        reservation = Reservation.objects.create(estimation=self.estimations[0], status="pending")
+        return reservation, {"Authorization": f"Bearer {access}"}
+
     def test_expert_reservation_list(self):
         """Expert의 예약 리스트 조회 테스트"""
-        url = reverse("expert-reservation-list", kwargs={"review_id": self.review.id})
-        response = self.client.get(url, headers={"Authorization": f"Bearer {self.access}"})
+        reservation, headers = self.expert_reservation()
+        url = reverse("expert-reservation-list")
+        response = self.client.get(url, headers=headers)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], reservation.id)
 
     def test_expert_reservation_detail(self):
         """Expert의 예약 상세 조회 테스트"""
-        url = reverse("expert-reservation-detail", kwargs={"id": self.reservation.id})
-        response = self.client.get(url, headers={"Authorization": f"Bearer {self.access}"})
+        reservation, headers = self.expert_reservation()
+        url = reverse("expert-reservation-detail", kwargs={"id": reservation.id})
+        response = self.client.get(url, headers=headers)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["id"], self.reservation.id)
+        self.assertEqual(response.data["id"], reservation.id)
         self.assertEqual(response.data["status"], "pending")
@@ -6,6 +6,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from common.permissions.expert_permissions import IsExpert
+from common.streaming import StreamingListMixin
 from reservations.models import Reservation
 from reservations.seriailzers import (
     ExpertReservationInfoSerializer,
@@ -14,7 +15,7 @@ from reservations.seriailzers import (
 )
 
 
-class ReservationListAPIView(generics.ListAPIView):
+class ReservationListAPIView(StreamingListMixin, generics.ListAPIView):
 
     queryset = Reservation.objects.all().prefetch_related(
         "estimation", "estimation__request", "estimation__request__user", "estimation__expert"
@@ -86,7 +87,7 @@ class ReservationRetrieveUpdateAPIView(generics.GenericAPIView, RetrieveModelMix
         return self.partial_update(request, *args, **kwargs)
 
 
-class ExpertReservationListAPIView(generics.ListAPIView):
+class ExpertReservationListAPIView(StreamingListMixin, generics.ListAPIView):
     serializer_class = ExpertReservationInfoSerializer
     permission_classes = [IsExpert]
 
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.15 on 2026-10-18 02:41
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expert", "0006_alter_career_expert"),
+        ("reviews", "0005_alter_review_rating"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExpertRating",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("review_count", models.PositiveIntegerField(default=0)),
+                ("rating_sum", models.DecimalField(decimal_places=1, default=Decimal("0.0"), max_digits=10)),
+                ("rating_average", models.DecimalField(decimal_places=2, default=Decimal("0.00"), max_digits=3)),
+                ("rating_histogram", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "expert",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="rating_summary", to="expert.expert"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,6 +1,10 @@
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import Count, Q, Sum
 
 from common.constants.choices import RATING_CHOICES
+from expert.models import Expert
 from reservations.models import Reservation
 
 
@@ -15,3 +19,57 @@ class Review(models.Model):
 class ReviewImages(models.Model):
     review = models.ForeignKey(Review, on_delete=models.CASCADE)
     image = models.ImageField(upload_to="images/reviews/", null=True, blank=True)
+    # 리사이즈/WebP 변형 이미지 정보 (common.images)
+    image_variants = models.JSONField(default=dict, blank=True)
+
+
+class ExpertRating(models.Model):
+    """
+    전문가별 리뷰 평점 집계 (리뷰 생성/수정/삭제 시 갱신)
+    """
+
+    expert = models.OneToOneField(Expert, on_delete=models.CASCADE, related_name="rating_summary")
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.DecimalField(max_digits=10, decimal_places=1, default=Decimal("0.0"))
+    rating_average = models.DecimalField(max_digits=3, decimal_places=2, default=Decimal("0.00"))
+    rating_histogram = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def aggregate_fields():
+        """
+        review_count, rating_sum 과 RATING_CHOICES 별 리뷰 수를 계산하는 aggregate 인자를 반환합니다.
+        """
+        fields = {"review_count": Count("id"), "rating_sum": Sum("rating")}
+        for value, _ in RATING_CHOICES:
+            fields[f"rating_{value}"] = Count("id", filter=Q(rating=value))
+        return fields
+
+    @staticmethod
+    def build_defaults(aggregated):
+        """
+        aggregate 결과를 ExpertRating 필드 값으로 변환합니다.
+        """
+        review_count = aggregated["review_count"] or 0
+        rating_sum = aggregated["rating_sum"] or Decimal("0.0")
+        rating_average = (rating_sum / review_count).quantize(Decimal("0.01")) if review_count else Decimal("0.00")
+        return {
+            "review_count": review_count,
+            "rating_sum": rating_sum,
+            "rating_average": rating_average,
+            "rating_histogram": {str(value): aggregated[f"rating_{value}"] for value, _ in RATING_CHOICES},
+        }
+
+    @classmethod
+    def refresh_for_expert(cls, expert_id):
+        """
+        특정 전문가의 평점 집계를 리뷰 테이블로부터 다시 계산하여 저장합니다.
+        """
+        if not expert_id or not Expert.objects.filter(id=expert_id).exists():
+            return None
+
+        aggregated = Review.objects.filter(reservation__estimation__expert_id=expert_id).aggregate(
+            **cls.aggregate_fields()
+        )
+        summary, _ = cls.objects.update_or_create(expert_id=expert_id, defaults=cls.build_defaults(aggregated))
+        return summary
@@ -8,8 +8,8 @@ from reviews.serializers.guest_seriailzers import (
 
 
 class ReviewListSerializer(serializers.ModelSerializer):
-    review_images = ReviewImagesSerializers(many=True, read_only=True)
-    user = UserInfoSerializer(source="reservation.estimations.request.user", read_only=True)
+    review_images = ReviewImagesSerializers(many=True, read_only=True, source="reviewimages_set")
+    user = UserInfoSerializer(source="reservation.estimation.request.user", read_only=True)
 
     class Meta:
         model = Review
@@ -1,28 +1,64 @@
+from django.db import transaction
 from rest_framework import serializers
 
+from common.images import ImageVariantsField
+from common.uploads import UploadedImageField
 from reviews.models import Review, ReviewImages
 from users.models import User
 
 
 class UserInfoSerializer(serializers.ModelSerializer):
+    profile_image_variants = ImageVariantsField(image_field="profile_image")
+
     class Meta:
         model = User
-        fields = ["id", "email", "name", "profile_image"]
+        fields = ["id", "email", "name", "profile_image", "profile_image_variants"]
         read_only_fields = ["id", "email", "name", "profile_image"]
 
 
 class ReviewImagesSerializers(serializers.ModelSerializer):
+    image_variants = ImageVariantsField(image_field="image")
 
     class Meta:
         model = ReviewImages
-        fields = ("id", "image")
+        fields = ("id", "image", "image_variants")
+
+
+# 리뷰 한 건에 첨부할 수 있는 이미지 수
+MAX_REVIEW_IMAGES = 10
 
 
 class ReviewSerializer(serializers.ModelSerializer):
-    review_images = ReviewImagesSerializers(many=True, required=False)
+    review_images = ReviewImagesSerializers(many=True, read_only=True, source="reviewimages_set")
     user = UserInfoSerializer(source="reservation.estimation.request.user", read_only=True)
+    # 직접 업로드(presigned URL)한 리뷰 이미지들의 upload_id
+    image_upload_ids = serializers.ListField(
+        child=UploadedImageField(kind="review_image"), write_only=True, required=False, max_length=MAX_REVIEW_IMAGES
+    )
 
     class Meta:
         model = Review
-        fields = ("id", "user", "reservation", "content", "rating", "review_images", "created_at", "updated_at")
+        fields = (
+            "id",
+            "user",
+            "reservation",
+            "content",
+            "rating",
+            "review_images",
+            "image_upload_ids",
+            "created_at",
+            "updated_at",
+        )
         read_only_fields = ("id", "user", "created_at", "updated_at")
+
+    def create(self, validated_data):
+        """
+        리뷰와 업로드 확인된 이미지를 함께 저장합니다.
+        (이미지 별 post_save 로 변형 이미지 생성 / 리뷰 목록 캐시 무효화가 처리되도록 bulk_create 를 사용하지 않음)
+        """
+        image_names = validated_data.pop("image_upload_ids", [])
+        with transaction.atomic():
+            review = super().create(validated_data)
+            for name in image_names:
+                ReviewImages.objects.create(review=review, image=name)
+        return review
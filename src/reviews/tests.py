@@ -94,7 +94,7 @@ class ReviewAPITestCase(APITestCase):
         response = self.client.get(url, headers={"Authorization": f"Bearer {self.access}"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(len(response.data), 1)
+        self.assertGreaterEqual(len(response.data["results"]), 1)
 
     def test_retrieve_review(self):
         """리뷰 상세 조회 테스트"""
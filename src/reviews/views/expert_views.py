@@ -10,7 +10,13 @@ from reviews.serializers.expert_serializers import ReviewListSerializer
 class ReviewListViewForExpert(generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsExpert]
     serializer_class = ReviewListSerializer
+    # 인증 유저 조회 + 페이지 count + 목록 + 리뷰 이미지 prefetch
+    query_budget = 4
 
     @extend_schema(tags=["experts-reviews"], summary="전문가의 자신의 서비스에 대한 리뷰 목록 조회")
     def get_queryset(self):
-        return Review.objects.filter(reservation__estimation__request__user=self.request.user)
+        return (
+            Review.objects.filter(reservation__estimation__request__user=self.request.user)
+            .select_related("reservation__estimation__request__user")
+            .prefetch_related("reviewimages_set")
+        )
@@ -4,6 +4,8 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from common.pagination import CreatedAtCursorPagination
+from common.response_cache import CachedResponseMixin
 from reviews.models import Review
 from reviews.serializers.guest_seriailzers import ReviewSerializer
 
@@ -11,9 +13,15 @@ from reviews.serializers.guest_seriailzers import ReviewSerializer
 class ReviewListCreateAPIView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ReviewSerializer
+    # 인증 유저 조회 + 페이지 count + 목록 + 리뷰 이미지 prefetch
+    query_budget = {"GET": 4}
 
     def get_queryset(self):
-        return Review.objects.filter(reservation__estimation__request__user=self.request.user)
+        return (
+            Review.objects.filter(reservation__estimation__request__user=self.request.user)
+            .select_related("reservation__estimation__request__user")
+            .prefetch_related("reviewimages_set")
+        )
 
     @extend_schema(
         tags=["guests-reviews"],
@@ -34,20 +42,32 @@ class ReviewListCreateAPIView(generics.ListCreateAPIView):
     tags=["guests-reviews"],
     summary="유저가 전문가로부터 받은 견적 상세 조회 시 하단의 리뷰 리스트 반환",
 )
-class ReviewListByExpertAPIView(generics.ListAPIView):
+class ReviewListByExpertAPIView(CachedResponseMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ReviewSerializer
+    pagination_class = CreatedAtCursorPagination
+    # 리뷰 작성자 정보가 함께 노출되므로 유저 변경("reviews")에도 무효화
+    cache_tags = ("reviews", "reviews:{expert_id}")
+    # 인증 유저 조회 + 목록 + 리뷰 이미지 prefetch
+    query_budget = 3
 
     def get_queryset(self):
         expert_id = self.kwargs["expert_id"]
         if not expert_id:
             raise ValidationError(detail="expert_id 가 제공되지 않았습니다.")
-        queryset = Review.objects.filter(reservation__estimation__expert_id=expert_id).order_by("-created_at")
+        queryset = (
+            Review.objects.filter(reservation__estimation__expert_id=expert_id)
+            .select_related("reservation__estimation__request__user")
+            .prefetch_related("reviewimages_set")
+            .order_by("-created_at")
+        )
         return queryset
 
 
 class ReviewDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Review.objects.all()
+    queryset = Review.objects.select_related("reservation__estimation__request__user").prefetch_related(
+        "reviewimages_set"
+    )
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticated]
 
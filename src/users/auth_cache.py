@@ -0,0 +1,53 @@
+# users/auth_cache.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from users.models import User
+
+# 캐시 데이터 형식 버전 - User/Expert 모델 구조가 바뀌면 올려서 이전 형식의 캐시를 사용하지 않도록 함
+AUTH_USER_CACHE_SCHEMA = 1
+# 없는 유저도 잠시 캐시하여 만료되지 않은 토큰으로 반복 조회하는 것을 막음
+USER_NOT_FOUND = False
+
+
+def auth_user_version_key(user_id):
+    return f"auth:user:{user_id}:version"
+
+
+def auth_user_key(user_id, version):
+    return f"auth:user:v{AUTH_USER_CACHE_SCHEMA}:{user_id}:{version}"
+
+
+def load_auth_user(user_id):
+    # 전문가 정보(expert)를 함께 조회하여 user.expert 접근 시 추가 쿼리가 없도록 함
+    # 결과가 캐시되므로 복제본이 아닌 primary 에서 조회 (가입 직후 복제 지연으로 '없는 유저'가 캐시되지 않도록)
+    return User.objects.using(DEFAULT_DB_ALIAS).select_related("expert").filter(id=user_id).first()
+
+
+def get_auth_user(user_id):
+    """
+    토큰의 user_id 로 인증 유저를 조회합니다 (짧은 TTL 캐시, 유저/전문가 변경 시 버전을 올려 무효화).
+    - 키에 유저 별 버전이 포함되므로, 변경 전에 DB 를 읽은 요청이 늦게 캐시를 채워도 새 버전에서는 보이지 않음
+    - 없는 유저이면 None 을 반환합니다. (활성 여부는 호출하는 쪽에서 확인)
+    """
+    version = cache.get(auth_user_version_key(user_id), 1)
+    key = auth_user_key(user_id, version)
+    user = cache.get(key)
+    if user is None:
+        user = load_auth_user(user_id) or USER_NOT_FOUND
+        cache.set(key, user, getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60))
+    return user or None
+
+
+def get_expert_id(user):
+    return user.expert.id if hasattr(user, "expert") else None
+
+
+def invalidate_auth_user(user_id):
+    key = auth_user_version_key(user_id)
+    if not cache.add(key, 2, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, timeout=None)
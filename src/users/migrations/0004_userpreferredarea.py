@@ -0,0 +1,114 @@
+# Generated by Django 5.1.15 on 2026-10-18 02:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from common.choice_index import backfill_choice_index
+
+
+def backfill_user_preferred_areas(apps, schema_editor):
+    backfill_choice_index(
+        apps.get_model("users", "UserPreferredArea"),
+        apps.get_model("users", "User"),
+        "user",
+        "area",
+        "prefer_location",
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_alter_user_prefer_location_alter_user_prefer_service"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserPreferredArea",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "area",
+                    models.CharField(
+                        choices=[
+                            ("seoul", "서울특별시"),
+                            ("busan", "부산광역시"),
+                            ("incheon", "인천광역시"),
+                            ("daegu", "대구광역시"),
+                            ("daejeon", "대전광역시"),
+                            ("gwangju", "광주광역시"),
+                            ("ulsan", "울산광역시"),
+                            ("sejong", "세종특별시"),
+                            ("jeju", "제주특별자치도"),
+                            ("gyeonggi_suwon", "경기도 수원시"),
+                            ("gyeonggi_seongnam", "경기도 성남시"),
+                            ("gyeonggi_yongin", "경기도 용인시"),
+                            ("gyeonggi_bucheon", "경기도 부천시"),
+                            ("gyeonggi_anyang", "경기도 안양시"),
+                            ("gyeonggi_ansan", "경기도 안산시"),
+                            ("gyeonggi_goyang", "경기도 고양시"),
+                            ("gyeonggi_pyeongtaek", "경기도 평택시"),
+                            ("gyeonggi_paju", "경기도 파주시"),
+                            ("gyeonggi_gimpo", "경기도 김포시"),
+                            ("gyeonggi_icheon", "경기도 이천시"),
+                            ("gyeonggi_pocheon", "경기도 포천시"),
+                            ("gyeonggi_namyangju", "경기도 남양주시"),
+                            ("gyeonggi_hwaseong", "경기도 화성시"),
+                            ("gangwon_chuncheon", "강원도 춘천시"),
+                            ("gangwon_wonju", "강원도 원주시"),
+                            ("gangwon_gangneung", "강원도 강릉시"),
+                            ("gangwon_donghae", "강원도 동해시"),
+                            ("gangwon_sokcho", "강원도 속초시"),
+                            ("gangwon_samcheok", "강원도 삼척시"),
+                            ("chungbuk_cheongju", "충청북도 청주시"),
+                            ("chungbuk_chungju", "충청북도 충주시"),
+                            ("chungbuk_jecheon", "충청북도 제천시"),
+                            ("chungbuk_okkcheon", "충청북도 옥천군"),
+                            ("chungbuk_danyang", "충청북도 단양군"),
+                            ("chungnam_cheonan", "충청남도 천안시"),
+                            ("chungnam_asan", "충청남도 아산시"),
+                            ("chungnam_seosan", "충청남도 서산시"),
+                            ("chungnam_boryeong", "충청남도 보령시"),
+                            ("chungnam_nonsan", "충청남도 논산시"),
+                            ("jeonbuk_jeonju", "전라북도 전주시"),
+                            ("jeonbuk_gunsan", "전라북도 군산시"),
+                            ("jeonbuk_iksan", "전라북도 익산시"),
+                            ("jeonbuk_namwon", "전라북도 남원시"),
+                            ("jeonbuk_jeongeup", "전라북도 정읍시"),
+                            ("jeonnam_mokpo", "전라남도 목포시"),
+                            ("jeonnam_yeosu", "전라남도 여수시"),
+                            ("jeonnam_suncheon", "전라남도 순천시"),
+                            ("jeonnam_naju", "전라남도 나주시"),
+                            ("jeonnam_gwangyang", "전라남도 광양시"),
+                            ("gyeongbuk_pohang", "경상북도 포항시"),
+                            ("gyeongbuk_gyeongju", "경상북도 경주시"),
+                            ("gyeongbuk_gimcheon", "경상북도 김천시"),
+                            ("gyeongbuk_andong", "경상북도 안동시"),
+                            ("gyeongbuk_gumi", "경상북도 구미시"),
+                            ("gyeongbuk_mungyeong", "경상북도 문경시"),
+                            ("gyeongnam_changwon", "경상남도 창원시"),
+                            ("gyeongnam_jinju", "경상남도 진주시"),
+                            ("gyeongnam_tongyeong", "경상남도 통영시"),
+                            ("gyeongnam_sacheon", "경상남도 사천시"),
+                            ("gyeongnam_gimhae", "경상남도 김해시"),
+                            ("gyeongnam_miryang", "경상남도 밀양시"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="preferred_areas",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("area", "user"), name="unique_user_preferred_area")],
+            },
+        ),
+        migrations.RunPython(backfill_user_preferred_areas, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,10 @@
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
-from django.db import models
+from django.db import connections, models
+from django.db.models.signals import post_save
 from multiselectfield import MultiSelectField
 
+from common.choice_index import sync_choice_index
 from common.constants.choices import AREA_CHOICES, GENDER_CHOICES, SERVICE_CHOICES
 
 
@@ -31,6 +33,79 @@ class UserManager(BaseUserManager):
 
         return user
 
+    def preferring_area(self, area):
+        """
+        area 지역을 선호 지역으로 설정한 유저 (UserPreferredArea 인덱스로 조회)
+        """
+        return self.filter(preferred_areas__area=area)
+
+    def upsert_social_user(self, email, name="", profile_image="", phone_number=""):
+        """
+        소셜 로그인 유저를 한 번의 INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING 으로 생성/갱신합니다.
+        - 기존 유저는 빈 값이 아닌 항목만 갱신하고 다시 활성화 (조회 후 save 하던 방식과 같은 규칙)
+        - 같은 이메일로 동시에 로그인해도 유니크 제약 위반 없이 한 행으로 합쳐짐
+        - bulk_create 처럼 post_save 가 발생하지 않으므로 캐시 무효화 등을 위해 직접 전송합니다.
+          생성 여부는 (xmax = 0), 변경된 항목은 같은 문장의 갱신 전 행(old CTE)과 비교해 구하고
+          기존 유저에서 바뀐 항목이 없으면 전송하지 않습니다.
+        """
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        user = self.model(
+            email=email,
+            name=name or "",
+            profile_image=profile_image or "",
+            phone_number=phone_number or "",
+        )
+        user.set_unusable_password()
+
+        fields = [field for field in self.model._meta.concrete_fields if not field.primary_key]
+        values = [field.get_db_prep_save(field.pre_save(user, True), connection) for field in fields]
+        update_fields = ["name", "profile_image", "phone_number"]
+        table = quote(self.model._meta.db_table)
+        assignments = [
+            f"{quote(column)} = COALESCE(NULLIF(EXCLUDED.{quote(column)}, ''), {table}.{quote(column)})"
+            for column in update_fields
+        ]
+        returning = self.model._meta.concrete_fields
+        compared = [*update_fields, "is_active"]
+        sql = (
+            f"WITH old AS (SELECT {', '.join(quote(column) for column in compared)} FROM {table} "
+            f"WHERE {quote('email')} = %s), "
+            f"upserted AS ("
+            f"INSERT INTO {table} ({', '.join(quote(field.column) for field in fields)}) "
+            f"VALUES ({', '.join(['%s'] * len(fields))}) "
+            f"ON CONFLICT ({quote('email')}) DO UPDATE SET {', '.join(assignments)}, {quote('is_active')} = %s "
+            f"RETURNING {', '.join(quote(field.column) for field in returning)}, (xmax = 0) AS inserted) "
+            f"SELECT {', '.join('upserted.' + quote(field.column) for field in returning)}, upserted.inserted, "
+            f"{', '.join(f'upserted.{quote(column)} IS DISTINCT FROM old.{quote(column)}' for column in compared)} "
+            f"FROM upserted LEFT JOIN old ON TRUE"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [user.email, *values, True])
+            row = cursor.fetchone()
+        row, inserted, changes = row[: len(returning)], row[len(returning)], row[len(returning) + 1 :]
+
+        # SELECT 결과와 같도록 DB 값 변환(bool, datetime, MultiSelectField 등)을 적용
+        converted = []
+        for field, value in zip(returning, row):
+            column = field.get_col(self.model._meta.db_table)
+            for converter in connection.ops.get_db_converters(column) + column.get_db_converters(connection):
+                value = converter(value, column, connection)
+            converted.append(value)
+        user = self.model.from_db(self.db, [field.attname for field in returning], converted)
+
+        changed_fields = [column for column, changed in zip(compared, changes) if changed]
+        if inserted or changed_fields:
+            post_save.send(
+                sender=self.model,
+                instance=user,
+                created=inserted,
+                update_fields=None if inserted else frozenset(changed_fields),
+                raw=False,
+                using=self.db,
+            )
+        return user
+
     def create_superuser(self, email, password, **kwargs):
         kwargs.setdefault("is_superuser", True)
         kwargs.setdefault("is_active", True)
@@ -51,9 +126,29 @@ class User(AbstractBaseUser, PermissionsMixin):
     prefer_service = MultiSelectField(choices=SERVICE_CHOICES, max_length=10, null=True, blank=True)
     prefer_location = MultiSelectField(choices=AREA_CHOICES, max_length=30, max_choices=3, null=True, blank=True)
     profile_image = models.ImageField(max_length=200, null=True, blank=True, upload_to="images/profile/")
+    # 리사이즈/WebP 변형 이미지 정보 (common.images)
+    profile_image_variants = models.JSONField(default=dict, blank=True)
     is_active = models.BooleanField(default=True)
     is_expert = models.BooleanField(default=False)
     is_staff = models.BooleanField(default=False)
 
     USERNAME_FIELD = "email"
     objects = UserManager()
+
+
+class UserPreferredArea(models.Model):
+    """
+    User.prefer_location 의 정규화 인덱스 (post_save 시그널로 동기화)
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="preferred_areas")
+    area = models.CharField(choices=AREA_CHOICES, max_length=30)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["area", "user"], name="unique_user_preferred_area"),
+        ]
+
+    @classmethod
+    def sync(cls, users):
+        sync_choice_index(cls, "user", "area", users, "prefer_location")
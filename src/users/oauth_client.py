@@ -0,0 +1,165 @@
+# users/oauth_client.py
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from common.exceptions import BadRequestException, InternalServerException
+from common.logging_config import logger
+
+# 재시도할 provider 응답 상태 (일시적인 장애)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def provider_token_request(provider, code, state=None):
+    """
+    (토큰 URL, form payload) - provider 별 인가 코드 교환 요청
+    """
+    payload = {"grant_type": "authorization_code", "code": code}
+    if provider == "naver":
+        payload.update(
+            {
+                "client_id": settings.NAVER_CLIENT_ID,
+                "client_secret": settings.NAVER_CLIENT_SECRET,
+                "state": state,
+            }
+        )
+        return settings.NAVER_TOKEN_URL, payload
+    if provider == "kakao":
+        payload.update(
+            {
+                "client_id": settings.KAKAO_CLIENT_ID,
+                "redirect_uri": settings.KAKAO_CALLBACK_URL,
+            }
+        )
+        return settings.KAKAO_TOKEN_URL, payload
+    if provider == "google":
+        payload.update(
+            {
+                "client_id": settings.GOOGLE_CLIENT_ID,
+                "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+            }
+        )
+        return settings.GOOGLE_TOKEN_URL, payload
+    raise BadRequestException("지원되지 않는 소셜 제공자입니다.", code="unsupported_provider")
+
+
+def provider_user_info_url(provider):
+    if provider == "naver":
+        return settings.NAVER_USER_INFO_URL
+    if provider == "kakao":
+        return settings.KAKAO_USER_INFO_URL
+    if provider == "google":
+        return settings.GOOGLE_USER_INFO_URL
+    raise BadRequestException("지원되지 않는 소셜 제공자입니다.", code="unsupported_provider")
+
+
+class OAuthProviderClient:
+    """
+    소셜 로그인 provider HTTP 클라이언트
+    - 프로세스 당 하나의 Session 으로 keep-alive 연결을 재사용 (provider 별 TLS 연결 풀)
+    - 모든 요청에 connect / read timeout 적용 -> 느린 provider 가 워커 스레드를 무한정 점유하지 않음
+    - 재시도는 jitter 가 있는 지수 backoff 로 제한된 횟수만 수행
+      토큰 교환(POST)은 인가 코드가 일회용이므로 연결 실패만 재시도하고, 조회(GET)는 읽기 실패/일시 오류도 재시도
+    """
+
+    def __init__(self, connect_timeout, read_timeout, retries, pool_size, backoff_factor=0.2, backoff_jitter=0.2):
+        self.timeout = (connect_timeout, read_timeout)
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            allowed_methods=frozenset({"GET"}),
+            status_forcelist=RETRY_STATUS_CODES,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            raise_on_status=False,
+        )
+        # pool_connections: 호스트 별 풀 수 (naver / kakao / google 의 토큰, 유저 정보 호스트)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method, url, error_message, error_code, **kwargs):
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            logger.error(f"소셜 provider 요청 중 오류 발생: {method} {url} {str(e)}")
+            raise InternalServerException(error_message, code=error_code) from e
+        if response.status_code != 200:
+            raise InternalServerException(error_message, code=error_code)
+        return response.json()
+
+    def fetch_access_token(self, provider, code, state=None):
+        token_url, payload = provider_token_request(provider, code, state)
+        data = self.request(
+            "POST",
+            token_url,
+            f"{provider}에서 액세스 토큰을 가져오는 데 실패했습니다.",
+            "token_fetch_failed",
+            data=payload,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        return data.get("access_token")
+
+    def fetch_user_info(self, provider, access_token):
+        return self.request(
+            "GET",
+            provider_user_info_url(provider),
+            f"{provider}에서 사용자 정보를 가져오는 데 실패했습니다.",
+            "user_info_fetch_failed",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncOAuthProviderClient:
+    """
+    이벤트 루프를 막지 않는 async 버전 - 같은 연결 풀을 사용하며 요청은 thread_sensitive=False 스레드에서 실행
+    (timeout 이 있으므로 스레드 점유 시간도 제한됨)
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def fetch_access_token(self, provider, code, state=None):
+        return await sync_to_async(self.client.fetch_access_token, thread_sensitive=False)(provider, code, state)
+
+    async def fetch_user_info(self, provider, access_token):
+        return await sync_to_async(self.client.fetch_user_info, thread_sensitive=False)(provider, access_token)
+
+
+_client = None
+
+
+def get_oauth_client():
+    global _client
+    if _client is None:
+        _client = OAuthProviderClient(
+            connect_timeout=getattr(settings, "OAUTH_HTTP_CONNECT_TIMEOUT", 3),
+            read_timeout=getattr(settings, "OAUTH_HTTP_READ_TIMEOUT", 5),
+            retries=getattr(settings, "OAUTH_HTTP_RETRIES", 2),
+            pool_size=getattr(settings, "OAUTH_HTTP_POOL_SIZE", 20),
+        )
+    return _client
+
+
+def get_async_oauth_client():
+    return AsyncOAuthProviderClient(get_oauth_client())
+
+
+@receiver(setting_changed)
+def reset_oauth_client(setting, **kwargs):
+    # 테스트에서 timeout/재시도 설정을 바꾸면 새 클라이언트를 사용
+    global _client
+    if setting.startswith("OAUTH_HTTP_") and _client is not None:
+        _client.close()
+        _client = None
@@ -0,0 +1,114 @@
+# users/oauth_stub.py
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+def stub_user_info(provider, token):
+    # provider 별 실제 응답과 같은 구조 (SocialLoginAPIView._parse_user_info 가 파싱)
+    email = f"{token}@example.com"
+    name = token[:25]
+    if provider == "naver":
+        return {"response": {"email": email, "name": name, "profile_image": "", "mobile": "010-1234-5678"}}
+    if provider == "kakao":
+        return {"kakao_account": {"email": email, "profile": {"nickname": name, "profile_image_url": ""}}}
+    return {"email": email, "name": name, "picture": ""}
+
+
+class StubOAuthHandler(BaseHTTPRequestHandler):
+    """
+    naver / kakao / google 토큰, 유저 정보 API 를 흉내내는 로컬 stub (테스트/지연 시간 벤치마크용)
+    - POST /<provider>/token: 인가 코드를 그대로 access_token 으로 반환
+    - GET /<provider>/userinfo: access_token 으로 만든 이메일의 유저 정보 반환
+    keep-alive(HTTP/1.1)를 지원하며, 새 연결 수와 요청 수를 기록합니다.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 나눠 쓰므로 Nagle 을 끄지 않으면 keep-alive 연결에서 응답마다 지연(delayed ACK)이 생김
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        code = parse_qs(body).get("code", [""])[0]
+        self.respond({"access_token": code, "token_type": "Bearer", "expires_in": 3600})
+
+    def do_GET(self):
+        provider = self.path.strip("/").split("/")[0]
+        token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        self.respond(stub_user_info(provider, token))
+
+    def respond(self, data):
+        with self.server.lock:
+            self.server.request_count += 1
+            failing = self.server.fail_remaining > 0
+            self.server.fail_remaining -= failing
+
+        time.sleep(self.server.latency)
+        status, body = (503, b"{}") if failing else (200, json.dumps(data).encode())
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubOAuthProvider:
+    def __init__(self, server):
+        self.server = server
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        # override_settings(**provider.settings) 로 실제 provider 대신 stub 을 사용
+        self.settings = {
+            "NAVER_CLIENT_ID": "stub",
+            "NAVER_CLIENT_SECRET": "stub",
+            "KAKAO_CLIENT_ID": "stub",
+            "GOOGLE_CLIENT_ID": "stub",
+            "GOOGLE_CLIENT_SECRET": "stub",
+        }
+        for provider in ("naver", "kakao", "google"):
+            self.settings[f"{provider.upper()}_TOKEN_URL"] = f"{base_url}/{provider}/token"
+            self.settings[f"{provider.upper()}_USER_INFO_URL"] = f"{base_url}/{provider}/userinfo"
+
+    @property
+    def connection_count(self):
+        return self.server.connection_count
+
+    @property
+    def request_count(self):
+        return self.server.request_count
+
+    def fail_next(self, count):
+        # 다음 count 개 요청에 503 응답 (재시도 확인용)
+        self.server.fail_remaining = count
+
+
+@contextmanager
+def stub_oauth_provider(latency_ms=0):
+    """
+    stub 서버를 별도 스레드에서 실행합니다.
+    with stub_oauth_provider() as provider, override_settings(**provider.settings): ...
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOAuthHandler)
+    server.daemon_threads = True
+    server.latency = latency_ms / 1000
+    server.lock = threading.Lock()
+    server.connection_count = 0
+    server.request_count = 0
+    server.fail_remaining = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield StubOAuthProvider(server)
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -3,15 +3,10 @@ from datetime import datetime, timezone
 
 from django.contrib.sites import requests
 from rest_framework import serializers
-from rest_framework_simplejwt.token_blacklist.models import (
-    BlacklistedToken,
-    OutstandingToken,
-)
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from common.exceptions import BadRequestException
-from common.logging_config import logger
 from users.models import User
+from users.tokens import RevocableRefreshToken, revoke_all_refresh_tokens
 
 
 class AccessTokenSerializer(serializers.Serializer):
@@ -27,7 +22,7 @@ class AccessTokenSerializer(serializers.Serializer):
             raise BadRequestException("유효하지 않은 사용자입니다.", code="INVALID_USER")
 
         # 새 Access Token 생성
-        refresh = RefreshToken.for_user(user)
+        refresh = RevocableRefreshToken.for_user(user)
         return str(refresh.access_token)
 
 
@@ -50,7 +45,7 @@ class RefreshTokenSerializer(serializers.Serializer):
             raise BadRequestException("리프레시 토큰의 길이가 너무 깁니다.", code="REFRESH_TOKEN_TOO_LONG")
 
         try:
-            token = RefreshToken(value)
+            token = RevocableRefreshToken(value)
         except Exception as e:
             raise BadRequestException("유효하지 않은 리프레시 토큰입니다.", code="INVALID_REFRESH_TOKEN") from e
 
@@ -65,30 +60,18 @@ class RefreshTokenSerializer(serializers.Serializer):
         """
         기존 리프레시 토큰을 제거하고 새로운 리프레시 토큰 생성.
         """
-        self._blacklist_existing_refresh_tokens(user)
-        refresh = RefreshToken.for_user(user)
+        revoke_all_refresh_tokens(user.id)
+        refresh = RevocableRefreshToken.for_user(user)
         return str(refresh)
 
-    def _blacklist_existing_refresh_tokens(self, user):
-        """
-        사용자의 기존 리프레시 토큰을 블랙리스트에 추가.
-        """
-        outstanding_tokens = OutstandingToken.objects.filter(user=user)
-        for token in outstanding_tokens:
-            try:
-                BlacklistedToken.objects.get_or_create(token=token)
-            except Exception as e:
-                logger.error(f"리프레시 토큰 블랙리스트 처리 중 오류 발생: {str(e)}")
-        outstanding_tokens.delete()
-
 
 class SocialLoginSerializer(serializers.Serializer):
     """소셜 로그인 공통 시리얼라이저"""
 
     name = serializers.CharField(max_length=255, required=False, allow_blank=True)
     email = serializers.EmailField(required=True)
-    profile_image = serializers.URLField(required=False, allow_blank=True)
-    phone_number = serializers.CharField(max_length=20, required=False, allow_blank=True)
+    profile_image = serializers.URLField(required=False, allow_blank=True, allow_null=True)
+    phone_number = serializers.CharField(max_length=20, required=False, allow_blank=True, allow_null=True)
 
     def validate_email(self, value):
         if not value:
@@ -128,23 +111,13 @@ class SocialLoginSerializer(serializers.Serializer):
         profile_image = self._clean_profile_image(validated_data.get("profile_image", ""))
         phone_number = validated_data.get("phone_number", "")
 
-        # 이메일을 기준으로 사용자 검색
-        user = User.objects.filter(email=email).first()
-
-        if user:
-            # 기존 사용자 업데이트
-            user.name = name or user.name
-            user.profile_image = profile_image or user.profile_image
-            user.phone_number = phone_number or user.phone_number
-            user.is_active = True  # 활성화 상태 설정
-        else:
-            # 새로운 사용자 생성
-            user = User(email=email, name=name, profile_image=profile_image, phone_number=phone_number)
+        # 이메일 기준 upsert - 기존 사용자는 빈 값이 아닌 항목만 갱신하고 활성화 (쿼리 1회)
+        user = User.objects.upsert_social_user(
+            email=email, name=name, profile_image=profile_image, phone_number=phone_number
+        )
 
-        user.save()
-
-        # 기존 리프레시 토큰 블랙리스트 처리
-        self._blacklist_existing_refresh_tokens(user)
+        # 기존 리프레시 토큰 모두 폐기 (토큰 세대 번호 증가)
+        revoke_all_refresh_tokens(user.id)
 
         return user
 
@@ -157,15 +130,3 @@ class SocialLoginSerializer(serializers.Serializer):
             clean_url = profile_image_url[len("/media/") :]
             return requests.utils.unquote(clean_url)
         return profile_image_url
-
-    def _blacklist_existing_refresh_tokens(self, user):
-        """
-        유저의 기존 리프레시 토큰을 블랙리스트 처리.
-        """
-        outstanding_tokens = OutstandingToken.objects.filter(user=user)
-        for token in outstanding_tokens:
-            try:
-                BlacklistedToken.objects.get_or_create(token=token)
-            except Exception as e:
-                logger.error(f"토큰 블랙리스트 처리 중 오류 발생: {str(e)}")
-        outstanding_tokens.delete()
@@ -2,15 +2,31 @@ import urllib.parse
 
 from rest_framework import serializers
 
+from common.images import ImageVariantsField
+from common.uploads import UploadedImageField
 from users.models import User
 
 
 class UserSerializer(serializers.ModelSerializer):
     profile_image = serializers.SerializerMethodField()
+    profile_image_variants = ImageVariantsField(image_field="profile_image")
+    # 직접 업로드(presigned URL)한 프로필 이미지의 upload_id
+    profile_image_upload_id = UploadedImageField(kind="profile_image", source="profile_image", required=False)
 
     class Meta:
         model = User
-        fields = ["id", "email", "name", "gender", "phone_number", "profile_image", "prefer_service", "prefer_location"]
+        fields = [
+            "id",
+            "email",
+            "name",
+            "gender",
+            "phone_number",
+            "profile_image",
+            "profile_image_variants",
+            "profile_image_upload_id",
+            "prefer_service",
+            "prefer_location",
+        ]
         read_only_fields = ("id", "email")
 
     def get_profile_image(self, obj):
@@ -34,10 +50,11 @@ class UserSerializer(serializers.ModelSerializer):
 
 class UserInfoSerializer(serializers.ModelSerializer):
     profile_image = serializers.SerializerMethodField()
+    profile_image_variants = ImageVariantsField(image_field="profile_image")
 
     class Meta:
         model = User
-        fields = ["id", "email", "name", "profile_image", "is_expert"]
+        fields = ["id", "email", "name", "profile_image", "profile_image_variants", "is_expert"]
         read_only_fields = ("id", "email")
 
     def get_profile_image(self, obj):
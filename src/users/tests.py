@@ -1,6 +1,23 @@
-from django.test import TestCase
+from unittest.mock import patch
 
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from common.exceptions import InternalServerException
 from users.models import User
+from users.oauth_client import OAuthProviderClient
+from users.oauth_stub import stub_oauth_provider
+from users.tokens import (
+    RevocableRefreshToken,
+    revocation_cache,
+    revoke_all_refresh_tokens,
+)
 
 
 class UserModelTest(TestCase):
@@ -53,3 +70,171 @@ class UserModelTest(TestCase):
         self.user.prefer_location = ["seoul", "gyeonggi_suwon"]  # 선호 지역 설정
         self.user.save()
         self.assertEqual(self.user.prefer_location, ["seoul", "gyeonggi_suwon"])  # 설정된 값이 올바른지 확인
+
+
+class RevocableRefreshTokenTest(TestCase):
+    def setUp(self):
+        # Given: 유저와 리프레시 토큰
+        cache.clear()
+        revocation_cache().clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", name="Test User", gender="M", phone_number="01012345678"
+        )
+        self.refresh = str(RevocableRefreshToken.for_user(self.user))
+
+    def test_issue_without_outstanding_token_rows(self):
+        # Then: 토큰 발급 시 DB 에 기록하지 않음
+        self.assertFalse(OutstandingToken.objects.exists())
+
+    def test_revoke_all_tokens_of_user(self):
+        # When: 유저의 모든 토큰 폐기 후 새 토큰 발급
+        revoke_all_refresh_tokens(self.user.id)
+        new_refresh = str(RevocableRefreshToken.for_user(self.user))
+
+        # Then: 이전 토큰은 거부, 새 토큰은 유효
+        with self.assertRaises(TokenError):
+            RevocableRefreshToken(self.refresh)
+        RevocableRefreshToken(new_refresh)
+
+    def test_token_rejected_when_revocation_state_unavailable(self):
+        # Given: 폐기 상태 캐시 장애
+        with patch.object(type(revocation_cache()), "get_many", side_effect=ConnectionError("redis down")):
+            # When / Then: 폐기 여부를 확인할 수 없으면 유효한 토큰도 거부
+            with self.assertRaises(TokenError):
+                RevocableRefreshToken(self.refresh)
+
+    def test_logout_revokes_token(self):
+        # When: 로그아웃
+        self.client.cookies["refresh_token"] = self.refresh
+        response = self.client.post(reverse("users:logout"))
+
+        # Then: 같은 리프레시 토큰으로 Access Token 갱신 불가
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client.cookies["refresh_token"] = self.refresh
+        response = self.client.post(reverse("users:refresh_token"))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_refresh_access_token(self):
+        # When: 유효한 리프레시 토큰으로 갱신
+        self.client.cookies["refresh_token"] = self.refresh
+        response = self.client.post(reverse("users:refresh_token"))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn("access_token", response.data)
+
+
+class SocialUserUpsertTest(TestCase):
+    def setUp(self):
+        # post_save 로 전송된 (created, update_fields) 기록
+        self.signals = []
+
+        def record(sender, created, update_fields, **kwargs):
+            self.signals.append((created, update_fields))
+
+        post_save.connect(record, sender=User, weak=False, dispatch_uid="upsert_social_user_test")
+        self.addCleanup(post_save.disconnect, sender=User, dispatch_uid="upsert_social_user_test")
+
+    def test_upsert_creates_user(self):
+        # When: 처음 로그인한 이메일
+        with self.assertNumQueries(1):
+            user = User.objects.upsert_social_user(email="new@example.com", name="새 유저")
+
+        # Then: 한 번의 쿼리로 유저 생성, 생성으로 post_save 전송
+        self.assertEqual(User.objects.get(email="new@example.com").id, user.id)
+        self.assertTrue(user.is_active)
+        self.assertFalse(user.has_usable_password())
+        self.assertEqual(self.signals, [(True, None)])
+
+    def test_upsert_updates_only_given_fields(self):
+        # Given: 비활성화된 기존 유저
+        existing = User.objects.create_user(
+            email="old@example.com", name="기존", gender="M", phone_number="01012345678", is_active=False
+        )
+        self.signals.clear()
+
+        # When: 이름만 제공된 로그인
+        user = User.objects.upsert_social_user(email="old@example.com", name="변경", phone_number="")
+
+        # Then: 같은 유저가 재활성화되고 빈 값은 기존 값을 유지
+        self.assertEqual(user.id, existing.id)
+        self.assertEqual(user.name, "변경")
+        self.assertEqual(user.phone_number, "01012345678")
+        self.assertEqual(user.gender, "M")
+        self.assertTrue(user.is_active)
+        self.assertEqual(User.objects.count(), 1)
+
+        # Then: 실제로 바뀐 항목만 update_fields 로 전송
+        self.assertEqual(self.signals, [(False, frozenset(["name", "is_active"]))])
+
+    def test_upsert_without_changes_sends_no_signal(self):
+        # Given: 기존 유저
+        User.objects.create_user(email="same@example.com", name="같음", gender="M", phone_number="01012345678")
+        self.signals.clear()
+
+        # When: 같은 정보로 다시 로그인
+        with self.assertNumQueries(1):
+            User.objects.upsert_social_user(email="same@example.com", name="같음", phone_number="01012345678")
+
+        # Then: 바뀐 항목이 없으므로 post_save 를 전송하지 않음 (쿼리 1회)
+        self.assertEqual(self.signals, [])
+
+
+class OAuthProviderClientTest(TestCase):
+    def setUp(self):
+        # Given: 로컬 stub provider
+        self.stub = stub_oauth_provider()
+        self.provider = self.stub.__enter__()
+        self.settings_override = override_settings(**self.provider.settings, OAUTH_HTTP_RETRIES=2)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.stub.__exit__(None, None, None)
+
+    def test_social_login_reuses_connection(self):
+        # When: 같은 provider 로 두 번 로그인
+        for _ in range(2):
+            response = APIClient().post(
+                reverse("users:social_login", kwargs={"provider": "kakao"}), {"code": "kakao-user"}, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Then: 요청 4번(토큰 + 유저 정보 x 2)에 연결은 하나만 사용, 유저는 한 명
+        self.assertEqual(self.provider.request_count, 4)
+        self.assertEqual(self.provider.connection_count, 1)
+        self.assertEqual(User.objects.filter(email="kakao-user@example.com").count(), 1)
+
+    def test_user_info_retried_on_temporary_error(self):
+        client = OAuthProviderClient(connect_timeout=1, read_timeout=1, retries=2, pool_size=1, backoff_factor=0)
+
+        # When: 유저 정보 조회가 한 번 503 으로 실패
+        self.provider.fail_next(1)
+        user_info = client.fetch_user_info("google", "google-user")
+
+        # Then: 재시도하여 성공
+        self.assertEqual(user_info["email"], "google-user@example.com")
+        self.assertEqual(self.provider.request_count, 2)
+
+    def test_token_exchange_not_retried(self):
+        client = OAuthProviderClient(connect_timeout=1, read_timeout=1, retries=2, pool_size=1, backoff_factor=0)
+
+        # When: 토큰 교환(POST)이 503 으로 실패
+        self.provider.fail_next(1)
+
+        # Then: 일회용 인가 코드이므로 재시도하지 않고 실패
+        with self.assertRaises(InternalServerException):
+            client.fetch_access_token("naver", "naver-user")
+        self.assertEqual(self.provider.request_count, 1)
+
+
+class OAuthProviderTimeoutTest(TestCase):
+    def test_slow_provider_bounded_by_read_timeout(self):
+        # Given: 응답이 0.5초 걸리는 provider, read timeout 0.1초, 재시도 1회
+        with stub_oauth_provider(latency_ms=500) as provider, override_settings(**provider.settings):
+            client = OAuthProviderClient(connect_timeout=1, read_timeout=0.1, retries=1, pool_size=1, backoff_factor=0)
+
+            # When / Then: 무한정 기다리지 않고 실패
+            with self.assertRaises(InternalServerException):
+                client.fetch_user_info("google", "slow-user")
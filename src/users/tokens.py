@@ -0,0 +1,105 @@
+# users/tokens.py
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+
+from common.logging_config import logger
+
+# 유저 별 토큰 세대 - 발급 시 토큰에 기록하고, 현재 세대보다 낮은 토큰은 폐기된 것으로 처리
+GENERATION_CLAIM = "gen"
+
+
+def refresh_generation_key(user_id):
+    return f"auth:refresh:generation:{user_id}"
+
+
+def revoked_refresh_key(jti):
+    return f"auth:refresh:revoked:{jti}"
+
+
+def revocation_cache():
+    """
+    폐기 상태 전용 캐시 (AUTH_REVOCATION_CACHE_ALIAS)
+    응답 캐시와 달리 예외를 무시하지 않으므로 Redis 장애 시 조회/기록이 예외로 실패합니다.
+    """
+    alias = getattr(settings, "AUTH_REVOCATION_CACHE_ALIAS", "auth")
+    return caches[alias if alias in settings.CACHES else "default"]
+
+
+def refresh_token_lifetime():
+    return int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+
+
+def get_refresh_generation(user_id):
+    return revocation_cache().get(refresh_generation_key(user_id), 0)
+
+
+def revoke_all_refresh_tokens(user_id):
+    """
+    유저의 모든 리프레시 토큰을 폐기합니다 (세대 번호 증가, O(1)).
+    세대 키는 리프레시 토큰 유효기간 뒤에 만료되며, 그 시점에는 이전 세대 토큰도 모두 만료된 상태입니다.
+    """
+    cache = revocation_cache()
+    key = refresh_generation_key(user_id)
+    if not cache.add(key, 1, timeout=refresh_token_lifetime()):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=refresh_token_lifetime())
+        cache.touch(key, refresh_token_lifetime())
+
+
+def revoke_refresh_jti(jti, exp):
+    # 토큰 만료 시각까지만 보관 (만료된 토큰은 서명 검증에서 거부되므로 기록이 필요 없음)
+    timeout = int(exp - time.time())
+    if timeout > 0:
+        revocation_cache().set(revoked_refresh_key(jti), True, timeout=timeout)
+
+
+class RevocableRefreshToken(RefreshToken):
+    """
+    OutstandingToken / BlacklistedToken 테이블 대신 캐시(Redis)로 폐기 여부를 확인하는 리프레시 토큰
+    - 발급: DB 기록 없이 현재 세대 번호만 토큰에 기록
+    - 검증: 세대 번호 + jti 폐기 여부를 get_many 한 번으로 확인
+    - 폐기 기록은 TTL 로 자동 삭제됩니다.
+    - 폐기 상태 캐시 장애 시 검증은 실패합니다.
+    """
+
+    no_copy_claims = (*RefreshToken.no_copy_claims, GENERATION_CLAIM)
+
+    @classmethod
+    def for_user(cls, user):
+        # BlacklistMixin.for_user 는 OutstandingToken 을 생성하므로 건너뛰고 Token.for_user 를 사용
+        token = super(BlacklistMixin, cls).for_user(user)
+        token[GENERATION_CLAIM] = get_refresh_generation(user.id)
+        return token
+
+    def verify(self, *args, **kwargs):
+        super(BlacklistMixin, self).verify(*args, **kwargs)
+        self.check_blacklist()
+
+    def check_blacklist(self):
+        user_id = self.get(api_settings.USER_ID_CLAIM)
+        generation_key = refresh_generation_key(user_id)
+        jti_key = revoked_refresh_key(self[api_settings.JTI_CLAIM])
+        try:
+            values = revocation_cache().get_many([generation_key, jti_key])
+        except Exception as e:
+            # 폐기 여부를 확인할 수 없으면 거부 (fail closed)
+            logger.error(f"리프레시 토큰 폐기 상태 조회 실패: {str(e)}")
+            raise TokenError(_("Token is blacklisted"))
+
+        # 세대 클레임이 없는 토큰(이전 방식으로 발급)은 0 세대로 처리
+        if values.get(jti_key) or self.get(GENERATION_CLAIM, 0) < values.get(generation_key, 0):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        revoke_refresh_jti(self[api_settings.JTI_CLAIM], self["exp"])
+
+    def outstand(self):
+        return None
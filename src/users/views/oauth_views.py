@@ -1,28 +1,24 @@
-import requests
-from django.conf import settings
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.token_blacklist.models import (
-    BlacklistedToken,
-    OutstandingToken,
-)
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from common.exceptions import (
     BadRequestException,
+    CustomAPIException,
     InternalServerException,
     UnauthorizedException,
 )
 from common.logging_config import logger
-from users.models import User
+from users.auth_cache import get_auth_user
+from users.oauth_client import get_oauth_client
 from users.serializers.oauth_serializers import (
     RefreshTokenSerializer,
     SocialLoginSerializer,
 )
 from users.serializers.user_serializers import UserInfoSerializer
+from users.tokens import RevocableRefreshToken
 
 
 # 소셜로그인 공통부분
@@ -65,7 +61,7 @@ class SocialLoginAPIView(APIView):
             user = serializer.save()
 
             # JWT 토큰 생성
-            refresh = RefreshToken.for_user(user)
+            refresh = RevocableRefreshToken.for_user(user)
             access_token = str(refresh.access_token)
             refresh_token = str(refresh)
 
@@ -87,63 +83,12 @@ class SocialLoginAPIView(APIView):
             raise InternalServerException(f"{provider} 로그인 처리 중 오류가 발생했습니다.", code="social_login_failed")
 
     def _get_social_access_token(self, provider, code, state=None):
-        """소셜 제공자로부터 액세스 토큰 가져오기"""
-        payload = {"grant_type": "authorization_code", "code": code}
-        if provider == "naver":
-            payload.update(
-                {
-                    "client_id": settings.NAVER_CLIENT_ID,
-                    "client_secret": settings.NAVER_CLIENT_SECRET,
-                    "state": state,
-                }
-            )
-            token_url = settings.NAVER_TOKEN_URL
-        elif provider == "kakao":
-            payload.update(
-                {
-                    "client_id": settings.KAKAO_CLIENT_ID,
-                    "redirect_uri": settings.KAKAO_CALLBACK_URL,
-                }
-            )
-            token_url = settings.KAKAO_TOKEN_URL
-        elif provider == "google":
-            payload.update(
-                {
-                    "client_id": settings.GOOGLE_CLIENT_ID,
-                    "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                    "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-                }
-            )
-            token_url = settings.GOOGLE_TOKEN_URL
-        else:
-            raise BadRequestException("지원되지 않는 소셜 제공자입니다.", code="unsupported_provider")
-
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        response = requests.post(token_url, data=payload, headers=headers)
-        if response.status_code != 200:
-            raise InternalServerException(
-                f"{provider}에서 액세스 토큰을 가져오는 데 실패했습니다.", code="token_fetch_failed"
-            )
-        return response.json().get("access_token")
+        """소셜 제공자로부터 액세스 토큰 가져오기 (연결 풀 / timeout / 재시도는 OAuthProviderClient 에서 처리)"""
+        return get_oauth_client().fetch_access_token(provider, code, state)
 
     def _get_social_user_info(self, provider, access_token):
         """소셜 제공자로부터 사용자 정보 가져오기"""
-        headers = {"Authorization": f"Bearer {access_token}"}
-        if provider == "naver":
-            user_info_url = settings.NAVER_USER_INFO_URL
-        elif provider == "kakao":
-            user_info_url = settings.KAKAO_USER_INFO_URL
-        elif provider == "google":
-            user_info_url = settings.GOOGLE_USER_INFO_URL
-        else:
-            raise BadRequestException("지원되지 않는 소셜 제공자입니다.", code="unsupported_provider")
-
-        response = requests.get(user_info_url, headers=headers)
-        if response.status_code != 200:
-            raise InternalServerException(
-                f"{provider}에서 사용자 정보를 가져오는 데 실패했습니다.", code="user_info_fetch_failed"
-            )
-        return self._parse_user_info(provider, response.json())
+        return self._parse_user_info(provider, get_oauth_client().fetch_user_info(provider, access_token))
 
     def _parse_user_info(self, provider, data):
         """소셜 사용자 정보 파싱"""
@@ -195,7 +140,7 @@ class RefreshAccessTokenAPIView(APIView):
             serializer = RefreshTokenSerializer(data={"refresh_token": refresh_token})
             serializer.is_valid(raise_exception=True)
 
-            refresh = RefreshToken(refresh_token)
+            refresh = RevocableRefreshToken(refresh_token)
             user_id = refresh.get("user_id")
 
             if not user_id:
@@ -203,10 +148,8 @@ class RefreshAccessTokenAPIView(APIView):
                     "리프레시 토큰에서 사용자 정보를 찾을 수 없습니다.", code="INVALID_REFRESH_TOKEN"
                 )
 
-            # Step 3: 사용자 확인
-            try:
-                user = User.objects.get(id=user_id)
-            except User.DoesNotExist:
+            # Step 3: 사용자 확인 (인증 유저 캐시 사용)
+            if get_auth_user(user_id) is None:
                 logger.error(f"Access Token 갱신 중 오류 발생: User ID {user_id}에 해당하는 사용자가 없습니다.")
                 raise UnauthorizedException(
                     "유효하지 않은 리프레시 토큰입니다. 사용자 정보를 찾을 수 없습니다.", code="USER_NOT_FOUND"
@@ -228,6 +171,9 @@ class RefreshAccessTokenAPIView(APIView):
         except TokenError:
             logger.error("리프레시 토큰이 유효하지 않음.")
             raise UnauthorizedException("유효하지 않은 리프레시 토큰입니다.", code="INVALID_REFRESH_TOKEN")
+        except CustomAPIException:
+            # 검증 실패(폐기/만료된 토큰 등)는 500 으로 바꾸지 않고 그대로 응답
+            raise
         except Exception as e:
             logger.error(f"Access Token 갱신 중 오류 발생: {str(e)}")
             raise InternalServerException("Access Token 갱신 실패", code="ACCESS_TOKEN_REFRESH_FAILED")
@@ -251,15 +197,10 @@ class LogoutView(APIView):
 
         try:
             # Step 2: 리프레시 토큰 객체 생성
-            token = RefreshToken(refresh_token)
+            token = RevocableRefreshToken(refresh_token)
 
-            # Step 3: OutstandingToken에서 삭제 및 BlacklistedToken으로 이동
-            outstanding_token = OutstandingToken.objects.filter(jti=token["jti"]).first()
-            if outstanding_token:
-                BlacklistedToken.objects.get_or_create(token=outstanding_token)
-                outstanding_token.delete()
-            else:
-                logger.warning("해당 리프레시 토큰을 OutstandingToken에서 찾을 수 없습니다.")
+            # Step 3: 토큰 폐기 (만료 시각까지 캐시에 기록)
+            token.blacklist()
 
         except TokenError as e:
             logger.error(f"리프레시 토큰 블랙리스트 처리 중 오류 발생: {str(e)}")